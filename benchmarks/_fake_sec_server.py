@@ -0,0 +1,70 @@
+"""Local stand-in for the SEC hosts used by the benchmarks in this folder."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Tuple
+
+CHUNK = b"x" * (1 << 16)
+
+
+def make_handler(body_size: int, handshake_ms: float) -> type:
+    class FakeSecHandler(BaseHTTPRequestHandler):
+        # HTTP/1.1 is required for keep-alive connections
+        protocol_version = "HTTP/1.1"
+        # Avoid Nagle/delayed-ACK stalls between the header and body writes
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            # Simulate the extra round trips of a TLS handshake, which are paid
+            # once per new connection and not per request.
+            time.sleep(handshake_ms / 1000)
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(body_size))
+            self.end_headers()
+            remaining = body_size
+            while remaining > 0:
+                chunk = CHUNK[:remaining]
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+        def log_message(self, *_: object) -> None:
+            pass
+
+    return FakeSecHandler
+
+
+class FakeSecServer:
+    def __init__(self, body_size: int = 1024, handshake_ms: float = 0.0) -> None:
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), make_handler(body_size, handshake_ms)
+        )
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server.server_address[:2]
+
+    def url(self, path: str = "/") -> str:
+        host, port = self.address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self) -> "FakeSecServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def percentiles(samples_ms: List[float]) -> Iterator[Tuple[str, float]]:
+    ordered = sorted(samples_ms)
+    for label, q in (("p50", 0.5), ("p95", 0.95), ("max", 1.0)):
+        idx = min(len(ordered) - 1, int(q * len(ordered)))
+        yield label, ordered[idx]
@@ -0,0 +1,70 @@
+"""Compare per-request latency with and without pooled keep-alive sessions.
+
+Runs against a local fake server that sleeps once per new connection to stand
+in for the TCP and TLS handshake with www.sec.gov. The SEC rate limiter is
+bypassed so that only transport latency is measured.
+
+Usage::
+
+    $ python benchmarks/bench_connection_pooling.py --requests 200 --handshake-ms 30
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+import requests
+from _fake_sec_server import FakeSecServer, percentiles
+
+from sec_edgar_downloader._constants import HOST_WWW_SEC
+from sec_edgar_downloader._sec_gateway import SecGateway, _send_sec
+
+# Undecorated _send_sec so that neither the rate limiter nor the adaptive rate
+# control skews the timings
+send_sec = _send_sec.__wrapped__
+
+
+def time_requests(fetch: Callable[[], object], num_requests: int) -> List[float]:
+    samples = []
+    for _ in range(num_requests):
+        start = time.perf_counter()
+        fetch()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    stats = ", ".join(f"{name}={value:.2f}ms" for name, value in percentiles(samples))
+    print(f"{label:<28} mean={statistics.mean(samples):.2f}ms, {stats}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    parser.add_argument("--body-size", type=int, default=16 * 1024)
+    args = parser.parse_args()
+
+    with FakeSecServer(args.body_size, args.handshake_ms) as server:
+        uri = server.url("/Archives/edgar/data/320193/filing.txt")
+
+        def new_connection_per_request() -> None:
+            # Equivalent of the previous bare requests.get call
+            with requests.Session() as session:
+                send_sec(session, uri)
+
+        with SecGateway("Benchmark benchmark@example.com") as gateway:
+            session = gateway.session(HOST_WWW_SEC)
+
+            unpooled = time_requests(new_connection_per_request, args.requests)
+            pooled = time_requests(lambda: send_sec(session, uri), args.requests)
+
+    report("new connection per request", unpooled)
+    report("pooled keep-alive session", pooled)
+    speedup = statistics.mean(unpooled) / statistics.mean(pooled)
+    print(f"mean per-request latency reduced {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
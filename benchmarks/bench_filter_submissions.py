@@ -0,0 +1,126 @@
+"""Compare row-wise and columnar filtering of a submissions page.
+
+Builds a synthetic submissions payload with ``--rows`` filings and filters it
+with the previous row-wise implementation, which parsed every filing date with
+``strptime``, and with ``filter_filings_page``, which scans the form and date
+columns with set lookups and ISO string comparisons. Both must select the same
+filings. The script exits with a non-zero status if the columnar filter is not
+faster.
+
+Usage::
+
+    $ python benchmarks/bench_filter_submissions.py --rows 100000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date
+from datetime import datetime as dt
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from sec_edgar_downloader._constants import AMENDS_SUFFIX, DATE_FORMAT_TOKENS
+from sec_edgar_downloader._orchestrator import filter_filings_page, get_to_download
+from sec_edgar_downloader._types import DownloadMetadata, ToDownload
+
+FORMS = ["4", "4/A", "8-K", "10-Q", "10-K", "10-K/A", "SC 13G", "DEF 14A"]
+
+
+def synthetic_submissions(num_rows: int) -> Dict[str, List[str]]:
+    rng = random.Random(0)
+    start = date(2024, 12, 31)
+    # Filings are listed newest first, a few per day
+    filing_dates = [
+        (start - timedelta(days=i // 4)).isoformat() for i in range(num_rows)
+    ]
+    return {
+        "accessionNumber": [f"0000320193-00-{i:06}" for i in range(num_rows)],
+        "form": [rng.choice(FORMS) for _ in range(num_rows)],
+        "primaryDocument": [f"doc{i}.htm" for i in range(num_rows)],
+        "filingDate": filing_dates,
+    }
+
+
+def filter_row_wise(
+    download_metadata: DownloadMetadata, filings_json: Dict[str, Any], limit: int
+) -> List[ToDownload]:
+    filings_to_download: List[ToDownload] = []
+    for acc_num, form, doc, f_date in zip(  # noqa: B905
+        filings_json["accessionNumber"],
+        filings_json["form"],
+        filings_json["primaryDocument"],
+        filings_json["filingDate"],
+    ):
+        is_amend = form.endswith(AMENDS_SUFFIX)
+        form = form[:-2] if is_amend else form
+        target_date = dt.strptime(f_date, DATE_FORMAT_TOKENS).date()
+        if (
+            form != download_metadata.form
+            or (not download_metadata.include_amends and is_amend)
+            or not download_metadata.after <= target_date <= download_metadata.before
+        ):
+            continue
+
+        filings_to_download.append(
+            get_to_download(download_metadata.cik, acc_num, doc, form)
+        )
+        if len(filings_to_download) == limit:
+            break
+
+    return filings_to_download
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    filings_json = synthetic_submissions(args.rows)
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form="4",
+        cik="0000320193",
+        after=date(2010, 1, 1),
+        before=date(2020, 12, 31),
+        include_amends=True,
+    )
+    limit = sys.maxsize
+
+    expected = filter_row_wise(download_metadata, filings_json, limit)
+    assert filter_filings_page(download_metadata, filings_json, {}) == expected
+
+    row_wise = best_time(
+        lambda: filter_row_wise(download_metadata, filings_json, limit), args.repeat
+    )
+    columnar = best_time(
+        lambda: filter_filings_page(download_metadata, filings_json, {}),
+        args.repeat,
+    )
+
+    print(f"rows:               {args.rows}")
+    print(f"matching filings:   {len(expected)}")
+    print(f"row-wise filter:    {row_wise * 1000:.1f}ms")
+    print(f"columnar filter:    {columnar * 1000:.1f}ms")
+    print(f"speedup:            {row_wise / columnar:.1f}x")
+
+    if columnar >= row_wise:
+        print("FAIL: columnar filter is not faster than the row-wise filter")
+        sys.exit(1)
+    print("OK: columnar filter is faster than the row-wise filter")
+
+
+if __name__ == "__main__":
+    main()
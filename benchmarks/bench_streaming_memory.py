@@ -0,0 +1,84 @@
+"""Compare peak memory of buffered and streamed filing downloads.
+
+Serves one large filing from a local fake server and downloads it twice: once by
+buffering the whole body in memory, as ``download_filing`` does, and once by
+streaming it to disk in ``--buffer-size`` chunks with ``save_document``. Peak
+memory is measured with ``tracemalloc``. The script exits with a non-zero status
+if the streamed download's peak exceeds a small multiple of the buffer size.
+
+Usage::
+
+    $ python benchmarks/bench_streaming_memory.py --body-mb 200 --buffer-kb 1024
+"""
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from _fake_sec_server import FakeSecServer
+
+from sec_edgar_downloader._constants import HOST_WWW_SEC
+from sec_edgar_downloader._orchestrator import save_document
+from sec_edgar_downloader._sec_gateway import SecGateway
+
+# Chunks, decompression buffers and the socket read buffer can each hold up to
+# about one buffer's worth of data at the same time.
+ALLOWED_BUFFERS = 4
+
+
+def peak_memory(download: Callable[[], None]) -> int:
+    tracemalloc.start()
+    try:
+        download()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--body-mb", type=int, default=200)
+    parser.add_argument("--buffer-kb", type=int, default=1024)
+    args = parser.parse_args()
+
+    body_size = args.body_mb * 1024 * 1024
+    buffer_size = args.buffer_kb * 1024
+
+    with FakeSecServer(body_size) as server, tempfile.TemporaryDirectory() as tmp:
+        uri = server.url("/Archives/edgar/data/320193/full-submission.txt")
+        save_path = Path(tmp) / "full-submission.txt"
+
+        with SecGateway(
+            "Benchmark benchmark@example.com", buffer_size=buffer_size
+        ) as gw:
+
+            def buffered() -> None:
+                contents = gw.session(HOST_WWW_SEC).get(uri).content
+                save_path.write_bytes(contents)
+
+            def streamed() -> None:
+                save_document(gw.stream_filing(uri), save_path)
+
+            buffered_peak = peak_memory(buffered)
+            streamed_peak = peak_memory(streamed)
+
+        assert save_path.stat().st_size == body_size
+
+    mib = 1024 * 1024
+    print(f"filing size:        {body_size / mib:.1f} MiB")
+    print(f"buffered peak:      {buffered_peak / mib:.1f} MiB")
+    print(f"streamed peak:      {streamed_peak / mib:.1f} MiB")
+    print(f"buffer size:        {buffer_size / mib:.2f} MiB")
+
+    bound = ALLOWED_BUFFERS * buffer_size
+    if streamed_peak > bound:
+        print(f"FAIL: streamed peak exceeds {ALLOWED_BUFFERS}x the buffer size")
+        sys.exit(1)
+    print(f"OK: streamed peak is within {ALLOWED_BUFFERS}x the buffer size")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+from typing import Any, ClassVar, Dict, List, Optional, Set
+
+from ._async_orchestrator import (
+    fetch_and_save_filings_async,
+    get_ticker_to_cik_mapping_async,
+)
+from ._constants import DEFAULT_BUFFER_SIZE, DEFAULT_POOL_SIZE
+from ._constants import SUPPORTED_FORMS as _SUPPORTED_FORMS
+from ._sec_gateway import AsyncSecGateway
+from ._types import Date, DownloadMetadata, DownloadPath
+from ._utils import (
+    is_cik,
+    resolve_download_folder,
+    validate_and_convert_ticker_or_cik,
+    validate_and_parse_date_range,
+    validate_and_parse_limit,
+    validate_form,
+)
+
+
+class AsyncDownloader:
+    """An asyncio :class:`AsyncDownloader` object.
+
+    Downloads filings like :meth:`Downloader.get
+    <sec_edgar_downloader.Downloader.get>`, for a single form and with a subset of
+    its arguments, but paginates submissions and downloads filings as concurrent
+    coroutines over a single pooled HTTP client.
+    All requests share the SEC rate limit of 10 requests per second, so throughput
+    is bound by the rate limit rather than by request latency.
+    Requires the ``async`` extra: ``pip install sec-edgar-downloader[async]``.
+
+    :param company_name: company name to comply with SEC Edgar's programmatic downloading
+        fair access policy.
+    :param email_address: email address to comply with SEC Edgar's programmatic
+        downloading fair access policy.
+    :param download_folder: relative or absolute path to download location.
+        Defaults to the current working directory.
+    :param pool_size: maximum number of concurrent connections to each SEC host.
+        Defaults to 10.
+    :param buffer_size: size in bytes of the chunks in which filings are streamed
+        to disk, which bounds the memory used per filing. Filings are written to a
+        temporary file and renamed into place once complete. Defaults to 1 MiB.
+
+    Usage::
+
+        >>> import asyncio
+        >>> from sec_edgar_downloader import AsyncDownloader
+
+        >>> async def main():
+        ...     async with AsyncDownloader("MyCompanyName", "my.email@domain.com") as dl:
+        ...         await dl.get("8-K", "AAPL")
+
+        >>> asyncio.run(main())
+    """
+
+    supported_forms: ClassVar[List[str]] = sorted(_SUPPORTED_FORMS)
+
+    def __init__(
+        self,
+        company_name: str,
+        email_address: str,
+        download_folder: Optional[DownloadPath] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Constructor for the :class:`AsyncDownloader` class."""
+        self.user_agent = f"{company_name} {email_address}"
+        self.download_folder = resolve_download_folder(download_folder)
+        self.gateway = AsyncSecGateway(self.user_agent, pool_size, buffer_size)
+        # Fetched on first use, since constructors cannot await
+        self.ticker_to_cik_mapping: Optional[Dict[str, str]] = None
+
+    async def __aenter__(self) -> "AsyncDownloader":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.gateway.aclose()
+
+    async def get(
+        self,
+        form: str,
+        ticker_or_cik: str,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[Date] = None,
+        before: Optional[Date] = None,
+        include_amends: bool = False,
+        download_details: bool = False,
+        accession_numbers_to_skip: Optional[Set[str]] = None,
+    ) -> int:
+        """Download filings and save them to disk.
+
+        Takes the arguments of :meth:`Downloader.get
+        <sec_edgar_downloader.Downloader.get>` that are listed in its signature,
+        for a single form. Concurrency is bounded by ``pool_size`` rather than
+        ``max_workers``.
+
+        :return: number of filings downloaded.
+        """
+        if self.ticker_to_cik_mapping is None and not is_cik(
+            str(ticker_or_cik).strip()
+        ):
+            self.ticker_to_cik_mapping = await get_ticker_to_cik_mapping_async(
+                self.gateway
+            )
+
+        cik = validate_and_convert_ticker_or_cik(
+            ticker_or_cik, self.ticker_to_cik_mapping or {}
+        )
+        limit = validate_and_parse_limit(limit)
+        after_date, before_date = validate_and_parse_date_range(after, before)
+        validate_form(form)
+
+        return await fetch_and_save_filings_async(
+            DownloadMetadata(
+                self.download_folder,
+                form,
+                cik,
+                limit,
+                after_date,
+                before_date,
+                include_amends,
+                download_details,
+                # Save ticker if passed in to form file system path for saving filings
+                ticker=ticker_or_cik if not is_cik(ticker_or_cik) else None,
+                accession_numbers_to_skip=accession_numbers_to_skip,
+            ),
+            self.gateway,
+        )
@@ -1,12 +1,62 @@
-import sys
 from pathlib import Path
-from typing import ClassVar, List, Optional, Set
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set, Union
 
-from ._constants import DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE
+from ._catalog import list_filings, to_table
+from ._constants import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_ESTIMATE_BYTES_PER_SEC,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TICKER_CACHE_TTL,
+    JOB_JOURNAL_FILENAME,
+    MANIFEST_FILENAME,
+    ROOT_SAVE_FOLDER_NAME,
+    STORAGE_LAYOUT_FOLDERS,
+    SUBMISSIONS_STORE_FILENAME,
+)
 from ._constants import SUPPORTED_FORMS as _SUPPORTED_FORMS
-from ._orchestrator import fetch_and_save_filings, get_ticker_to_cik_mapping
-from ._types import Date, DownloadMetadata, DownloadPath
-from ._utils import is_cik, validate_and_convert_ticker_or_cik, validate_and_parse_date
+from ._constants import TABLE_FORMAT_DICT, TICKER_CACHE_FILENAME
+from ._edgar_index import crawl_and_save_filings, iter_index_filings
+from ._job_journal import JOB_KIND_CRAWL, JOB_KIND_GET, Job, JobJournal
+from ._manifest import Manifest
+from ._orchestrator import (
+    fetch_and_save_filings,
+    fetch_and_save_filings_many,
+    get_ticker_to_cik_mapping,
+    iter_filings,
+    save_filings,
+)
+from ._planner import estimate_download
+from ._sec_gateway import SecGateway
+from ._storage import StorageBackend
+from ._submissions_store import SubmissionsStore
+from ._ticker_cache import get_default_cache_folder
+from ._types import (
+    Date,
+    DownloadedDocument,
+    DownloadEstimate,
+    DownloadMetadata,
+    DownloadPath,
+    Forms,
+    ToDownload,
+)
+from ._utils import (
+    is_cik,
+    resolve_download_folder,
+    summarize_num_downloaded,
+    validate_and_convert_ticker_or_cik,
+    validate_and_parse_date_range,
+    validate_and_parse_forms,
+    validate_and_parse_limit,
+    validate_and_parse_max_workers,
+    validate_and_parse_report_date_range,
+    validate_and_parse_values,
+    validate_compression,
+    validate_document_selection,
+    validate_layout,
+    validate_max_size,
+    validate_size_order,
+    validate_table_format,
+)
 
 
 class Downloader:
@@ -22,6 +72,50 @@ class Downloader:
         More info: https://www.sec.gov/os/webmaster-faq#code-support.
     :param download_folder: relative or absolute path to download location.
         Defaults to the current working directory.
+    :param pool_size: maximum number of keep-alive connections kept open to each
+        SEC host. Connections are reused across all :meth:`get` calls.
+        Defaults to 10.
+    :param buffer_size: size in bytes of the chunks in which filings are streamed
+        to disk, which bounds the memory used per filing. Filings are written to a
+        temporary file and renamed into place once complete. Defaults to 1 MiB.
+    :param cache_folder: relative or absolute path to the folder in which the ticker
+        to CIK mapping is cached across runs. Defaults to
+        ``$XDG_CACHE_HOME/sec-edgar-downloader`` or ``~/.cache/sec-edgar-downloader``.
+    :param ticker_cache_ttl: number of seconds for which the cached ticker to CIK
+        mapping is used without contacting the SEC. Once expired, it is revalidated
+        with a conditional request that only downloads the mapping if it changed.
+        The mapping is only loaded when a ticker, rather than a CIK, is first passed
+        to :meth:`get`. Defaults to one day.
+    :param cache_submissions: denotes whether to keep the filing history of each
+        CIK in a local store under ``cache_folder``. Each :meth:`get` then only
+        revalidates the first submissions page with a conditional request, merges
+        any new filings into the store and answers from it. Historical pages are
+        only ever fetched once. Defaults to False.
+    :param refresh_submissions: denotes whether stored filing histories are
+        revalidated with the SEC before answering :meth:`get`. Set to False to
+        answer from the store alone, e.g. after :meth:`ingest_submissions_archive`.
+        CIKs that are missing from the store are always fetched. Defaults to True.
+    :param compression: compression in which full submissions are stored, either
+        ``"gzip"`` or ``"zstd"``, which adds a ``.gz`` or ``.zst`` suffix to
+        ``full-submission.txt``. Submissions are compressed while they are streamed
+        to disk, and gzip-encoded responses are stored without being decoded.
+        Use :func:`open_filing` to read them back. ``"zstd"`` requires the
+        ``zstd`` extra. Defaults to None, i.e. uncompressed.
+    :param layout: layout in which filings are saved. ``"folders"`` saves each
+        filing in its own ``<ticker or CIK>/<form>/<accession number>/`` folder.
+        ``"pack"`` appends all filings of a company and form to a single
+        ``<ticker or CIK>/<form>.pack`` file instead, which needs no inode per
+        filing. Packed documents are read with :func:`open_filing` by the path
+        they would have in the folder layout. Defaults to ``"folders"``.
+    :param storage: storage backend to which documents are saved instead of
+        ``download_folder``, e.g. :class:`MemoryStorage` or :class:`ObjectStorage`.
+        Documents are streamed straight to the backend under their path relative
+        to ``sec-edgar-filings``, and the sizes that the backend reports decide
+        which documents were already downloaded in full. They are not recorded in
+        the manifest, which only tracks the download folder. Only the
+        ``"folders"`` layout is supported. Defaults to None, i.e. a
+        :class:`LocalStorage`, or a :class:`PackStorage` in the ``"pack"``
+        layout, of the ``sec-edgar-filings`` folder.
 
     Usage::
 
@@ -44,22 +138,148 @@ class Downloader:
         company_name: str,
         email_address: str,
         download_folder: Optional[DownloadPath] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        cache_folder: Optional[DownloadPath] = None,
+        ticker_cache_ttl: float = DEFAULT_TICKER_CACHE_TTL,
+        cache_submissions: bool = False,
+        refresh_submissions: bool = True,
+        compression: Optional[str] = None,
+        layout: str = STORAGE_LAYOUT_FOLDERS,
+        storage: Optional[StorageBackend] = None,
     ) -> None:
         """Constructor for the :class:`Downloader` class."""
         self.user_agent = f"{company_name} {email_address}"
 
-        if download_folder is None:
-            self.download_folder = Path.cwd()
-        elif isinstance(download_folder, Path):
-            self.download_folder = download_folder
+        self.download_folder = resolve_download_folder(download_folder)
+
+        self.gateway = SecGateway(self.user_agent, pool_size, buffer_size)
+
+        if cache_folder is None:
+            self.cache_folder = get_default_cache_folder()
         else:
-            self.download_folder = Path(download_folder).expanduser().resolve()
+            self.cache_folder = resolve_download_folder(cache_folder)
+        self.ticker_cache_ttl = ticker_cache_ttl
+        self._ticker_to_cik_mapping: Optional[Dict[str, str]] = None
+        self.submissions_store = (
+            SubmissionsStore(self.cache_folder / SUBMISSIONS_STORE_FILENAME)
+            if cache_submissions
+            else None
+        )
+        self.refresh_submissions = refresh_submissions
+        validate_compression(compression)
+        self.compression = compression
+        validate_layout(layout)
+        self.layout = layout
+        if storage is not None and layout != STORAGE_LAYOUT_FOLDERS:
+            raise ValueError(
+                f"Invalid layout {layout!r} for a storage backend. "
+                f"Please use the {STORAGE_LAYOUT_FOLDERS!r} layout."
+            )
+        self.storage = storage
+        self.manifest = Manifest(
+            self.download_folder / ROOT_SAVE_FOLDER_NAME / MANIFEST_FILENAME
+        )
+        # Only documents saved to the download folder are tracked by the manifest
+        self._download_manifest = self.manifest if storage is None else None
+        self.job_journal = JobJournal(
+            self.download_folder / ROOT_SAVE_FOLDER_NAME / JOB_JOURNAL_FILENAME
+        )
+
+    @property
+    def ticker_to_cik_mapping(self) -> Dict[str, str]:
+        """Mapping of tickers to zero-padded CIKs, loaded on first access."""
+        if self._ticker_to_cik_mapping is None:
+            self._ticker_to_cik_mapping = get_ticker_to_cik_mapping(
+                self.gateway,
+                self.cache_folder / TICKER_CACHE_FILENAME,
+                self.ticker_cache_ttl,
+            )
+        return self._ticker_to_cik_mapping
+
+    def _validate_and_convert_ticker_or_cik(self, ticker_or_cik: str) -> str:
+        # CIKs do not need the ticker to CIK mapping, so avoid loading it
+        return validate_and_convert_ticker_or_cik(
+            ticker_or_cik,
+            {} if is_cik(str(ticker_or_cik).strip()) else self.ticker_to_cik_mapping,
+        )
+
+    def ingest_submissions_archive(self, archive_path: DownloadPath) -> int:
+        """Load a local copy of SEC's nightly bulk submissions archive.
 
-        self.ticker_to_cik_mapping = get_ticker_to_cik_mapping(self.user_agent)
+        The archive is available at
+        https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip.
+        Its entries are streamed into the submissions store one at a time, so
+        with ``refresh_submissions=False`` any company in the archive can then be
+        served by :meth:`get` without paginating the submissions API.
+
+        :param archive_path: relative or absolute path to ``submissions.zip``.
+        :return: number of companies ingested.
+
+        Usage::
+
+            >>> dl = Downloader(
+            ...     "MyCompanyName",
+            ...     "my.email@domain.com",
+            ...     cache_submissions=True,
+            ...     refresh_submissions=False,
+            ... )
+            >>> dl.ingest_submissions_archive("/path/to/submissions.zip")
+        """
+        if self.submissions_store is None:
+            raise ValueError(
+                "Submissions store is disabled. "
+                "Please set cache_submissions=True to ingest a submissions archive."
+            )
+
+        return self.submissions_store.ingest_archive(Path(archive_path).expanduser())
+
+    def is_downloaded(self, accession_number: str) -> bool:
+        """Return whether any document of a filing was downloaded.
+
+        :param accession_number: accession number of the filing,
+            e.g. ``"0000320193-22-000108"``.
+        """
+        return self.manifest.is_downloaded(accession_number)
+
+    def list_downloaded(
+        self, ticker_or_cik: Optional[str] = None, form: Optional[str] = None
+    ) -> List[DownloadedDocument]:
+        """List the downloaded documents recorded in the manifest.
+
+        The manifest is a SQLite database in the ``sec-edgar-filings`` folder that
+        records the accession number, CIK, form, path, size, SHA-256 checksum and
+        download time of every downloaded document.
+
+        :param ticker_or_cik: only list the documents of this ticker or CIK.
+        :param form: only list the documents of this form.
+        :return: downloaded documents, ordered by path.
+
+        Usage::
+
+            >>> dl.list_downloaded("AAPL", "10-K")
+        """
+        cik = None
+        if ticker_or_cik is not None:
+            cik = self._validate_and_convert_ticker_or_cik(ticker_or_cik)
+        return self.manifest.list_downloaded(cik, form)
+
+    def rebuild_manifest(self) -> int:
+        """Rebuild the manifest from the documents in the download folder.
+
+        Every document is hashed, so this reads the whole folder. Without it,
+        documents that were not downloaded by this version, or were added by
+        other means, are only recorded once a download comes across them, and
+        removed documents stay recorded. The CIK of documents saved under a
+        ticker is not known to the rebuilt manifest.
+
+        :return: number of documents recorded.
+        """
+        return self.manifest.rebuild()
 
     def get(
         self,
-        form: str,
+        form: Forms,
         ticker_or_cik: str,
         *,
         limit: Optional[int] = None,
@@ -68,13 +288,31 @@ class Downloader:
         include_amends: bool = False,
         download_details: bool = False,
         accession_numbers_to_skip: Optional[Set[str]] = None,
-    ) -> int:
+        max_workers: int = 1,
+        document_types: Optional[Forms] = None,
+        document_filename: Optional[str] = None,
+        max_document_size: Optional[int] = None,
+        download_full_submission: bool = True,
+        max_filing_size: Optional[int] = None,
+        max_total_size: Optional[int] = None,
+        size_order: Optional[str] = None,
+        items: Optional[Forms] = None,
+        is_xbrl: Optional[bool] = None,
+        is_inline_xbrl: Optional[bool] = None,
+        report_after: Optional[Date] = None,
+        report_before: Optional[Date] = None,
+        primary_doc_description: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> Union[int, Dict[str, int]]:
         """Download filings and save them to disk.
 
-        :param form: form type to download (e.g. 8-K, 10-K).
+        :param form: form type to download (e.g. 8-K, 10-K). A collection of form
+            types or shell-style form wildcards (e.g. ``"SC 13*"``) can also be
+            passed, in which case all forms are matched in a single pass over the
+            submissions and each filing is saved under its own form.
         :param ticker_or_cik: ticker or CIK for which to download filings.
-        :param limit: max number of filings to download.
-            Defaults to all available filings.
+        :param limit: max number of filings to download for each requested form
+            or form wildcard. Defaults to all available filings.
         :param after: date of form YYYY-MM-DD after which to download filings.
             Date or datetime objects can also be passed.
             Defaults to 1994-01-01, the earliest date supported by SEC EDGAR.
@@ -86,7 +324,53 @@ class Downloader:
         :param download_details: denotes whether to download human-readable and easily
             parseable filing detail documents (e.g. form 4 XML, 8-K HTML). Defaults to False.
         :param accession_numbers_to_skip: Set of accession numbers to skip when downloading.
-        :return: number of filings downloaded.
+        :param max_workers: number of threads used to download filings concurrently.
+            All threads share the SEC rate limit of 10 requests per second, so this
+            only helps when request latency keeps a single thread below the limit.
+            Capped at ``pool_size``. Defaults to 1.
+        :param job_id: ID under which to journal the download, so that it can be
+            continued with :meth:`resume` if it is interrupted. All filings are then
+            looked up before any is downloaded. Defaults to no journal.
+        :param document_types: document types to download from each filing, as
+            listed in its filing index (e.g. ``"EX-21"``), or shell-style wildcards
+            of them (e.g. ``"EX-10*"``). Defaults to no filter.
+        :param document_filename: shell-style wildcard that the filenames of the
+            documents to download must match (e.g. ``"*.xml"``). Defaults to no filter.
+        :param max_document_size: max size in bytes of the documents to download.
+            Documents of unknown size are skipped. Defaults to no filter.
+        :param download_full_submission: denotes whether to download the full
+            submission of each filing. Documents selected by any of the document
+            filters above are downloaded separately from the filing index, so the
+            full submission can be skipped if only they are needed. Defaults to True.
+        :param max_filing_size: max size in bytes of the filings to download, as
+            listed in the submissions. Defaults to no limit.
+        :param max_total_size: budget in bytes for all filings downloaded by this
+            call, or by the job if a ``job_id`` is given. Filings are taken in order
+            as long as they fit in the remaining budget. Defaults to no limit.
+        :param size_order: order in which to download filings by size, either
+            ``"smallest-first"`` or ``"largest-first"``. Filings are then all looked
+            up before any is downloaded. Defaults to newest first. Filings whose
+            size is unknown are skipped by the size limits and sorted last.
+        :param items: 8-K items of which filings must list at least one
+            (e.g. ``"2.02"`` for results of operations). Defaults to no filter.
+        :param is_xbrl: denotes whether filings must (True) or must not (False)
+            include XBRL financial data. Defaults to no filter.
+        :param is_inline_xbrl: denotes whether filings must (True) or must not
+            (False) be in inline XBRL. Defaults to no filter.
+        :param report_after: date of form YYYY-MM-DD after which the report date
+            (i.e. end of the reporting period) of filings must lie. Filings
+            without a report date are skipped. Defaults to no filter.
+        :param report_before: date of form YYYY-MM-DD before which the report date
+            of filings must lie. Defaults to no filter.
+        :param primary_doc_description: shell-style wildcard that the description
+            of the primary document of filings must match, ignoring case
+            (e.g. ``"*EARNINGS*"``). Defaults to no filter.
+
+            The metadata filters are applied to the submissions before any filing
+            is downloaded. Filings that lack the metadata a filter looks at do not
+            match it, and ``limit`` counts only the filings that match.
+        :return: number of filings downloaded. If several forms or a form wildcard
+            were requested, the number of filings downloaded for each form instead.
 
         Usage::
 
@@ -122,62 +406,633 @@ class Downloader:
 
             # Get all SD filings for Apple
             >>> dl.get("SD", "AAPL")
+
+            # Get all 4 filings for Apple, downloading with four threads
+            >>> dl.get("4", "AAPL", max_workers=4)
+
+            # Get the latest 10-K, 10-Q and 8-K filings for Apple in one pass
+            >>> dl.get({"10-K", "10-Q", "8-K"}, "AAPL", limit=1)
+            {'10-K': 1, '10-Q': 1, '8-K': 1}
+
+            # Get all SC 13D and SC 13G filings for Apple
+            >>> dl.get("SC 13*", "AAPL")
+
+            # Get Apple's Form 4 filings, smallest first, until 50 MB are downloaded
+            >>> dl.get("4", "AAPL", size_order="smallest-first", max_total_size=50_000_000)
+
+            # Get Apple's earnings releases, i.e. 8-K filings that report item 2.02
+            >>> dl.get("8-K", "AAPL", items="2.02")
+
+            # Get only the subsidiaries exhibits of Apple's 10-K filings
+            >>> dl.get("10-K", "AAPL", document_types="EX-21*", download_full_submission=False)
         """
-        cik = validate_and_convert_ticker_or_cik(
-            ticker_or_cik, self.ticker_to_cik_mapping
+        cik = self._validate_and_convert_ticker_or_cik(ticker_or_cik)
+
+        limit = validate_and_parse_limit(limit)
+        after_date, before_date = validate_and_parse_date_range(after, before)
+        forms = validate_and_parse_forms(form)
+        max_workers = validate_and_parse_max_workers(
+            max_workers, self.gateway.pool_size
+        )
+        document_types = validate_and_parse_values(document_types)
+        validate_max_size(max_document_size, "document size")
+        validate_max_size(max_filing_size, "filing size")
+        validate_max_size(max_total_size, "total size")
+        validate_size_order(size_order)
+        items = validate_and_parse_values(items)
+        report_after_date, report_before_date = validate_and_parse_report_date_range(
+            report_after, report_before
         )
 
-        if limit is None:
-            # If amount is not specified, obtain all available filings.
-            # We simply need a large number to denote this and the loop
-            # responsible for fetching the URLs will break appropriately.
-            limit = sys.maxsize
-        else:
-            limit = int(limit)
-            if limit < 1:
-                raise ValueError(
-                    "Invalid amount. Please enter a number greater than 1."
-                )
-
-        # SEC allows for filing searches from 1994 onwards
-        if after is None:
-            after_date = DEFAULT_AFTER_DATE
-        else:
-            after_date = validate_and_parse_date(after)
+        download_metadata = DownloadMetadata(
+            self.download_folder,
+            forms[0],
+            cik,
+            limit,
+            after_date,
+            before_date,
+            include_amends,
+            download_details,
+            # Save ticker if passed in to form file system path for saving filings
+            ticker=ticker_or_cik if not is_cik(ticker_or_cik) else None,
+            accession_numbers_to_skip=accession_numbers_to_skip,
+            forms=forms,
+            compression=self.compression,
+            layout=self.layout,
+            document_types=document_types,
+            document_filename=document_filename,
+            max_document_size=max_document_size,
+            download_full_submission=download_full_submission,
+            max_filing_size=max_filing_size,
+            max_total_size=max_total_size,
+            size_order=size_order,
+            items=items,
+            is_xbrl=is_xbrl,
+            is_inline_xbrl=is_inline_xbrl,
+            report_after=report_after_date,
+            report_before=report_before_date,
+            primary_doc_description=primary_doc_description,
+        )
+        validate_document_selection(download_metadata)
+        num_downloaded = fetch_and_save_filings(
+            download_metadata,
+            self.gateway,
+            max_workers,
+            self.submissions_store,
+            self.refresh_submissions,
+            manifest=self._download_manifest,
+            job=self._create_job(job_id, JOB_KIND_GET, download_metadata, form),
+            storage=self.storage,
+        )
 
-            if after_date < DEFAULT_AFTER_DATE:
-                after_date = DEFAULT_AFTER_DATE
+        return summarize_num_downloaded(form, num_downloaded)
 
-        if before is None:
-            before_date = DEFAULT_BEFORE_DATE
-        else:
-            before_date = validate_and_parse_date(before)
+    def estimate(
+        self,
+        form: Forms,
+        ticker_or_cik: str,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[Date] = None,
+        before: Optional[Date] = None,
+        include_amends: bool = False,
+        download_details: bool = False,
+        accession_numbers_to_skip: Optional[Set[str]] = None,
+        max_filing_size: Optional[int] = None,
+        max_total_size: Optional[int] = None,
+        size_order: Optional[str] = None,
+        items: Optional[Forms] = None,
+        is_xbrl: Optional[bool] = None,
+        is_inline_xbrl: Optional[bool] = None,
+        report_after: Optional[Date] = None,
+        report_before: Optional[Date] = None,
+        primary_doc_description: Optional[str] = None,
+        bytes_per_sec: float = DEFAULT_ESTIMATE_BYTES_PER_SEC,
+    ) -> DownloadEstimate:
+        """Estimate the size and duration of a download without downloading anything.
+
+        The filings are looked up as in :meth:`get`, and the sizes listed in the
+        submissions are summed up for the filings that the size rules select,
+        regardless of whether any of them were already downloaded.
+
+        :param form: form type to download, or a collection of form types or form
+            wildcards, as in :meth:`get`.
+        :param ticker_or_cik: ticker or CIK for which to download filings.
+        :param limit: max number of filings to download for each requested form
+            or form wildcard, as in :meth:`get`.
+        :param after: date of form YYYY-MM-DD after which to download filings,
+            as in :meth:`get`.
+        :param before: date of form YYYY-MM-DD before which to download filings,
+            as in :meth:`get`.
+        :param include_amends: denotes whether to include filing amends (e.g. 8-K/A).
+            Defaults to False.
+        :param download_details: denotes whether to download filing detail
+            documents, which adds a request per filing. Defaults to False.
+        :param accession_numbers_to_skip: Set of accession numbers to skip.
+        :param max_filing_size: max size in bytes of the filings, as in :meth:`get`.
+        :param max_total_size: budget in bytes for all filings, as in :meth:`get`.
+        :param size_order: order in which to download filings by size, as in
+            :meth:`get`.
+        :param items: 8-K items of which filings must list at least one, as in
+            :meth:`get`.
+        :param is_xbrl: denotes whether filings must include XBRL financial data,
+            as in :meth:`get`.
+        :param is_inline_xbrl: denotes whether filings must be in inline XBRL, as
+            in :meth:`get`.
+        :param report_after: date after which the report date of filings must
+            lie, as in :meth:`get`.
+        :param report_before: date before which the report date of filings must
+            lie, as in :meth:`get`.
+        :param primary_doc_description: wildcard that the description of the
+            primary document of filings must match, as in :meth:`get`.
+        :param bytes_per_sec: download bandwidth to assume. Defaults to 10 MiB/s.
+        :return: the number of filings, their total size in bytes, the number of
+            filings whose size is unknown, the number of document requests and
+            the estimated number of seconds that downloading them takes at the
+            SEC rate limit of 10 requests per second.
 
-        if after_date > before_date:
-            raise ValueError("After date cannot be greater than the before date.")
+        Usage::
+
+            >>> from sec_edgar_downloader import Downloader
+            >>> dl = Downloader("MyCompanyName", "my.email@domain.com")
+            # Preview how much downloading Apple's Form 4 filings under 1 MB takes
+            >>> estimate = dl.estimate("4", "AAPL", max_filing_size=1_000_000)
+            >>> print(estimate.num_filings, estimate.num_bytes, estimate.seconds)
+        """
+        cik = self._validate_and_convert_ticker_or_cik(ticker_or_cik)
 
-        if form not in _SUPPORTED_FORMS:
-            form_options = ", ".join(self.supported_forms)
+        limit = validate_and_parse_limit(limit)
+        after_date, before_date = validate_and_parse_date_range(after, before)
+        forms = validate_and_parse_forms(form)
+        validate_max_size(max_filing_size, "filing size")
+        validate_max_size(max_total_size, "total size")
+        validate_size_order(size_order)
+        items = validate_and_parse_values(items)
+        report_after_date, report_before_date = validate_and_parse_report_date_range(
+            report_after, report_before
+        )
+        if bytes_per_sec <= 0:
             raise ValueError(
-                f"{form!r} forms are not supported. "
-                f"Please choose from the following: {form_options}."
+                "Invalid download bandwidth. Please enter a number greater than 0."
             )
 
-        num_downloaded = fetch_and_save_filings(
+        download_metadata = DownloadMetadata(
+            self.download_folder,
+            forms[0],
+            cik,
+            limit,
+            after_date,
+            before_date,
+            include_amends,
+            download_details,
+            accession_numbers_to_skip=accession_numbers_to_skip,
+            forms=forms,
+            max_filing_size=max_filing_size,
+            max_total_size=max_total_size,
+            size_order=size_order,
+            items=items,
+            is_xbrl=is_xbrl,
+            is_inline_xbrl=is_inline_xbrl,
+            report_after=report_after_date,
+            report_before=report_before_date,
+            primary_doc_description=primary_doc_description,
+        )
+        to_download = iter_filings(
+            download_metadata,
+            self.gateway,
+            self.submissions_store,
+            self.refresh_submissions,
+        )
+        return estimate_download(download_metadata, to_download, bytes_per_sec)
+
+    def list_filings(
+        self,
+        form: Forms,
+        ticker_or_cik: str,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[Date] = None,
+        before: Optional[Date] = None,
+        include_amends: bool = False,
+        items: Optional[Forms] = None,
+        is_xbrl: Optional[bool] = None,
+        is_inline_xbrl: Optional[bool] = None,
+        report_after: Optional[Date] = None,
+        report_before: Optional[Date] = None,
+        primary_doc_description: Optional[str] = None,
+        table_format: str = TABLE_FORMAT_DICT,
+    ) -> Any:
+        """List the metadata of filings without downloading them.
+
+        The submissions are looked up and filtered as in :meth:`get`, so this costs
+        one request per submissions page, or none for a company in the
+        submissions store without ``refresh_submissions``.
+
+        :param form: form type to list, or a collection of form types or form
+            wildcards, as in :meth:`get`.
+        :param ticker_or_cik: ticker or CIK for which to list filings.
+        :param limit: max number of filings to list for each requested form or
+            form wildcard. Defaults to all available filings.
+        :param after: date of form YYYY-MM-DD after which to list filings,
+            as in :meth:`get`.
+        :param before: date of form YYYY-MM-DD before which to list filings,
+            as in :meth:`get`.
+        :param include_amends: denotes whether to include filing amends (e.g. 8-K/A).
+            Defaults to False.
+        :param items: 8-K items of which filings must list at least one, as in
+            :meth:`get`.
+        :param is_xbrl: denotes whether filings must include XBRL financial data,
+            as in :meth:`get`.
+        :param is_inline_xbrl: denotes whether filings must be in inline XBRL, as
+            in :meth:`get`.
+        :param report_after: date after which the report date of filings must
+            lie, as in :meth:`get`.
+        :param report_before: date before which the report date of filings must
+            lie, as in :meth:`get`.
+        :param primary_doc_description: wildcard that the description of the
+            primary document of filings must match, as in :meth:`get`.
+        :param table_format: ``"dict"`` to return a dict of columns, ``"arrow"``
+            for a ``pyarrow.Table`` or ``"pandas"`` for a ``pandas.DataFrame``.
+            Install pyarrow or pandas with ``pip install sec-edgar-downloader[arrow]``
+            or ``pip install sec-edgar-downloader[pandas]``. Defaults to ``"dict"``.
+        :return: the matching filings, newest first, with one column for each field
+            of the submissions filing arrays (e.g. ``accessionNumber``, ``form``,
+            ``filingDate``, ``reportDate``, ``items``, ``size``).
+
+        Usage::
+
+            >>> from sec_edgar_downloader import Downloader
+            >>> dl = Downloader("MyCompanyName", "my.email@domain.com")
+            >>> filings = dl.list_filings("10-K", "AAPL", limit=2)
+            >>> filings["accessionNumber"]
+            ['0000320193-23-000106', '0000320193-22-000108']
+
+            # List Apple's earnings releases as a pandas DataFrame
+            >>> df = dl.list_filings("8-K", "AAPL", items="2.02", table_format="pandas")
+        """
+        cik = self._validate_and_convert_ticker_or_cik(ticker_or_cik)
+
+        limit = validate_and_parse_limit(limit)
+        after_date, before_date = validate_and_parse_date_range(after, before)
+        forms = validate_and_parse_forms(form)
+        items = validate_and_parse_values(items)
+        report_after_date, report_before_date = validate_and_parse_report_date_range(
+            report_after, report_before
+        )
+        validate_table_format(table_format)
+
+        download_metadata = DownloadMetadata(
+            self.download_folder,
+            forms[0],
+            cik,
+            limit,
+            after_date,
+            before_date,
+            include_amends,
+            forms=forms,
+            items=items,
+            is_xbrl=is_xbrl,
+            is_inline_xbrl=is_inline_xbrl,
+            report_after=report_after_date,
+            report_before=report_before_date,
+            primary_doc_description=primary_doc_description,
+        )
+        catalog = list_filings(
+            download_metadata,
+            self.gateway,
+            self.submissions_store,
+            self.refresh_submissions,
+        )
+        return to_table(catalog, table_format)
+
+    def get_many(
+        self,
+        form: Forms,
+        tickers_or_ciks: Iterable[str],
+        *,
+        limit: Optional[int] = None,
+        after: Optional[Date] = None,
+        before: Optional[Date] = None,
+        include_amends: bool = False,
+        download_details: bool = False,
+        accession_numbers_to_skip: Optional[Set[str]] = None,
+        max_workers: int = 1,
+        document_types: Optional[Forms] = None,
+        document_filename: Optional[str] = None,
+        max_document_size: Optional[int] = None,
+        download_full_submission: bool = True,
+        max_filing_size: Optional[int] = None,
+        max_total_size: Optional[int] = None,
+        size_order: Optional[str] = None,
+        items: Optional[Forms] = None,
+        is_xbrl: Optional[bool] = None,
+        is_inline_xbrl: Optional[bool] = None,
+        report_after: Optional[Date] = None,
+        report_before: Optional[Date] = None,
+        primary_doc_description: Optional[str] = None,
+    ) -> Dict[str, Union[int, Dict[str, int]]]:
+        """Download filings of several companies and save them to disk.
+
+        All tickers and CIKs are validated before anything is downloaded. The
+        submissions of all companies are then fetched and their filings downloaded
+        by one shared pool of ``max_workers`` threads, so a company with a long
+        filing history does not hold up the others. If the submissions of a
+        company cannot be fetched, the error is printed and the remaining
+        companies are still downloaded.
+
+        :param form: form type to download, or a collection of form types or form
+            wildcards, as in :meth:`get`.
+        :param tickers_or_ciks: tickers or CIKs for which to download filings.
+        :param limit: max number of filings to download for each company and each
+            requested form or form wildcard. Defaults to all available filings.
+        :param after: date of form YYYY-MM-DD after which to download filings.
+            Date or datetime objects can also be passed.
+            Defaults to 1994-01-01, the earliest date supported by SEC EDGAR.
+        :param before: date of form YYYY-MM-DD before which to download filings.
+            Date or datetime objects can also be passed.
+            Defaults to today.
+        :param include_amends: denotes whether to include filing amends (e.g. 8-K/A).
+            Defaults to False.
+        :param download_details: denotes whether to download human-readable and easily
+            parseable filing detail documents (e.g. form 4 XML, 8-K HTML). Defaults to False.
+        :param accession_numbers_to_skip: Set of accession numbers to skip when downloading.
+        :param max_workers: number of threads shared by all companies. Capped at
+            ``pool_size``. Defaults to 1.
+        :param document_types: document types to download from each filing, as
+            in :meth:`get`.
+        :param document_filename: filename wildcard of the documents to download,
+            as in :meth:`get`.
+        :param max_document_size: max size in bytes of the documents to download,
+            as in :meth:`get`.
+        :param download_full_submission: denotes whether to download the full
+            submission of each filing, as in :meth:`get`. Defaults to True.
+        :param max_filing_size: max size in bytes of the filings to download, as
+            in :meth:`get`.
+        :param max_total_size: budget in bytes for the filings of each company,
+            as in :meth:`get`.
+        :param size_order: order in which to download the filings of each company
+            by size, as in :meth:`get`.
+        :param items: 8-K items of which filings must list at least one, as in
+            :meth:`get`.
+        :param is_xbrl: denotes whether filings must include XBRL financial data,
+            as in :meth:`get`.
+        :param is_inline_xbrl: denotes whether filings must be in inline XBRL, as
+            in :meth:`get`.
+        :param report_after: date after which the report date of filings must
+            lie, as in :meth:`get`.
+        :param report_before: date before which the report date of filings must
+            lie, as in :meth:`get`.
+        :param primary_doc_description: wildcard that the description of the
+            primary document of filings must match, as in :meth:`get`.
+        :return: mapping of each ticker or CIK, as passed in, to the result that
+            :meth:`get` would have returned for it.
+
+        Usage::
+
+            >>> from sec_edgar_downloader import Downloader
+            >>> dl = Downloader("MyCompanyName", "my.email@domain.com")
+
+            # Get the five most recent 10-K filings for Apple, Microsoft and Visa
+            >>> dl.get_many("10-K", ["AAPL", "MSFT", "V"], limit=5, max_workers=4)
+            {'AAPL': 5, 'MSFT': 5, 'V': 5}
+        """
+        ciks = {
+            ticker_or_cik: self._validate_and_convert_ticker_or_cik(ticker_or_cik)
+            for ticker_or_cik in dict.fromkeys(tickers_or_ciks)
+        }
+        if not ciks:
+            raise ValueError(
+                "Invalid tickers or CIKs. Please enter at least one ticker or CIK."
+            )
+
+        limit = validate_and_parse_limit(limit)
+        after_date, before_date = validate_and_parse_date_range(after, before)
+        forms = validate_and_parse_forms(form)
+        max_workers = validate_and_parse_max_workers(
+            max_workers, self.gateway.pool_size
+        )
+        document_types = validate_and_parse_values(document_types)
+        validate_max_size(max_document_size, "document size")
+        validate_max_size(max_filing_size, "filing size")
+        validate_max_size(max_total_size, "total size")
+        validate_size_order(size_order)
+        items = validate_and_parse_values(items)
+        report_after_date, report_before_date = validate_and_parse_report_date_range(
+            report_after, report_before
+        )
+
+        download_metadatas = [
             DownloadMetadata(
                 self.download_folder,
-                form,
+                forms[0],
                 cik,
                 limit,
                 after_date,
                 before_date,
                 include_amends,
                 download_details,
-                # Save ticker if passed in to form file system path for saving filings
                 ticker=ticker_or_cik if not is_cik(ticker_or_cik) else None,
                 accession_numbers_to_skip=accession_numbers_to_skip,
-            ),
-            self.user_agent,
+                forms=forms,
+                compression=self.compression,
+                layout=self.layout,
+                document_types=document_types,
+                document_filename=document_filename,
+                max_document_size=max_document_size,
+                download_full_submission=download_full_submission,
+                max_filing_size=max_filing_size,
+                max_total_size=max_total_size,
+                size_order=size_order,
+                items=items,
+                is_xbrl=is_xbrl,
+                is_inline_xbrl=is_inline_xbrl,
+                report_after=report_after_date,
+                report_before=report_before_date,
+                primary_doc_description=primary_doc_description,
+            )
+            for ticker_or_cik, cik in ciks.items()
+        ]
+        validate_document_selection(download_metadatas[0])
+        num_downloaded = fetch_and_save_filings_many(
+            download_metadatas,
+            self.gateway,
+            max_workers,
+            self.submissions_store,
+            self.refresh_submissions,
+            manifest=self._download_manifest,
+            storage=self.storage,
+        )
+
+        return {
+            ticker_or_cik: summarize_num_downloaded(form, company_num_downloaded)
+            for ticker_or_cik, company_num_downloaded in zip(  # noqa: B905
+                ciks, num_downloaded
+            )
+        }
+
+    def crawl(
+        self,
+        form: Forms,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[Date] = None,
+        before: Optional[Date] = None,
+        include_amends: bool = False,
+        accession_numbers_to_skip: Optional[Set[str]] = None,
+        max_workers: int = 1,
+        document_types: Optional[Forms] = None,
+        document_filename: Optional[str] = None,
+        max_document_size: Optional[int] = None,
+        download_full_submission: bool = True,
+        job_id: Optional[str] = None,
+    ) -> Union[int, Dict[str, int]]:
+        """Download filings of a form across all companies and save them to disk.
+
+        Rather than paginating the submissions of every company, the EDGAR master
+        index files covering the date range are streamed and filtered, so the
+        metadata cost grows with the number of days rather than the number of
+        companies. Quarters that lie entirely within the date range are read from
+        the quarterly full-index, and partially covered quarters from the
+        daily-index. Filings are saved under the CIK of each filer. Index files do
+        not list primary documents, so only full submissions are downloaded.
+
+        :param form: form type to download (e.g. 8-K, 10-K), or a collection of
+            form types or form wildcards, as in :meth:`get`.
+        :param limit: max number of filings to download for each requested form
+            or form wildcard. Index files list filings by CIK, so the matches of
+            each index file are sorted by filing date first, and the newest
+            filings are downloaded. Defaults to all available filings.
+        :param after: date of form YYYY-MM-DD after which to download filings.
+            Date or datetime objects can also be passed.
+            Defaults to 1994-01-01, the earliest date supported by SEC EDGAR.
+        :param before: date of form YYYY-MM-DD before which to download filings.
+            Date or datetime objects can also be passed.
+            Defaults to today.
+        :param include_amends: denotes whether to include filing amends (e.g. 8-K/A).
+            Defaults to False.
+        :param accession_numbers_to_skip: Set of accession numbers to skip when downloading.
+        :param max_workers: number of threads used to download filings concurrently.
+            Capped at ``pool_size``. Defaults to 1.
+        :param job_id: ID under which to journal the download, as in :meth:`get`.
+        :param document_types: document types to download from each filing, as
+            in :meth:`get`.
+        :param document_filename: filename wildcard of the documents to download,
+            as in :meth:`get`.
+        :param max_document_size: max size in bytes of the documents to download,
+            as in :meth:`get`.
+        :param download_full_submission: denotes whether to download the full
+            submission of each filing, as in :meth:`get`. Defaults to True.
+        :return: number of filings downloaded, or the number of filings downloaded
+            for each form, as in :meth:`get`.
+
+        Usage::
+
+            >>> from sec_edgar_downloader import Downloader
+            >>> dl = Downloader("MyCompanyName", "my.email@domain.com")
+
+            # Get all 8-K filings filed by any company in the first week of March 2023
+            >>> dl.crawl("8-K", after="2023-03-01", before="2023-03-07")
+        """
+        limit = validate_and_parse_limit(limit)
+        after_date, before_date = validate_and_parse_date_range(after, before)
+        forms = validate_and_parse_forms(form)
+        max_workers = validate_and_parse_max_workers(
+            max_workers, self.gateway.pool_size
+        )
+        document_types = validate_and_parse_values(document_types)
+        validate_max_size(max_document_size, "document size")
+
+        download_metadata = DownloadMetadata(
+            self.download_folder,
+            forms[0],
+            # Filings are saved under the CIK of each filer instead
+            "",
+            limit,
+            after_date,
+            before_date,
+            include_amends,
+            accession_numbers_to_skip=accession_numbers_to_skip,
+            forms=forms,
+            compression=self.compression,
+            layout=self.layout,
+            document_types=document_types,
+            document_filename=document_filename,
+            max_document_size=max_document_size,
+            download_full_submission=download_full_submission,
+        )
+        validate_document_selection(download_metadata)
+        num_downloaded = crawl_and_save_filings(
+            download_metadata,
+            self.gateway,
+            max_workers,
+            manifest=self._download_manifest,
+            job=self._create_job(job_id, JOB_KIND_CRAWL, download_metadata, form),
+            storage=self.storage,
+        )
+
+        return summarize_num_downloaded(form, num_downloaded)
+
+    def resume(
+        self, job_id: str, *, max_workers: int = 1
+    ) -> Union[int, Dict[str, int]]:
+        """Resume a job started by :meth:`get` or :meth:`crawl` with a ``job_id``.
+
+        Filings that the job already saved are not downloaded again. If the job
+        had finished finding its filings before it stopped, the remaining filings
+        are read from the job journal without any metadata requests. Otherwise,
+        the filings are looked up again first.
+
+        :param job_id: ID of the job to resume.
+        :param max_workers: number of threads used to download filings concurrently.
+            Capped at ``pool_size``. Defaults to 1.
+        :return: number of filings downloaded by the resumed job, as returned by
+            :meth:`get`.
+
+        Usage::
+
+            >>> dl.get("4", "AAPL", job_id="apple-form-4")
+            # The process is killed halfway through
+            >>> dl.resume("apple-form-4")
+        """
+        max_workers = validate_and_parse_max_workers(
+            max_workers, self.gateway.pool_size
         )
+        job = self.job_journal.get_job(job_id)
+        download_metadata = job.download_metadata
 
-        return num_downloaded
+        to_download: Iterable[ToDownload]
+        if job.planned:
+            # The remaining filings are read from the journal
+            to_download = ()
+        elif job.kind == JOB_KIND_CRAWL:
+            to_download = iter_index_filings(download_metadata, self.gateway)
+        else:
+            to_download = iter_filings(
+                download_metadata,
+                self.gateway,
+                self.submissions_store,
+                self.refresh_submissions,
+            )
+
+        num_downloaded = save_filings(
+            download_metadata,
+            self.gateway,
+            to_download,
+            max_workers,
+            self._download_manifest,
+            job,
+            self.storage,
+        )
+
+        return summarize_num_downloaded(job.form, num_downloaded)
+
+    def _create_job(
+        self,
+        job_id: Optional[str],
+        kind: str,
+        download_metadata: DownloadMetadata,
+        form: Forms,
+    ) -> Optional[Job]:
+        if job_id is None:
+            return None
+        return self.job_journal.create_job(job_id, kind, download_metadata, form)
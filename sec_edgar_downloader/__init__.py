@@ -1,2 +1,12 @@
+from ._AsyncDownloader import AsyncDownloader
+from ._compression import open_filing
 from ._Downloader import Downloader
+from ._sgml import extract_submission, split_submission
+from ._storage import (
+    LocalStorage,
+    MemoryStorage,
+    ObjectStorage,
+    PackStorage,
+    StorageBackend,
+)
 from ._version import __version__
@@ -0,0 +1,179 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Dict, List
+
+from ._constants import (
+    FAILED_FILING_RETRY_ROUNDS,
+    FILING_FULL_SUBMISSION_FILENAME,
+    PRIMARY_DOC_FILENAME_STEM,
+    SUBMISSION_FILE_FORMAT,
+    URL_SUBMISSIONS,
+)
+from ._orchestrator import (
+    filter_filings_page,
+    get_additional_submissions,
+    get_save_location,
+    is_limit_reached,
+    parse_ticker_to_cik_mapping,
+)
+from ._sec_gateway import AsyncSecGateway
+from ._storage import get_temp_path
+from ._types import DownloadMetadata, ToDownload
+
+
+async def iter_filings_to_download_async(
+    download_metadata: DownloadMetadata, gateway: AsyncSecGateway
+) -> AsyncIterator[ToDownload]:
+    """Yield matching filings page by page, newest first.
+
+    Additional submissions pages (for companies with >1000 filings) outside of
+    the requested date range are skipped. The rest are fetched concurrently in
+    windows of ``gateway.pool_size`` pages, and are only requested if the limit
+    has not been reached yet.
+    """
+    fetched_counts: Dict[str, int] = {}
+    submissions_uri = URL_SUBMISSIONS.format(
+        submission=SUBMISSION_FILE_FORMAT.format(cik=download_metadata.cik)
+    )
+    resp_json = await gateway.get_list_of_available_filings(submissions_uri)
+    pages = [resp_json["filings"]["recent"]]
+    additional_submissions = get_additional_submissions(download_metadata, resp_json)
+
+    while True:
+        for filings_json in pages:
+            for td in filter_filings_page(
+                download_metadata, filings_json, fetched_counts
+            ):
+                yield td
+
+            if is_limit_reached(download_metadata, fetched_counts):
+                return
+
+        if not additional_submissions:
+            return
+
+        window = additional_submissions[: gateway.pool_size]
+        additional_submissions = additional_submissions[gateway.pool_size :]
+        # Results are merged in page order regardless of completion order
+        pages = await asyncio.gather(
+            *(gateway.get_list_of_available_filings(uri) for uri in window)
+        )
+
+
+async def aggregate_filings_to_download_async(
+    download_metadata: DownloadMetadata, gateway: AsyncSecGateway
+) -> List[ToDownload]:
+    return [
+        td async for td in iter_filings_to_download_async(download_metadata, gateway)
+    ]
+
+
+async def save_document_async(chunks: AsyncIterable[bytes], save_path: Path) -> int:
+    """Asyncio counterpart of :func:`save_document` for streamed chunks.
+
+    File I/O runs in a worker thread so that it does not block the event loop.
+    """
+    await asyncio.to_thread(save_path.parent.mkdir, parents=True, exist_ok=True)
+    temp_path = get_temp_path(save_path)
+    num_bytes = 0
+    try:
+        f = await asyncio.to_thread(temp_path.open, "xb")
+        with f:
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, chunk)
+                num_bytes += len(chunk)
+        await asyncio.to_thread(os.replace, temp_path, save_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return num_bytes
+
+
+async def _fetch_and_save_filing_async(
+    download_metadata: DownloadMetadata,
+    gateway: AsyncSecGateway,
+    td: ToDownload,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    async with semaphore:
+        try:
+            save_location = get_save_location(
+                download_metadata, td.accession_number, FILING_FULL_SUBMISSION_FILENAME
+            )
+            if not save_location.exists():
+                await save_document_async(
+                    gateway.stream_filing(td.raw_filing_uri), save_location
+                )
+
+            if download_metadata.download_details:
+                primary_doc_filename = (
+                    f"{PRIMARY_DOC_FILENAME_STEM}{td.details_doc_suffix}"
+                )
+                save_location = get_save_location(
+                    download_metadata, td.accession_number, primary_doc_filename
+                )
+                if not save_location.exists():
+                    await save_document_async(
+                        gateway.stream_filing(td.primary_doc_uri), save_location
+                    )
+        except Exception as e:
+            print(
+                "Error occurred while downloading filing for accession number "
+                f"{td.accession_number}: {e}"
+            )
+            return False
+
+    return True
+
+
+async def fetch_and_save_filings_async(
+    download_metadata: DownloadMetadata, gateway: AsyncSecGateway
+) -> int:
+    """Download filings concurrently while submissions pages are still being paginated.
+
+    Downloads for a page start as soon as that page is processed. The number of
+    in-flight downloads is bounded by ``gateway.pool_size``.
+    """
+    accession_numbers_to_skip = download_metadata.accession_numbers_to_skip or set()
+    semaphore = asyncio.Semaphore(gateway.pool_size)
+    tds = []
+    tasks = []
+
+    try:
+        async for td in iter_filings_to_download_async(download_metadata, gateway):
+            if td.accession_number in accession_numbers_to_skip:
+                continue
+            tds.append(td)
+            tasks.append(
+                asyncio.create_task(
+                    _fetch_and_save_filing_async(
+                        download_metadata, gateway, td, semaphore
+                    )
+                )
+            )
+    except BaseException:
+        # Pagination failed, so do not leave downloads running in the background
+        for task in tasks:
+            task.cancel()
+        raise
+
+    results = await asyncio.gather(*tasks)
+    num_downloaded = sum(results)
+    # Filings that failed, e.g. because SEC kept throttling requests, are queued
+    # again once all others are done
+    for _ in range(FAILED_FILING_RETRY_ROUNDS):
+        tds = [td for td, succeeded in zip(tds, results) if not succeeded]  # noqa: B905
+        results = await asyncio.gather(
+            *(
+                _fetch_and_save_filing_async(download_metadata, gateway, td, semaphore)
+                for td in tds
+            )
+        )
+        num_downloaded += sum(results)
+    return num_downloaded
+
+
+async def get_ticker_to_cik_mapping_async(gateway: AsyncSecGateway) -> Dict[str, str]:
+    return parse_ticker_to_cik_mapping(await gateway.get_ticker_metadata())
@@ -0,0 +1,67 @@
+import importlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ._constants import TABLE_FORMAT_ARROW, TABLE_FORMAT_PANDAS
+from ._orchestrator import filter_filings_rows, get_stored_filings, iter_matching_pages
+from ._sec_gateway import SecGateway
+from ._submissions_store import SUBMISSIONS_COLUMNS, SubmissionsStore
+from ._types import DownloadMetadata
+
+
+def list_filings(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    store: Optional[SubmissionsStore] = None,
+    refresh_store: bool = True,
+) -> Dict[str, List[Any]]:
+    """Return the metadata of the requested filings as columns, newest first.
+
+    The submissions are paginated and filtered exactly as for a download, but no
+    filing is downloaded. Every column of the submissions filing arrays is
+    returned under its API name, e.g. ``accessionNumber`` and ``reportDate``,
+    with ``None`` for values that a page does not list.
+    """
+    catalog: Dict[str, List[Any]] = {column: [] for column in SUBMISSIONS_COLUMNS}
+    for filings_json, rows in iter_catalog_pages(
+        download_metadata, gateway, store, refresh_store
+    ):
+        for column, values in catalog.items():
+            page_values = filings_json.get(column)
+            values.extend(None if page_values is None else page_values[i] for i in rows)
+    return catalog
+
+
+def iter_catalog_pages(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    store: Optional[SubmissionsStore] = None,
+    refresh_store: bool = True,
+) -> Iterator[Tuple[Dict[str, Any], List[int]]]:
+    if store is None:
+        return iter_matching_pages(download_metadata, gateway)
+
+    # The stored filing history of a CIK is a single page
+    filings_json = get_stored_filings(
+        download_metadata.cik, gateway, store, refresh_store
+    )
+    return iter(
+        [(filings_json, filter_filings_rows(download_metadata, filings_json, {}))]
+    )
+
+
+def to_table(catalog: Dict[str, List[Any]], table_format: str) -> Any:
+    if table_format == TABLE_FORMAT_ARROW:
+        return import_optional("pyarrow", TABLE_FORMAT_ARROW).table(catalog)
+    if table_format == TABLE_FORMAT_PANDAS:
+        return import_optional("pandas", TABLE_FORMAT_PANDAS).DataFrame(catalog)
+    return catalog
+
+
+def import_optional(name: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as exc:
+        raise ImportError(
+            f"This table format requires the {name} package. "
+            f"Install it with: pip install sec-edgar-downloader[{extra}]"
+        ) from exc
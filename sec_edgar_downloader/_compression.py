@@ -0,0 +1,97 @@
+import gzip
+import io
+import zlib
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+from ._constants import (
+    COMPRESSION_GZIP,
+    COMPRESSION_SUFFIXES,
+    COMPRESSION_ZSTD,
+    PACK_SUFFIX,
+)
+from ._pack import open_pack
+from ._types import DownloadPath
+
+# wbits value selecting the gzip container for zlib streams
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "Zstandard compression requires the zstandard package. "
+            "Install it with: pip install sec-edgar-downloader[zstd]"
+        ) from exc
+    return zstandard
+
+
+def compress_chunks(chunks: Iterable[bytes], compression: str) -> Iterator[bytes]:
+    """Compress a stream of chunks without holding the whole stream in memory."""
+    if compression == COMPRESSION_GZIP:
+        compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    else:
+        compressor = import_zstandard().ZstdCompressor().compressobj()
+
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def open_filing(path: DownloadPath) -> IO[bytes]:
+    """Open a saved filing document for reading, whether or not it is compressed.
+
+    Documents saved with ``compression`` have a ``.gz`` or ``.zst`` suffix, which
+    may be omitted from ``path``, so the same path opens a document regardless of
+    how it was saved. Compressed documents are decompressed while they are read.
+    Documents saved in the ``"pack"`` layout are read from their pack by the path
+    they would have in the folder layout.
+
+    :param path: path to the document, e.g.
+        ``sec-edgar-filings/AAPL/10-K/0000320193-22-000108/full-submission.txt``.
+    :return: binary file object, to be used as a context manager.
+
+    Usage::
+
+        >>> from sec_edgar_downloader import open_filing
+        >>> with open_filing(".../full-submission.txt") as f:
+        ...     header = f.read(1024)
+    """
+    path = Path(path).expanduser().absolute()
+    candidates = [path] + [
+        path.with_name(f"{path.name}{suffix}")
+        for suffix in COMPRESSION_SUFFIXES.values()
+    ]
+    for candidate in candidates:
+        if candidate.exists():
+            if candidate.suffix == COMPRESSION_SUFFIXES[COMPRESSION_GZIP]:
+                # GzipFile is not an IO[bytes], so it is buffered like zstd readers
+                return io.BufferedReader(gzip.GzipFile(candidate, "rb"))
+            return decompress(candidate.name, candidate.open("rb"))
+
+    # Documents saved in the pack layout live in <ticker or CIK>/<form>.pack
+    form_folder = path.parent.parent
+    pack_path = form_folder.parent / f"{form_folder.name}{PACK_SUFFIX}"
+    if pack_path.exists():
+        pack = open_pack(pack_path)
+        accession_number = path.parent.name
+        for candidate in candidates:
+            if (accession_number, candidate.name) in pack:
+                return decompress(
+                    candidate.name, pack.open(accession_number, candidate.name)
+                )
+
+    return path.open("rb")
+
+
+def decompress(name: str, f: IO[bytes]) -> IO[bytes]:
+    if name.endswith(COMPRESSION_SUFFIXES[COMPRESSION_GZIP]):
+        return io.BufferedReader(gzip.GzipFile(fileobj=f, mode="rb"))
+    if name.endswith(COMPRESSION_SUFFIXES[COMPRESSION_ZSTD]):
+        # Buffered so that, like the other readers, it supports readline
+        return io.BufferedReader(import_zstandard().ZstdDecompressor().stream_reader(f))
+    return f
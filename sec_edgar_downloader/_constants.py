@@ -5,8 +5,45 @@ DEFAULT_BEFORE_DATE = date.today()
 DEFAULT_AFTER_DATE = date(1994, 1, 1)
 
 AMENDS_SUFFIX = "/A"
+# Characters that turn a form into a shell-style wildcard, e.g. "SC 13*"
+FORM_WILDCARD_CHARS = "*?["
 
 SEC_REQUESTS_PER_SEC_MAX = 10
+# Responses that mean SEC is throttling requests or briefly unavailable, which
+# are retried after a backoff rather than failing the download
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Number of times a throttled or failed request is retried before giving up
+SEC_MAX_RETRIES = 5
+# Bounds, in seconds, of the jittered exponential backoff between retries
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 60.0
+# Longest Retry-After, in seconds, that is waited for before retrying
+RETRY_AFTER_MAX = 600.0
+# The request rate is halved whenever SEC throttles, down to this floor, and
+# raised by a fraction of a request per second after every successful request
+ADAPTIVE_RATE_MIN = 1.0
+ADAPTIVE_RATE_DECREASE_FACTOR = 0.5
+ADAPTIVE_RATE_INCREASE = 0.1
+# Passes over the filings that failed to download, once all others are done
+FAILED_FILING_RETRY_ROUNDS = 1
+# Number of keep-alive connections kept open per SEC host
+DEFAULT_POOL_SIZE = SEC_REQUESTS_PER_SEC_MAX
+# Size of the chunks in which filing bodies are streamed to disk
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+# Filings queued per download worker while submissions are still being paginated
+DOWNLOAD_QUEUE_SIZE_PER_WORKER = 2
+# Orders in which filings can be downloaded by their size
+SIZE_ORDER_SMALLEST_FIRST = "smallest-first"
+SIZE_ORDER_LARGEST_FIRST = "largest-first"
+SIZE_ORDERS = (SIZE_ORDER_SMALLEST_FIRST, SIZE_ORDER_LARGEST_FIRST)
+# Assumed download bandwidth when estimating how long a download takes
+DEFAULT_ESTIMATE_BYTES_PER_SEC = 10 * 1024 * 1024
+# Formats in which the metadata of filings can be listed: a dict of columns, or
+# an Arrow table or pandas DataFrame, which require pyarrow or pandas
+TABLE_FORMAT_DICT = "dict"
+TABLE_FORMAT_ARROW = "arrow"
+TABLE_FORMAT_PANDAS = "pandas"
+TABLE_FORMATS = (TABLE_FORMAT_DICT, TABLE_FORMAT_ARROW, TABLE_FORMAT_PANDAS)
 
 HOST_WWW_SEC = "www.sec.gov"
 HOST_DATA_SEC = "data.sec.gov"
@@ -16,16 +53,53 @@ URL_FILING = (
     "https://www.sec.gov/Archives/edgar/data/{cik}/{acc_num_no_dash}/{document}"
 )
 URL_SUBMISSIONS = "https://data.sec.gov/submissions/{submission}"
+URL_FULL_INDEX = (
+    "https://www.sec.gov/Archives/edgar/full-index/{year}/QTR{quarter}/master.idx"
+)
+URL_DAILY_INDEX = (
+    "https://www.sec.gov/Archives/edgar/daily-index/{year}/QTR{quarter}/"
+    "master.{date:%Y%m%d}.idx"
+)
 
 SUBMISSION_FILE_FORMAT = "CIK{cik}.json"
+# Index page that lists the documents of a filing with their types and sizes
+FILING_INDEX_FILENAME_FORMAT = "{}-index.htm"
 STANDARD_HEADERS = {
     "Accept-Encoding": "gzip, deflate",
 }
 
+# Cache metadata
+CACHE_FOLDER_NAME = "sec-edgar-downloader"
+TICKER_CACHE_FILENAME = "company_tickers_exchange.json"
+# SEC regenerates the ticker to CIK mapping at most once a day
+DEFAULT_TICKER_CACHE_TTL = 24 * 60 * 60
+SUBMISSIONS_STORE_FILENAME = "submissions.sqlite3"
+
 # Save metadata
 ROOT_SAVE_FOLDER_NAME = "sec-edgar-filings"
+# Manifest of the downloaded documents, kept in ROOT_SAVE_FOLDER_NAME
+MANIFEST_FILENAME = "manifest.sqlite3"
+# Journal of resumable download jobs, kept in ROOT_SAVE_FOLDER_NAME
+JOB_JOURNAL_FILENAME = "jobs.sqlite3"
 FILING_FULL_SUBMISSION_FILENAME = "full-submission.txt"
+# Compression formats in which full submissions can be stored, by suffix
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_SUFFIXES = {
+    COMPRESSION_GZIP: ".gz",
+    COMPRESSION_ZSTD: ".zst",
+}
 PRIMARY_DOC_FILENAME_STEM = "primary-document"
+# Longest run of a full submission that is read at once while splitting it
+SGML_MAX_LINE_LENGTH = 64 * 1024
+# Layouts in which filings are saved: one folder per filing, or one append-only
+# pack per company and form, saved as <ticker or CIK>/<form>.pack
+STORAGE_LAYOUT_FOLDERS = "folders"
+STORAGE_LAYOUT_PACK = "pack"
+STORAGE_LAYOUTS = (STORAGE_LAYOUT_FOLDERS, STORAGE_LAYOUT_PACK)
+PACK_SUFFIX = ".pack"
+PACK_MAGIC = b"SECPACK1"
+PACK_RECORD_MAGIC = b"SECR"
 
 CIK_LENGTH = 10
 
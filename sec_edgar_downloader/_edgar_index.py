@@ -0,0 +1,179 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from ._constants import (
+    AMENDS_SUFFIX,
+    CIK_LENGTH,
+    URL_DAILY_INDEX,
+    URL_FILING,
+    URL_FULL_INDEX,
+)
+from ._job_journal import Job
+from ._manifest import Manifest
+from ._orchestrator import is_limit_reached, match_form, save_filings
+from ._sec_gateway import SecGateway
+from ._storage import StorageBackend
+from ._types import DownloadMetadata, ToDownload
+
+# Separates the header of a master index file from its records
+MASTER_INDEX_HEADER_END = "-----"
+
+
+def get_quarter_bounds(year: int, quarter: int) -> Tuple[date, date]:
+    start = date(year, 3 * quarter - 2, 1)
+    if quarter == 4:
+        return start, date(year, 12, 31)
+    return start, date(year, 3 * quarter + 1, 1) - timedelta(days=1)
+
+
+def get_index_uris(after: date, before: date) -> List[str]:
+    """Return the URIs of the master index files covering a date range, newest first.
+
+    Quarters that lie entirely within the range are read from the quarterly
+    full-index. Partially covered quarters are read from the daily-index files of
+    each weekday in the range, so short ranges only fetch a few small files.
+    """
+    uris: List[str] = []
+    year, quarter = before.year, (before.month - 1) // 3 + 1
+
+    while True:
+        start, end = get_quarter_bounds(year, quarter)
+        if end < after:
+            return uris
+
+        if after <= start and end <= before:
+            uris.append(URL_FULL_INDEX.format(year=year, quarter=quarter))
+        else:
+            day = min(end, before)
+            while day >= max(start, after):
+                # No filings are disseminated on weekends
+                if day.weekday() < 5:
+                    uris.append(
+                        URL_DAILY_INDEX.format(year=year, quarter=quarter, date=day)
+                    )
+                day -= timedelta(days=1)
+
+        year, quarter = (year, quarter - 1) if quarter > 1 else (year - 1, 4)
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Split a stream of chunks into lines without reading the whole stream."""
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            # Index files predate UTF-8 and contain Latin-1 company names
+            yield line.rstrip(b"\r").decode("latin-1")
+
+    if pending:
+        yield pending.decode("latin-1")
+
+
+def parse_master_index(lines: Iterable[str]) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield the CIK, form, filing date and file name of each master index record.
+
+    Records are ``CIK|Company Name|Form Type|Date Filed|Filename``. Filing dates
+    are returned in ISO 8601 format, although daily index files omit the dashes.
+    """
+    lines = iter(lines)
+    for line in lines:
+        if line.startswith(MASTER_INDEX_HEADER_END):
+            break
+
+    for line in lines:
+        fields = line.split("|")
+        if len(fields) < 5:
+            continue
+
+        # Company names may contain the delimiter, so count from both ends
+        cik, form, f_date, filename = fields[0], *fields[-3:]
+        if len(f_date) == 8:
+            f_date = f"{f_date[:4]}-{f_date[4:6]}-{f_date[6:]}"
+        yield cik, form, f_date, filename
+
+
+def iter_index_filings(
+    download_metadata: DownloadMetadata, gateway: SecGateway
+) -> Iterator[ToDownload]:
+    """Yield the filings of all companies that match the requested form and dates.
+
+    Index files are requested newest first and streamed and filtered line by
+    line. Their records are sorted by CIK rather than by date, so the matches of
+    each file are sorted newest first before the limit is applied. Filings are
+    thus yielded newest first, and no further index files are requested once
+    every requested form has reached the limit.
+    """
+    requested_forms: Dict[str, Optional[str]] = {}
+    after = download_metadata.after.isoformat()
+    before = download_metadata.before.isoformat()
+    fetched_counts: Dict[str, int] = {}
+
+    for uri in get_index_uris(download_metadata.after, download_metadata.before):
+        matches = []
+        try:
+            records = parse_master_index(iter_lines(gateway.stream_filing(uri)))
+            for cik, form, f_date, filename in records:
+                # Each distinct form is only matched once
+                if form not in requested_forms:
+                    requested_forms[form] = match_form(download_metadata, form)
+                requested_form = requested_forms[form]
+                if requested_form is not None and after <= f_date <= before:
+                    matches.append((f_date, cik, form, filename, requested_form))
+        except requests.HTTPError as e:
+            # There are no daily index files for holidays
+            if e.response is None or e.response.status_code != HTTPStatus.NOT_FOUND:
+                raise
+
+        # The sort is stable, so filings of the same day keep their index order
+        matches.sort(key=lambda match: match[0], reverse=True)
+        for _, cik, form, filename, requested_form in matches:
+            count = fetched_counts.get(requested_form, 0)
+            if count >= download_metadata.limit:
+                continue
+            fetched_counts[requested_form] = count + 1
+
+            acc_num = PurePosixPath(filename).stem
+            yield ToDownload(
+                URL_FILING.format(
+                    cik=cik,
+                    acc_num_no_dash=acc_num.replace("-", ""),
+                    document=f"{acc_num}.txt",
+                ),
+                # Index files do not list primary documents
+                "",
+                acc_num,
+                "",
+                cik=cik.zfill(CIK_LENGTH),
+                form=form.removesuffix(AMENDS_SUFFIX),
+            )
+
+            if is_limit_reached(download_metadata, fetched_counts):
+                return
+
+
+def crawl_and_save_filings(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    max_workers: int = 1,
+    manifest: Optional[Manifest] = None,
+    job: Optional[Job] = None,
+    storage: Optional[StorageBackend] = None,
+) -> Dict[str, int]:
+    """Download the filings of all companies listed in the EDGAR index files.
+
+    :return: number of filings downloaded for each form.
+    """
+    return save_filings(
+        download_metadata,
+        gateway,
+        iter_index_filings(download_metadata, gateway),
+        max_workers,
+        manifest,
+        job,
+        storage,
+    )
@@ -0,0 +1,129 @@
+from fnmatch import fnmatchcase
+from html.parser import HTMLParser
+from pathlib import PurePosixPath
+from typing import Iterable, List, Optional, Tuple
+
+from ._constants import FILING_INDEX_FILENAME_FORMAT
+from ._sec_gateway import SecGateway
+from ._storage import StorageBackend
+from ._types import DownloadMetadata, FilingIndexDocument, ToDownload
+
+# Class of the document tables of a filing index page
+FILING_INDEX_TABLE_CLASS = "tableFile"
+
+
+class FilingIndexParser(HTMLParser):
+    """Collects the rows of the document tables of a filing index page.
+
+    Each row of a table holds the sequence, description, document link, type
+    and size of a document of the filing.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: List[Tuple[List[str], Optional[str]]] = []
+        self._in_table = False
+        self._cells: Optional[List[str]] = None
+        self._href: Optional[str] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        if tag == "table":
+            classes = (attributes.get("class") or "").split()
+            self._in_table = FILING_INDEX_TABLE_CLASS in classes
+        elif not self._in_table:
+            return
+        elif tag == "tr":
+            self._cells, self._href = [], None
+        elif tag == "td" and self._cells is not None:
+            self._cells.append("")
+        elif tag == "a" and self._href is None:
+            self._href = attributes.get("href")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "table":
+            self._in_table = False
+        elif tag == "tr" and self._cells:
+            self.rows.append((self._cells, self._href))
+            self._cells = None
+
+    def handle_data(self, data: str) -> None:
+        if self._in_table and self._cells:
+            self._cells[-1] += data
+
+
+def parse_filing_index(html: str) -> List[FilingIndexDocument]:
+    parser = FilingIndexParser()
+    parser.feed(html)
+    parser.close()
+
+    documents = []
+    for cells, href in parser.rows:
+        # Header rows have no cells, and rows without a link have no document
+        if len(cells) < 5 or href is None:
+            continue
+        sequence, description, _, doc_type, size = (c.strip() for c in cells[:5])
+        size = size.replace(",", "")
+        documents.append(
+            FilingIndexDocument(
+                # Inline XBRL documents are linked through the XBRL viewer
+                filename=PurePosixPath(href.split("?doc=")[-1]).name,
+                type=doc_type,
+                description=description,
+                sequence=sequence or None,
+                size=int(size) if size.isdigit() else None,
+            )
+        )
+    return documents
+
+
+def get_document_uri(td: ToDownload, filename: str) -> str:
+    # All documents of a filing live next to its full submission
+    return f"{td.raw_filing_uri.rsplit('/', 1)[0]}/{filename}"
+
+
+def get_filing_index_uri(td: ToDownload) -> str:
+    return get_document_uri(
+        td, FILING_INDEX_FILENAME_FORMAT.format(td.accession_number)
+    )
+
+
+def select_documents(
+    download_metadata: DownloadMetadata, documents: Iterable[FilingIndexDocument]
+) -> List[FilingIndexDocument]:
+    """Return the documents that match all document filters of a download."""
+    document_types = [t.upper() for t in download_metadata.document_types]
+    selected = []
+    for document in documents:
+        if document_types and not any(
+            fnmatchcase(document.type.upper(), t) for t in document_types
+        ):
+            continue
+        if download_metadata.document_filename is not None and not fnmatchcase(
+            document.filename, download_metadata.document_filename
+        ):
+            continue
+        if download_metadata.max_document_size is not None and (
+            document.size is None or document.size > download_metadata.max_document_size
+        ):
+            continue
+        selected.append(document)
+    return selected
+
+
+def load_filing_index(
+    gateway: SecGateway, td: ToDownload, storage: StorageBackend, key: str
+) -> List[FilingIndexDocument]:
+    """Return the documents listed in the filing index of a filing.
+
+    The index page is saved to ``storage`` under ``key`` when it is first
+    fetched, so that documents are selected again from the saved copy, without
+    any request, when the filing is downloaded again.
+    """
+    if storage.exists(key):
+        with storage.open(key) as f:
+            html = f.read()
+    else:
+        html = gateway.download_filing(get_filing_index_uri(td))
+        storage.write_stream(key, [html])
+    return parse_filing_index(html.decode("utf-8", errors="replace"))
@@ -0,0 +1,207 @@
+import json
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from dataclasses import asdict, astuple, dataclass, fields
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from ._types import DownloadMetadata, Forms, ToDownload
+
+# Columns of the planned filings of a job, in ToDownload field order
+ITEM_COLUMNS = [f.name for f in fields(ToDownload)]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    form TEXT NOT NULL,
+    download_metadata TEXT NOT NULL,
+    planned INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS items (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    {", ".join(ITEM_COLUMNS)},
+    done INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (job_id, seq),
+    UNIQUE (job_id, accession_number)
+);
+"""
+
+# Kinds of jobs, which determine how the filings of an unplanned job are found
+JOB_KIND_GET = "get"
+JOB_KIND_CRAWL = "crawl"
+
+
+def encode_form(form: Forms) -> str:
+    # A collection of forms is kept apart from a single form, as they are
+    # summarized differently
+    return json.dumps(form if isinstance(form, str) else list(form))
+
+
+def encode_download_metadata(download_metadata: DownloadMetadata) -> str:
+    encoded = asdict(download_metadata)
+    encoded["download_folder"] = str(download_metadata.download_folder)
+    encoded["after"] = download_metadata.after.isoformat()
+    encoded["before"] = download_metadata.before.isoformat()
+    for name in ("report_after", "report_before"):
+        if encoded[name] is not None:
+            encoded[name] = encoded[name].isoformat()
+    if download_metadata.accession_numbers_to_skip is not None:
+        encoded["accession_numbers_to_skip"] = sorted(
+            download_metadata.accession_numbers_to_skip
+        )
+    return json.dumps(encoded)
+
+
+def decode_download_metadata(encoded: str) -> DownloadMetadata:
+    decoded = json.loads(encoded)
+    decoded["download_folder"] = Path(decoded["download_folder"])
+    decoded["after"] = date.fromisoformat(decoded["after"])
+    decoded["before"] = date.fromisoformat(decoded["before"])
+    if decoded["accession_numbers_to_skip"] is not None:
+        decoded["accession_numbers_to_skip"] = set(decoded["accession_numbers_to_skip"])
+    decoded["forms"] = tuple(decoded["forms"])
+    decoded["document_types"] = tuple(decoded["document_types"])
+    decoded["items"] = tuple(decoded["items"])
+    for name in ("report_after", "report_before"):
+        if decoded[name] is not None:
+            decoded[name] = date.fromisoformat(decoded[name])
+    return DownloadMetadata(**decoded)
+
+
+class JobJournal:
+    """SQLite journal of download jobs that can be resumed after a crash.
+
+    A job records its download metadata, every filing it plans to download, in
+    order, and which of them were saved. All filings are recorded before any of
+    them is downloaded, so a job that stops while downloading can be resumed
+    from the journal alone, without any metadata requests. The database is only
+    created once it is first used.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection whose changes are committed as one transaction.
+
+        A connection is opened per operation so that the journal can be shared
+        across threads.
+        """
+        with self._lock:
+            if not self._initialized:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with closing(sqlite3.connect(self.path)) as conn:
+                    conn.executescript(SCHEMA)
+                self._initialized = True
+
+        with closing(sqlite3.connect(self.path)) as conn:
+            with conn:
+                yield conn
+
+    def create_job(
+        self,
+        job_id: str,
+        kind: str,
+        download_metadata: DownloadMetadata,
+        form: Forms,
+    ) -> "Job":
+        """Record a new job.
+
+        :param form: form argument of the call that started the job, so that its
+            result can be summarized the same way when it is resumed.
+        """
+        with self.connect() as conn:
+            try:
+                conn.execute(
+                    "INSERT INTO jobs (job_id, kind, form, download_metadata) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        job_id,
+                        kind,
+                        encode_form(form),
+                        encode_download_metadata(download_metadata),
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(
+                    f"Job {job_id!r} already exists. "
+                    "Please resume it or choose another job ID."
+                ) from None
+
+        return Job(self, job_id, kind, download_metadata, form, False)
+
+    def get_job(self, job_id: str) -> "Job":
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT kind, download_metadata, form, planned FROM jobs "
+                "WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+
+        if row is None:
+            raise ValueError(
+                f"Job {job_id!r} does not exist. Please enter the ID of a started job."
+            )
+
+        kind, download_metadata, form, planned = row
+        return Job(
+            self,
+            job_id,
+            kind,
+            decode_download_metadata(download_metadata),
+            json.loads(form),
+            bool(planned),
+        )
+
+
+@dataclass
+class Job:
+    journal: JobJournal
+    job_id: str
+    kind: str
+    download_metadata: DownloadMetadata
+    form: Forms
+    # Whether every filing of the job has been recorded
+    planned: bool
+
+    def plan(self, to_download: Iterable[ToDownload]) -> None:
+        """Record all filings of the job and mark it as planned.
+
+        All filings are found before any is recorded, so the journal is not
+        locked while they are looked up, and a job that is interrupted while
+        its filings are being found has none recorded.
+        """
+        items = [(self.job_id, seq, *astuple(td)) for seq, td in enumerate(to_download)]
+        with self.journal.connect() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO items "
+                f"(job_id, seq, {', '.join(ITEM_COLUMNS)}) "
+                f"VALUES (?, ?{', ?' * len(ITEM_COLUMNS)})",
+                items,
+            )
+            conn.execute("UPDATE jobs SET planned = 1 WHERE job_id = ?", (self.job_id,))
+        self.planned = True
+
+    def complete(self, td: ToDownload) -> None:
+        with self.journal.connect() as conn:
+            conn.execute(
+                "UPDATE items SET done = 1 WHERE job_id = ? AND accession_number = ?",
+                (self.job_id, td.accession_number),
+            )
+
+    def get_pending(self) -> List[ToDownload]:
+        """Return the planned filings that were not saved yet, in planned order."""
+        with self.journal.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(ITEM_COLUMNS)} FROM items "
+                "WHERE job_id = ? AND done = 0 ORDER BY seq",
+                (self.job_id,),
+            ).fetchall()
+        return [ToDownload(*row) for row in rows]
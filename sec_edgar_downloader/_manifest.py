@@ -0,0 +1,240 @@
+import hashlib
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional
+
+from ._constants import PACK_SUFFIX
+from ._pack import open_pack
+from ._types import DownloadedDocument
+from ._utils import is_cik
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    accession_number TEXT NOT NULL,
+    cik TEXT,
+    form TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    downloaded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_by_accession_number
+    ON documents (accession_number);
+CREATE INDEX IF NOT EXISTS documents_by_cik ON documents (cik, form);
+"""
+
+# Size of the chunks in which existing documents are hashed while rebuilding
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class Manifest:
+    """SQLite manifest of the documents saved under a filings folder.
+
+    Every document that was completely written is recorded along with its
+    accession number, CIK, form, size, SHA-256 checksum and download time, so
+    deciding whether a filing was already downloaded is an indexed query rather
+    than a ``stat`` per document. Paths are stored relative to ``root``.
+
+    The database is only created once it is first used, and starts out empty
+    even if ``root`` already holds documents, since hashing them all would read
+    the whole folder. Existing documents are recorded as downloads come across
+    them, or all at once by :meth:`rebuild`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.root = path.parent
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection whose changes are committed as one transaction.
+
+        A connection is opened per operation so that the manifest can be shared
+        across threads.
+        """
+        with self._lock:
+            if not self._initialized:
+                self._initialize()
+
+        with closing(sqlite3.connect(self.path)) as conn:
+            with conn:
+                yield conn
+
+    def _initialize(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as conn:
+            conn.executescript(SCHEMA)
+        self._initialized = True
+
+    def relative_path(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def get_downloaded_sizes(self, paths: Iterable[Path]) -> Dict[Path, int]:
+        """Return the recorded size of each given document that was downloaded."""
+        relative_paths = {self.relative_path(path): path for path in paths}
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT path, size FROM documents "
+                f"WHERE path IN ({', '.join('?' * len(relative_paths))})",
+                list(relative_paths),
+            )
+            return {relative_paths[path]: size for path, size in rows}
+
+    def record(
+        self,
+        path: Path,
+        accession_number: str,
+        cik: Optional[str],
+        form: str,
+        size: int,
+        sha256: str,
+        downloaded_at: Optional[datetime] = None,
+    ) -> None:
+        if downloaded_at is None:
+            downloaded_at = datetime.now(timezone.utc)
+
+        with self.connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(path, accession_number, cik, form, size, sha256, downloaded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.relative_path(path),
+                    accession_number,
+                    cik,
+                    form,
+                    size,
+                    sha256,
+                    downloaded_at.isoformat(),
+                ),
+            )
+
+    def is_downloaded(self, accession_number: str) -> bool:
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM documents WHERE accession_number = ?",
+                (accession_number,),
+            )
+            return row.fetchone() is not None
+
+    def list_downloaded(
+        self, cik: Optional[str] = None, form: Optional[str] = None
+    ) -> List[DownloadedDocument]:
+        """Return the downloaded documents, optionally only of a CIK and/or form."""
+        conditions, params = [], []
+        if cik is not None:
+            conditions.append("cik = ?")
+            params.append(cik)
+        if form is not None:
+            conditions.append("form = ?")
+            params.append(form)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        with self.connect() as conn:
+            rows = conn.execute(
+                "SELECT path, accession_number, cik, form, size, sha256, downloaded_at "
+                f"FROM documents {where}ORDER BY path",
+                params,
+            ).fetchall()
+
+        return [
+            DownloadedDocument(
+                self.root / path,
+                accession_number,
+                cik,
+                form,
+                size,
+                sha256,
+                datetime.fromisoformat(downloaded_at),
+            )
+            for path, accession_number, cik, form, size, sha256, downloaded_at in rows
+        ]
+
+    def rebuild(self) -> int:
+        """Replace the manifest with the documents found under ``root``.
+
+        Documents are expected at ``<ticker or CIK>/<form>/<accession number>/``,
+        or in packs at ``<ticker or CIK>/<form>.pack``. The CIK of documents
+        saved under a ticker is unknown, and their download time is taken to be
+        the modification time of their file or pack.
+
+        :return: number of documents recorded.
+        """
+        with self.connect() as conn:
+            conn.execute("DELETE FROM documents")
+            num_documents = 0
+            for path in sorted(self.root.glob("*/*/*/*")):
+                # Skip in-progress temporary files
+                if not path.is_file() or path.name.startswith("."):
+                    continue
+
+                company, form, accession_number = path.parent.relative_to(
+                    self.root
+                ).parts
+                stat = path.stat()
+                conn.execute(
+                    "INSERT INTO documents "
+                    "(path, accession_number, cik, form, size, sha256, downloaded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.relative_path(path),
+                        accession_number,
+                        company if is_cik(company) else None,
+                        form,
+                        stat.st_size,
+                        hash_file(path),
+                        datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+                    ),
+                )
+                num_documents += 1
+
+            for pack_path in sorted(self.root.glob(f"*/*{PACK_SUFFIX}")):
+                company, form = pack_path.parent.name, pack_path.stem
+                pack = open_pack(pack_path)
+                downloaded_at = datetime.fromtimestamp(
+                    pack_path.stat().st_mtime, timezone.utc
+                )
+                for document in pack.list_documents():
+                    with pack.open(document.accession_number, document.name) as f:
+                        sha256 = hash_fileobj(f)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO documents "
+                        "(path, accession_number, cik, form, size, sha256, downloaded_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            f"{company}/{form}/{document.accession_number}/{document.name}",
+                            document.accession_number,
+                            company if is_cik(company) else None,
+                            form,
+                            document.size,
+                            sha256,
+                            downloaded_at.isoformat(),
+                        ),
+                    )
+                    num_documents += 1
+
+            return num_documents
+
+
+def hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hash_fileobj(f)
+
+
+def hash_fileobj(f: IO[bytes]) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_hashed(chunks: Iterable[bytes], digest: "hashlib._Hash") -> Iterator[bytes]:
+    """Pass chunks through, feeding each one to ``digest`` on the way."""
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
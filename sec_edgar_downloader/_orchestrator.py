@@ -1,24 +1,66 @@
-from collections import deque
+import hashlib
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import replace
+from datetime import date
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from ._constants import (
     AMENDS_SUFFIX,
     CIK_LENGTH,
+    COMPRESSION_SUFFIXES,
+    DEFAULT_TICKER_CACHE_TTL,
+    DOWNLOAD_QUEUE_SIZE_PER_WORKER,
+    FAILED_FILING_RETRY_ROUNDS,
     FILING_FULL_SUBMISSION_FILENAME,
+    FILING_INDEX_FILENAME_FORMAT,
+    HOST_DATA_SEC,
+    HOST_WWW_SEC,
     PRIMARY_DOC_FILENAME_STEM,
     ROOT_SAVE_FOLDER_NAME,
+    STORAGE_LAYOUT_FOLDERS,
+    STORAGE_LAYOUT_PACK,
     SUBMISSION_FILE_FORMAT,
+    URL_CIK_MAPPING,
     URL_FILING,
     URL_SUBMISSIONS,
 )
-from ._sec_gateway import (
-    download_filing,
-    get_list_of_available_filings,
-    get_ticker_metadata,
-)
+from ._filing_index import get_document_uri, load_filing_index, select_documents
+from ._job_journal import Job
+from ._manifest import Manifest, hash_fileobj, iter_hashed
+from ._planner import plan_filings
+from ._sec_gateway import SecGateway
+from ._storage import LocalStorage, PackStorage, StorageBackend, save_document
+from ._submissions_store import SubmissionsStore
+from ._ticker_cache import encode_ticker_cache, is_fresh, read_ticker_cache
 from ._types import DownloadMetadata, ToDownload
-from ._utils import within_requested_date_range
+from ._utils import (
+    has_document_filters,
+    is_form_wildcard,
+    overlaps_requested_date_range,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def get_save_location(
@@ -31,6 +73,11 @@ def get_save_location(
         if download_metadata.ticker is not None
         else download_metadata.cik
     )
+    if (
+        save_filename == FILING_FULL_SUBMISSION_FILENAME
+        and download_metadata.compression is not None
+    ):
+        save_filename += COMPRESSION_SUFFIXES[download_metadata.compression]
     return (
         download_metadata.download_folder
         / ROOT_SAVE_FOLDER_NAME
@@ -41,71 +88,360 @@ def get_save_location(
     )
 
 
-def save_document(filing_contents: Any, save_path: Path) -> None:
-    # TODO: resolve URLs so that images show up in HTML files?
-    # Create all parent directories as needed and write content to file
-    save_path.parent.mkdir(parents=True, exist_ok=True)
-    save_path.write_bytes(filing_contents)
+def get_storage_key(download_metadata: DownloadMetadata, save_location: Path) -> str:
+    """Return the storage backend key of a document saved at ``save_location``."""
+    root = download_metadata.download_folder / ROOT_SAVE_FOLDER_NAME
+    return save_location.relative_to(root).as_posix()
+
+
+def get_storage(
+    download_metadata: DownloadMetadata, storage: Optional[StorageBackend] = None
+) -> StorageBackend:
+    """Return the backend to save documents to, by default the download folder."""
+    if storage is not None:
+        return storage
+    root = download_metadata.download_folder / ROOT_SAVE_FOLDER_NAME
+    if download_metadata.layout == STORAGE_LAYOUT_PACK:
+        return PackStorage(root)
+    return LocalStorage(root)
 
 
 def aggregate_filings_to_download(
-    download_metadata: DownloadMetadata, user_agent: str
+    download_metadata: DownloadMetadata, gateway: SecGateway
+) -> List[ToDownload]:
+    return list(iter_filings_to_download(download_metadata, gateway))
+
+
+def aggregate_filings_from_store(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    store: SubmissionsStore,
+    refresh: bool = True,
+    concurrent_pages: bool = True,
 ) -> List[ToDownload]:
-    filings_to_download: List[ToDownload] = []
-    fetched_count = 0
+    """Return the requested filings from the stored filing history of the CIK.
+
+    Without ``refresh``, CIKs that are already in the store are answered
+    without any requests.
+    """
+    return filter_filings_page(
+        download_metadata,
+        get_stored_filings(
+            download_metadata.cik, gateway, store, refresh, concurrent_pages
+        ),
+        {},
+    )
+
+
+def get_stored_filings(
+    cik: str,
+    gateway: SecGateway,
+    store: SubmissionsStore,
+    refresh: bool = True,
+    concurrent_pages: bool = True,
+) -> Dict[str, List[Any]]:
+    """Return the stored filing history of a CIK, refreshing it first if needed."""
+    if refresh or not store.has_company(cik):
+        refresh_submissions(cik, gateway, store, concurrent_pages)
+    return store.get_filings(cik)
+
+
+def refresh_submissions(
+    cik: str,
+    gateway: SecGateway,
+    store: SubmissionsStore,
+    concurrent_pages: bool = True,
+) -> None:
+    """Bring the stored filing history of a CIK up to date.
+
+    Only the first submissions page is requested, with a conditional request, so
+    an unchanged history costs a bodiless 304. Otherwise its recent filings are
+    merged into the store, along with any historical pages that were not merged
+    yet. Historical pages never change, so they are never fetched twice.
+    """
     submissions_uri = URL_SUBMISSIONS.format(
-        submission=SUBMISSION_FILE_FORMAT.format(cik=download_metadata.cik)
+        submission=SUBMISSION_FILE_FORMAT.format(cik=cik)
+    )
+    etag, last_modified = store.get_validators(cik)
+    resp = gateway.get_if_modified(
+        submissions_uri, HOST_DATA_SEC, etag=etag, last_modified=last_modified
     )
-    additional_submissions = None
+    if resp is None:
+        return
 
-    while fetched_count < download_metadata.limit:
-        resp_json = get_list_of_available_filings(submissions_uri, user_agent)
-        # First API response is different from further API responses
-        if additional_submissions is None:
-            filings_json = resp_json["filings"]["recent"]
-            additional_submissions = deque(resp_json["filings"]["files"])
-        # On second page or more of API response (for companies with >1000 filings)
-        else:
-            filings_json = resp_json
-
-        accession_numbers = filings_json["accessionNumber"]
-        forms = filings_json["form"]
-        documents = filings_json["primaryDocument"]
-        filing_dates = filings_json["filingDate"]
-
-        for acc_num, form, doc, f_date in zip(  # noqa: B905
-            accession_numbers, forms, documents, filing_dates
-        ):
-            is_amend = form.endswith(AMENDS_SUFFIX)
-            form = form[:-2] if is_amend else form
-            if (
-                form != download_metadata.form
-                or (not download_metadata.include_amends and is_amend)
-                or not within_requested_date_range(download_metadata, f_date)
-            ):
-                continue
+    resp_json = resp.json()
+    merged_pages = store.get_merged_pages(cik)
+    new_pages = [
+        f["name"]
+        for f in resp_json["filings"]["files"]
+        if f["name"] not in merged_pages
+    ]
+    pages = fetch_submissions_pages(
+        gateway,
+        [URL_SUBMISSIONS.format(submission=name) for name in new_pages],
+        concurrent_pages,
+    )
+
+    # Validators are only stored along with the filings, so a failed refresh is
+    # retried in full next time
+    with store.connect() as conn:
+        store.merge(conn, cik, resp_json["filings"]["recent"])
+        for name, page in zip(new_pages, pages):  # noqa: B905
+            store.merge(conn, cik, page, name)
+        store.set_validators(
+            conn, cik, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        )
+
+
+def fetch_submissions_pages(
+    gateway: SecGateway, uris: List[str], concurrent: bool = True
+) -> List[Any]:
+    """Fetch submissions pages and return them in order.
+
+    If ``concurrent``, at most ``gateway.pool_size`` pages are in flight at once.
+    Otherwise they are fetched one at a time, e.g. by a caller that already runs
+    on a pool of its own. Every request goes through the global SEC rate limiter.
+    """
+    if not concurrent:
+        return [gateway.get_list_of_available_filings(uri) for uri in uris]
+    if not uris:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(gateway.pool_size, len(uris))) as executor:
+        return list(executor.map(gateway.get_list_of_available_filings, uris))
+
+
+def iter_filings_to_download(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    concurrent_pages: bool = True,
+) -> Iterator[ToDownload]:
+    """Yield matching filings page by page, newest first."""
+    for filings_json, rows in iter_matching_pages(
+        download_metadata, gateway, concurrent_pages
+    ):
+        yield from get_filings_to_download(download_metadata, filings_json, rows)
+
+
+def iter_matching_pages(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    concurrent_pages: bool = True,
+) -> Iterator[Tuple[Dict[str, Any], List[int]]]:
+    """Yield each submissions page with its rows that match, newest first.
+
+    The first submissions response lists the names and date spans of all
+    additional pages (for companies with >1000 filings). Pages outside of the
+    requested date range are skipped, and the rest are fetched in windows of
+    ``gateway.pool_size`` pages, concurrently unless ``concurrent_pages`` is
+    unset. Every request goes through the
+    global SEC rate limiter, and a window is only requested if the limit has
+    not been reached yet.
+    """
+    fetched_counts: Dict[str, int] = {}
+    submissions_uri = URL_SUBMISSIONS.format(
+        submission=SUBMISSION_FILE_FORMAT.format(cik=download_metadata.cik)
+    )
+    resp_json = gateway.get_list_of_available_filings(submissions_uri)
+    # First API response is different from further API responses
+    pages = [resp_json["filings"]["recent"]]
+    additional_submissions = get_additional_submissions(download_metadata, resp_json)
 
-            filings_to_download.append(
-                get_to_download(download_metadata.cik, acc_num, doc)
+    while True:
+        for filings_json in pages:
+            yield filings_json, filter_filings_rows(
+                download_metadata, filings_json, fetched_counts
             )
 
-            fetched_count += 1
+            # We have reached the requested download limit, so stop early
+            if is_limit_reached(download_metadata, fetched_counts):
+                return
 
-            # We have reached the requested download limit, so break inner for loop
-            # early and allow the outer while loop to break.
-            if fetched_count == download_metadata.limit:
-                break
+        if not additional_submissions:
+            return
+
+        window = additional_submissions[: gateway.pool_size]
+        additional_submissions = additional_submissions[gateway.pool_size :]
+        # Results are merged in page order regardless of completion order
+        pages = fetch_submissions_pages(gateway, window, concurrent_pages)
 
-        if len(additional_submissions) == 0:
+
+def get_additional_submissions(
+    download_metadata: DownloadMetadata, resp_json: Dict[str, Any]
+) -> List[str]:
+    """Return the URIs of the additional submissions pages worth fetching.
+
+    Each page lists the span of filing dates it covers, so pages that lie
+    entirely outside of the requested date range are skipped without a request.
+    """
+    return [
+        URL_SUBMISSIONS.format(submission=f["name"])
+        for f in resp_json["filings"]["files"]
+        if overlaps_requested_date_range(
+            download_metadata, f.get("filingFrom"), f.get("filingTo")
+        )
+    ]
+
+
+def match_form(download_metadata: DownloadMetadata, form: str) -> Optional[str]:
+    """Return the requested form or form wildcard that a filing's form matches."""
+    if form.endswith(AMENDS_SUFFIX):
+        if not download_metadata.include_amends:
+            return None
+        form = form[: -len(AMENDS_SUFFIX)]
+
+    return next((f for f in download_metadata.forms if fnmatchcase(form, f)), None)
+
+
+def is_limit_reached(
+    download_metadata: DownloadMetadata, fetched_counts: Dict[str, int]
+) -> bool:
+    return len(fetched_counts) == len(download_metadata.forms) and all(
+        count >= download_metadata.limit for count in fetched_counts.values()
+    )
+
+
+def filter_filings_page(
+    download_metadata: DownloadMetadata,
+    filings_json: Dict[str, Any],
+    fetched_counts: Dict[str, int],
+) -> List[ToDownload]:
+    """Return the filings in a submissions page that match the request."""
+    rows = filter_filings_rows(download_metadata, filings_json, fetched_counts)
+    return get_filings_to_download(download_metadata, filings_json, rows)
+
+
+def filter_filings_rows(
+    download_metadata: DownloadMetadata,
+    filings_json: Dict[str, Any],
+    fetched_counts: Dict[str, int],
+) -> List[int]:
+    """Return the rows of the filings in a submissions page that match the request.
+
+    ``fetched_counts`` holds the number of filings found so far for each
+    requested form, and is updated in place, so that every requested form stops
+    at the limit independently.
+
+    The page is filtered as a columnar batch: only the form and filing date
+    columns are scanned, matching each distinct form just once and comparing
+    dates as ISO 8601 strings, so that no row is parsed. The metadata filters
+    are only evaluated for the matching rows.
+    """
+    forms = filings_json["form"]
+    # Distinct forms of the page that match a requested form, and the form they match
+    requested_forms: Dict[str, str] = {}
+    for form in set(forms):
+        requested_form = match_form(download_metadata, form)
+        if requested_form is not None:
+            requested_forms[form] = requested_form
+    after = download_metadata.after.isoformat()
+    before = download_metadata.before.isoformat()
+    predicates = get_metadata_predicates(download_metadata, filings_json)
+
+    matches = (
+        i
+        for i, (form, f_date) in enumerate(
+            zip(forms, filings_json["filingDate"])  # noqa: B905
+        )
+        if form in requested_forms
+        and after <= f_date <= before
+        and all(predicate(i) for predicate in predicates)
+    )
+
+    rows = []
+    for i in matches:
+        requested_form = requested_forms[forms[i]]
+        count = fetched_counts.get(requested_form, 0)
+        if count >= download_metadata.limit:
+            continue
+
+        fetched_counts[requested_form] = count + 1
+        rows.append(i)
+
+        # We have reached the requested download limit, so stop early
+        if is_limit_reached(download_metadata, fetched_counts):
             break
 
-        next_page = additional_submissions.popleft()["name"]
-        submissions_uri = URL_SUBMISSIONS.format(submission=next_page)
+    return rows
+
+
+def get_filings_to_download(
+    download_metadata: DownloadMetadata, filings_json: Dict[str, Any], rows: List[int]
+) -> List[ToDownload]:
+    # The remaining columns are only read for the matching rows
+    forms = filings_json["form"]
+    accession_numbers = filings_json["accessionNumber"]
+    documents = filings_json["primaryDocument"]
+    sizes = filings_json.get("size")
+    return [
+        get_to_download(
+            download_metadata.cik,
+            accession_numbers[i],
+            documents[i],
+            forms[i].removesuffix(AMENDS_SUFFIX),
+            sizes[i] if sizes is not None else None,
+        )
+        for i in rows
+    ]
+
+
+def get_metadata_predicates(
+    download_metadata: DownloadMetadata, filings_json: Dict[str, Any]
+) -> List[Callable[[int], bool]]:
+    """Return a predicate over the rows of a submissions page per metadata filter.
+
+    Filings that lack the metadata a filter looks at, e.g. the report date of a
+    form that has none, do not match the filter.
+    """
+    num_filings = len(filings_json["accessionNumber"])
+
+    def get_column(name: str) -> List[Any]:
+        return filings_json.get(name) or [None] * num_filings
 
-    return filings_to_download
+    def has_flag(name: str, flag: bool) -> Callable[[int], bool]:
+        values = get_column(name)
+        return lambda i: values[i] is not None and bool(values[i]) == flag
 
+    predicates = []
+    if download_metadata.items:
+        requested_items = set(download_metadata.items)
+        items = get_column("items")
+        predicates.append(
+            lambda i: bool(items[i])
+            and any(item.strip() in requested_items for item in items[i].split(","))
+        )
+    if download_metadata.is_xbrl is not None:
+        predicates.append(has_flag("isXBRL", download_metadata.is_xbrl))
+    if download_metadata.is_inline_xbrl is not None:
+        predicates.append(has_flag("isInlineXBRL", download_metadata.is_inline_xbrl))
+    if (
+        download_metadata.report_after is not None
+        or download_metadata.report_before is not None
+    ):
+        report_after = (download_metadata.report_after or date.min).isoformat()
+        report_before = (download_metadata.report_before or date.max).isoformat()
+        report_dates = get_column("reportDate")
+        predicates.append(
+            lambda i: bool(report_dates[i])
+            and report_after <= report_dates[i] <= report_before
+        )
+    if download_metadata.primary_doc_description is not None:
+        pattern = download_metadata.primary_doc_description.upper()
+        descriptions = get_column("primaryDocDescription")
+        predicates.append(
+            lambda i: descriptions[i] is not None
+            and fnmatchcase(descriptions[i].upper(), pattern)
+        )
+    return predicates
 
-def get_to_download(cik: str, acc_num: str, doc: str) -> ToDownload:
+
+def get_to_download(
+    cik: str,
+    acc_num: str,
+    doc: str,
+    form: Optional[str] = None,
+    size: Optional[int] = None,
+) -> ToDownload:
     cik = cik.lstrip("0")
     acc_num_no_dash = acc_num.replace("-", "")
     raw_filing_uri = URL_FILING.format(
@@ -124,53 +460,504 @@ def get_to_download(cik: str, acc_num: str, doc: str) -> ToDownload:
         primary_doc_uri,
         acc_num,
         primary_doc_suffix,
+        form=form,
+        size=size,
     )
 
 
-def fetch_and_save_filings(download_metadata: DownloadMetadata, user_agent: str) -> int:
-    successfully_downloaded = 0
-    to_download = aggregate_filings_to_download(download_metadata, user_agent)
-    if download_metadata.accession_numbers_to_skip is not None:
-        to_download = [
-            td
-            for td in to_download
-            if td.accession_number not in download_metadata.accession_numbers_to_skip
-        ]
+def fetch_and_save_filing(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    td: ToDownload,
+    manifest: Optional[Manifest] = None,
+    storage: Optional[StorageBackend] = None,
+) -> bool:
+    """Download and save a single filing, returning whether it succeeded.
 
-    for td in to_download:
-        try:
-            save_location = get_save_location(
-                download_metadata, td.accession_number, FILING_FULL_SUBMISSION_FILENAME
-            )
-            if not save_location.exists():
-                raw_filing = download_filing(td.raw_filing_uri, user_agent)
-                save_document(raw_filing, save_location)
+    Documents are saved to the ``storage`` backend under their path relative to
+    ``sec-edgar-filings``. It defaults to the download folder, in the layout of
+    the download. If a ``manifest`` is given, documents that it records as
+    downloaded are skipped, and newly saved documents are recorded in it. So
+    are documents that it does not record but that the backend already holds,
+    e.g. saved by the asyncio engine. Without a manifest, documents that the
+    backend already holds are skipped.
+
+    If any document filters are set, the documents listed in the filing index
+    that match the filters are saved under their own filenames. The filing index
+    is saved along with them, so that re-runs do not request it again.
+
+    A full submission that is smaller than the size listed in the submissions
+    is considered truncated and downloaded again.
+    """
+    if td.cik is not None:
+        # Filings of several companies are each saved under their own CIK
+        download_metadata = replace(download_metadata, cik=td.cik, ticker=None)
+    if td.form is not None:
+        # Filings of several forms are each saved under their own form
+        download_metadata = replace(download_metadata, form=td.form)
 
-            if download_metadata.download_details:
-                primary_doc_filename = (
-                    f"{PRIMARY_DOC_FILENAME_STEM}{td.details_doc_suffix}"
+    backend = get_storage(download_metadata, storage)
+    # Size that a complete full submission has on disk, to detect truncated
+    # files. Compressed and packed submissions are only ever saved whole.
+    full_submission_size = (
+        td.size
+        if download_metadata.compression is None
+        and download_metadata.layout == STORAGE_LAYOUT_FOLDERS
+        else None
+    )
+
+    try:
+        documents = []
+        if download_metadata.download_full_submission:
+            documents.append(
+                (
+                    td.raw_filing_uri,
+                    get_save_location(
+                        download_metadata,
+                        td.accession_number,
+                        FILING_FULL_SUBMISSION_FILENAME,
+                    ),
+                    download_metadata.compression,
+                    full_submission_size,
                 )
-                save_location = get_save_location(
-                    download_metadata, td.accession_number, primary_doc_filename
+            )
+        if download_metadata.download_details:
+            primary_doc_filename = f"{PRIMARY_DOC_FILENAME_STEM}{td.details_doc_suffix}"
+            documents.append(
+                (
+                    td.primary_doc_uri,
+                    get_save_location(
+                        download_metadata, td.accession_number, primary_doc_filename
+                    ),
+                    None,
+                    None,
                 )
-                if not save_location.exists():
-                    primary_doc = download_filing(td.primary_doc_uri, user_agent)
-                    save_document(primary_doc, save_location)
-        except Exception as e:
-            print(
-                "Error occurred while downloading filing for accession number {}: {}",
+            )
+        if has_document_filters(download_metadata):
+            # Only the documents of the filing that match the filters are fetched
+            index_location = get_save_location(
+                download_metadata,
                 td.accession_number,
-                e,
+                FILING_INDEX_FILENAME_FORMAT.format(td.accession_number),
             )
-            continue
+            filing_index = load_filing_index(
+                gateway,
+                td,
+                backend,
+                get_storage_key(download_metadata, index_location),
+            )
+            for document in select_documents(download_metadata, filing_index):
+                documents.append(
+                    (
+                        get_document_uri(td, document.filename),
+                        get_save_location(
+                            download_metadata, td.accession_number, document.filename
+                        ),
+                        None,
+                        None,
+                    )
+                )
+
+        def is_saved(save_location: Path, expected_size: Optional[int]) -> bool:
+            size = backend.size(get_storage_key(download_metadata, save_location))
+            return size is not None and not is_truncated(size, expected_size)
+
+        def save(chunks: Iterable[bytes], save_location: Path) -> int:
+            return backend.write_stream(
+                get_storage_key(download_metadata, save_location), chunks
+            )
+
+        if manifest is None:
+            for uri, save_location, compression, expected_size in documents:
+                if not is_saved(save_location, expected_size):
+                    save(
+                        gateway.stream_filing(uri, compression=compression),
+                        save_location,
+                    )
+        else:
+
+            def record(save_location: Path, size: int, sha256: str) -> None:
+                manifest.record(
+                    save_location,
+                    td.accession_number,
+                    download_metadata.cik,
+                    download_metadata.form,
+                    size,
+                    sha256,
+                )
+
+            # A single query covers all documents of the filing
+            downloaded = manifest.get_downloaded_sizes(p for _, p, _, _ in documents)
+            for uri, save_location, compression, expected_size in documents:
+                size = downloaded.get(save_location)
+                if size is None:
+                    # Documents saved without being recorded, e.g. by the asyncio
+                    # engine or copied into the folder, are recorded once found
+                    key = get_storage_key(download_metadata, save_location)
+                    size = backend.size(key)
+                    if size is not None and not is_truncated(size, expected_size):
+                        with backend.open(key) as f:
+                            record(save_location, size, hash_fileobj(f))
+                if size is not None and not is_truncated(size, expected_size):
+                    continue
+
+                # The manifest describes the bytes as stored, i.e. compressed
+                digest = hashlib.sha256()
+                size = save(
+                    iter_hashed(
+                        gateway.stream_filing(uri, compression=compression), digest
+                    ),
+                    save_location,
+                )
+                record(save_location, size, digest.hexdigest())
+    except Exception as e:
+        print(
+            "Error occurred while downloading filing for accession number "
+            f"{td.accession_number}: {e}"
+        )
+        return False
+
+    return True
+
+
+def is_truncated(size: int, expected_size: Optional[int]) -> bool:
+    return expected_size is not None and size < expected_size
+
+
+def fetch_and_save_filings(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    max_workers: int = 1,
+    store: Optional[SubmissionsStore] = None,
+    refresh_store: bool = True,
+    manifest: Optional[Manifest] = None,
+    job: Optional[Job] = None,
+    storage: Optional[StorageBackend] = None,
+) -> Dict[str, int]:
+    """Download and save all requested filings.
+
+    With ``max_workers`` greater than one, filings are downloaded concurrently by a
+    thread pool. Every worker still goes through the global SEC rate limiter, so
+    concurrency only hides request latency and never exceeds the rate limit.
+    If a ``store`` is given, filings are looked up in the locally stored filing
+    history of the CIK, which is refreshed first if ``refresh_store`` is set.
+    If a ``manifest`` is given, it decides which filings were already downloaded.
+    If a ``job`` is given, the filings are recorded in its journal as they are
+    found and saved, so that the job can be resumed. If a ``storage`` backend is
+    given, filings are saved to it instead of the download folder.
+
+    Filings are downloaded while the submissions are still being paginated: each
+    page is handed to the download workers as soon as it has been filtered.
+
+    :return: number of filings downloaded for each form.
+    """
+    to_download = iter_filings(download_metadata, gateway, store, refresh_store)
+    return save_filings(
+        download_metadata, gateway, to_download, max_workers, manifest, job, storage
+    )
+
+
+def fetch_and_save_filings_many(
+    download_metadatas: List[DownloadMetadata],
+    gateway: SecGateway,
+    max_workers: int = 1,
+    store: Optional[SubmissionsStore] = None,
+    refresh_store: bool = True,
+    manifest: Optional[Manifest] = None,
+    storage: Optional[StorageBackend] = None,
+) -> List[Dict[str, int]]:
+    """Download and save all requested filings of several companies.
+
+    The submissions of all companies are aggregated and their filings downloaded
+    by one shared thread pool. The filings of each company are queued as soon as
+    its own submissions have been aggregated, so a company with many submissions
+    pages never holds up the others. If the submissions of a company cannot be
+    fetched, the error is reported and the other companies are still downloaded.
+
+    At most ``max_workers`` companies are aggregated at a time, and the next one
+    is only started once fewer than ``DOWNLOAD_QUEUE_SIZE_PER_WORKER`` filings
+    per worker are queued, so downloads go first and the filings of only a few
+    companies are held in memory. The submissions pages of each company are
+    fetched one at a time, so that no more than ``max_workers`` requests are in
+    flight.
+
+    :return: number of filings downloaded for each form, for each company in order.
+    """
+    num_downloaded = [get_initial_counts(dm) for dm in download_metadatas]
+    companies = iter(enumerate(download_metadatas))
+    max_queued_downloads = DOWNLOAD_QUEUE_SIZE_PER_WORKER * max_workers
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        aggregations: Dict["Future[List[ToDownload]]", int] = {}
+        downloads: Dict["Future[Tuple[str, bool]]", Tuple[int, ToDownload]] = {}
+        failed: List[Tuple[int, ToDownload]] = []
+        while True:
+            while (
+                len(aggregations) < max_workers
+                and len(downloads) < max_queued_downloads
+            ):
+                company = next(companies, None)
+                if company is None:
+                    break
+                i, dm = company
+                aggregation = executor.submit(
+                    aggregate_filings, dm, gateway, store, refresh_store, False
+                )
+                aggregations[aggregation] = i
+
+            if not aggregations and not downloads:
+                break
+
+            pending: List["Future[Any]"] = [*aggregations, *downloads]
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in downloads:
+                    failed += count_downloads(
+                        num_downloaded, {future: downloads.pop(future)}
+                    )
+                    continue
+
+                i = aggregations.pop(future)
+                download_metadata = download_metadatas[i]
+                try:
+                    to_download = future.result()
+                except Exception as e:
+                    print(
+                        f"Error occurred while fetching submissions for CIK "
+                        f"{download_metadata.cik}: {e}"
+                    )
+                    continue
+
+                for td in plan_filings(download_metadata, to_download):
+                    download = executor.submit(
+                        fetch_and_save_counted,
+                        download_metadata,
+                        gateway,
+                        td,
+                        manifest,
+                        storage,
+                    )
+                    downloads[download] = i, td
+
+        # Filings that failed, e.g. because SEC kept throttling requests, are
+        # queued again once all others are done
+        for _ in range(FAILED_FILING_RETRY_ROUNDS):
+            downloads = {
+                executor.submit(
+                    fetch_and_save_counted,
+                    download_metadatas[i],
+                    gateway,
+                    td,
+                    manifest,
+                    storage,
+                ): (i, td)
+                for i, td in failed
+            }
+            failed = count_downloads(num_downloaded, downloads)
+
+    return num_downloaded
+
+
+def count_downloads(
+    num_downloaded: List[Dict[str, int]],
+    downloads: Dict["Future[Tuple[str, bool]]", Tuple[int, ToDownload]],
+) -> List[Tuple[int, ToDownload]]:
+    """Count the filings downloaded for each company as their downloads complete.
+
+    :return: the company index and filing of each download that failed.
+    """
+    failed = []
+    for download in as_completed(downloads):
+        i, td = downloads[download]
+        form, succeeded = download.result()
+        count_downloaded(num_downloaded[i], [(form, succeeded)])
+        if not succeeded:
+            failed.append((i, td))
+    return failed
+
+
+def aggregate_filings(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    store: Optional[SubmissionsStore] = None,
+    refresh_store: bool = True,
+    concurrent_pages: bool = True,
+) -> List[ToDownload]:
+    return list(
+        iter_filings(download_metadata, gateway, store, refresh_store, concurrent_pages)
+    )
+
+
+def iter_filings(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    store: Optional[SubmissionsStore] = None,
+    refresh_store: bool = True,
+    concurrent_pages: bool = True,
+) -> Iterable[ToDownload]:
+    if store is None:
+        return iter_filings_to_download(download_metadata, gateway, concurrent_pages)
+    return aggregate_filings_from_store(
+        download_metadata, gateway, store, refresh_store, concurrent_pages
+    )
+
+
+def save_filings(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    to_download: Iterable[ToDownload],
+    max_workers: int = 1,
+    manifest: Optional[Manifest] = None,
+    job: Optional[Job] = None,
+    storage: Optional[StorageBackend] = None,
+) -> Dict[str, int]:
+    """Download and save the given filings.
+
+    If a ``job`` is given, all filings are recorded in its journal before any is
+    downloaded, and each is marked as done once it has been saved. Only the
+    filings that the job has not saved yet are downloaded.
+
+    :return: number of filings downloaded for each form.
+    """
+    to_download = plan_filings(download_metadata, to_download)
+    if job is not None:
+        # Resuming a job that stopped while downloading needs no metadata requests
+        if not job.planned:
+            job.plan(to_download)
+        to_download = job.get_pending()
+    num_downloaded = get_initial_counts(download_metadata)
+    failed: List[ToDownload] = []
+
+    def fetch_and_save(td: ToDownload) -> Tuple[str, bool]:
+        form, succeeded = fetch_and_save_counted(
+            download_metadata, gateway, td, manifest, storage
+        )
+        if not succeeded:
+            failed.append(td)
+        elif job is not None:
+            job.complete(td)
+        return form, succeeded
+
+    def fetch_and_save_all(tds: Iterable[ToDownload]) -> None:
+        if max_workers == 1:
+            count_downloaded(num_downloaded, map(fetch_and_save, tds))
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            count_downloaded(
+                num_downloaded,
+                map_bounded(
+                    executor,
+                    fetch_and_save,
+                    tds,
+                    DOWNLOAD_QUEUE_SIZE_PER_WORKER * max_workers,
+                ),
+            )
+
+    fetch_and_save_all(to_download)
+    # Filings that failed, e.g. because SEC kept throttling requests, are queued
+    # again once all others are done
+    for _ in range(FAILED_FILING_RETRY_ROUNDS):
+        retrying = failed.copy()
+        failed.clear()
+        fetch_and_save_all(retrying)
+
+    return num_downloaded
+
+
+def map_bounded(
+    executor: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_pending: int,
+) -> Iterator[R]:
+    """Map ``fn`` over ``items`` in ``executor``, yielding results as they complete.
+
+    Unlike :meth:`Executor.map`, which submits every item up front, at most
+    ``max_pending`` items are pulled from ``items`` and queued at a time. A lazy
+    iterable is thus only consumed as fast as the workers keep up with it.
+    """
+    pending: Set["Future[R]"] = set()
+    for item in items:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, item))
+
+    for future in as_completed(pending):
+        yield future.result()
+
+
+def fetch_and_save_counted(
+    download_metadata: DownloadMetadata,
+    gateway: SecGateway,
+    td: ToDownload,
+    manifest: Optional[Manifest] = None,
+    storage: Optional[StorageBackend] = None,
+) -> Tuple[str, bool]:
+    """Download and save a single filing, returning its form and whether it succeeded."""
+    form = td.form if td.form is not None else download_metadata.form
+    return form, fetch_and_save_filing(
+        download_metadata, gateway, td, manifest, storage
+    )
+
+
+def get_initial_counts(download_metadata: DownloadMetadata) -> Dict[str, int]:
+    # Requested forms are reported even if none of their filings are downloaded
+    return {form: 0 for form in download_metadata.forms if not is_form_wildcard(form)}
+
+
+def count_downloaded(
+    num_downloaded: Dict[str, int], results: Iterable[Tuple[str, bool]]
+) -> None:
+    for form, succeeded in results:
+        num_downloaded[form] = num_downloaded.get(form, 0) + succeeded
+
+
+def get_ticker_to_cik_mapping(
+    gateway: SecGateway,
+    cache_path: Optional[Path] = None,
+    cache_ttl: float = DEFAULT_TICKER_CACHE_TTL,
+) -> Dict[str, str]:
+    """Return the ticker to CIK mapping, using an on-disk cache if one is given.
+
+    A cached mapping younger than ``cache_ttl`` seconds is returned without any
+    requests. An expired one is revalidated with a conditional request, so an
+    unchanged mapping costs a 304 rather than a full download.
+    """
+    if cache_path is None:
+        return parse_ticker_to_cik_mapping(gateway.get_ticker_metadata())
+
+    cached = read_ticker_cache(cache_path) or {}
+    if cached and is_fresh(cached, cache_ttl):
+        return cached["mapping"]
+
+    resp = gateway.get_if_modified(
+        URL_CIK_MAPPING,
+        HOST_WWW_SEC,
+        etag=cached.get("etag"),
+        last_modified=cached.get("last_modified"),
+    )
+    if resp is None:
+        # Unchanged since it was cached, so only the cache's age is renewed
+        mapping = cached["mapping"]
+        etag, last_modified = cached.get("etag"), cached.get("last_modified")
+    else:
+        mapping = parse_ticker_to_cik_mapping(resp.json())
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
 
-        successfully_downloaded += 1
+    try:
+        save_document(encode_ticker_cache(mapping, etag, last_modified), cache_path)
+    except OSError:
+        # A cache that cannot be written only costs a full fetch next time
+        pass
 
-    return successfully_downloaded
+    return mapping
 
 
-def get_ticker_to_cik_mapping(user_agent: str) -> Dict[str, str]:
-    ticker_metadata = get_ticker_metadata(user_agent)
+def parse_ticker_to_cik_mapping(ticker_metadata: Any) -> Dict[str, str]:
     fields = ticker_metadata["fields"]
     ticker_data = ticker_metadata["data"]
 
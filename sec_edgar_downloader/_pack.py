@@ -0,0 +1,180 @@
+import io
+import shutil
+import struct
+import threading
+from pathlib import Path
+from typing import IO, Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from ._constants import PACK_MAGIC, PACK_RECORD_MAGIC
+from ._types import PackedDocument
+
+# Each record is a header, the accession number and document name, then the
+# document itself: record magic, accession number length, name length, size
+PACK_RECORD_HEADER = struct.Struct("<4sHHQ")
+
+_packs: Dict[Path, "FilingPack"] = {}
+_packs_lock = threading.Lock()
+
+
+class FilingPack:
+    """Append-only container of the documents of one company and form.
+
+    Packing documents into a single file, rather than one folder and file per
+    filing, keeps the number of inodes per company and form constant. Every
+    document is stored uncompressed after a small header, so the headers form an
+    index of document offsets that is read by seeking from one header to the
+    next. Documents can then be opened by accession number, which reads them in
+    place without copying them out of the pack, or sliced directly from a memory
+    map of the pack using their :attr:`PackedDocument.offset`.
+
+    A record that was only partially appended, e.g. because the process was
+    killed, is ignored and overwritten by the next append. Appends are
+    serialized per pack within a process, so packs must not be written to by
+    several processes at once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._index: Dict[Tuple[str, str], PackedDocument] = {}
+        # Offset at which the last complete record ends
+        self._end = 0
+        self._size = -1
+
+    def _load(self) -> None:
+        """Refresh the index if the pack changed since it was last read."""
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if size == self._size:
+            return
+
+        self._index, self._end = {}, 0
+        if size > 0:
+            with self.path.open("rb") as f:
+                if f.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                    raise ValueError(f"{self.path} is not a filing pack.")
+                for document in iter_records(f, size):
+                    self._index[document.accession_number, document.name] = document
+                    self._end = document.offset + document.size
+                self._end = max(self._end, len(PACK_MAGIC))
+        self._size = size
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        with self._lock:
+            self._load()
+            return key in self._index
+
+    def get(self, accession_number: str, name: str) -> Optional[PackedDocument]:
+        with self._lock:
+            self._load()
+            return self._index.get((accession_number, name))
+
+    def list_documents(self) -> List[PackedDocument]:
+        """Return the documents in the pack, in the order they were appended."""
+        with self._lock:
+            self._load()
+            return sorted(self._index.values(), key=lambda d: d.offset)
+
+    def open(self, accession_number: str, name: str) -> IO[bytes]:
+        """Open a document for reading, bounded to its bytes within the pack."""
+        with self._lock:
+            self._load()
+            document = self._index[accession_number, name]
+
+        return io.BufferedReader(
+            PackedDocumentReader(self.path.open("rb"), document.offset, document.size)
+        )
+
+    def append(self, accession_number: str, name: str, source_path: Path) -> None:
+        """Append the document at ``source_path`` to the pack."""
+        encoded_accession_number = accession_number.encode()
+        encoded_name = name.encode()
+        size = source_path.stat().st_size
+
+        with self._lock:
+            self._load()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("r+b" if self._size > 0 else "wb") as f:
+                if self._size == 0:
+                    f.write(PACK_MAGIC)
+                    self._end = len(PACK_MAGIC)
+                # Overwrite any partially appended record
+                f.seek(self._end)
+                f.truncate()
+                f.write(
+                    PACK_RECORD_HEADER.pack(
+                        PACK_RECORD_MAGIC,
+                        len(encoded_accession_number),
+                        len(encoded_name),
+                        size,
+                    )
+                )
+                f.write(encoded_accession_number)
+                f.write(encoded_name)
+                offset = f.tell()
+                with source_path.open("rb") as source:
+                    shutil.copyfileobj(source, f)
+
+            self._index[accession_number, name] = PackedDocument(
+                accession_number, name, offset, size
+            )
+            self._end = self._size = offset + size
+
+
+class PackedDocumentReader(io.RawIOBase):
+    """Raw reader of the ``size`` bytes at ``offset`` of a pack file."""
+
+    def __init__(self, f: io.BufferedReader, offset: int, size: int) -> None:
+        self._f = f
+        self._position = offset
+        self._end = offset + size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        size = min(len(b), self._end - self._position)
+        if size <= 0:
+            return 0
+        self._f.seek(self._position)
+        num_bytes = self._f.readinto(memoryview(b)[:size])
+        self._position += num_bytes
+        return num_bytes
+
+    def close(self) -> None:
+        self._f.close()
+        super().close()
+
+
+def iter_records(f: BinaryIO, size: int) -> Iterable[PackedDocument]:
+    """Yield the complete records of a pack, seeking past their documents."""
+    while True:
+        header = f.read(PACK_RECORD_HEADER.size)
+        if len(header) < PACK_RECORD_HEADER.size:
+            return
+        magic, accession_number_len, name_len, document_size = (
+            PACK_RECORD_HEADER.unpack(header)
+        )
+        names = f.read(accession_number_len + name_len)
+        offset = f.tell()
+        if (
+            magic != PACK_RECORD_MAGIC
+            or len(names) < accession_number_len + name_len
+            or offset + document_size > size
+        ):
+            return
+
+        yield PackedDocument(
+            names[:accession_number_len].decode(),
+            names[accession_number_len:].decode(),
+            offset,
+            document_size,
+        )
+        f.seek(offset + document_size)
+
+
+def open_pack(path: Path) -> FilingPack:
+    """Return the pack at ``path``, shared by all threads of the process."""
+    with _packs_lock:
+        if path not in _packs:
+            _packs[path] = FilingPack(path)
+        return _packs[path]
@@ -0,0 +1,97 @@
+from typing import Iterable, Iterator
+
+from ._constants import SEC_REQUESTS_PER_SEC_MAX, SIZE_ORDER_LARGEST_FIRST
+from ._types import DownloadEstimate, DownloadMetadata, ToDownload
+from ._utils import has_document_filters
+
+
+def plan_filings(
+    download_metadata: DownloadMetadata, to_download: Iterable[ToDownload]
+) -> Iterable[ToDownload]:
+    """Return the filings to download, in the order in which to download them.
+
+    Skipped accession numbers are dropped, then filings larger than
+    ``max_filing_size``. If a ``size_order`` is set, the filings are sorted by
+    size, which means that all of them are looked up before any is downloaded.
+    Finally, filings are taken in order as long as they fit in the remaining
+    ``max_total_size`` budget, skipping those that do not. Filings whose size is
+    unknown are skipped by the size limits and sorted last.
+
+    Without any size rules, ``to_download`` is consumed lazily, so filings are
+    still downloaded while the submissions are being paginated.
+    """
+    to_download = skip_filings(download_metadata, to_download)
+    max_filing_size = download_metadata.max_filing_size
+    if max_filing_size is not None:
+        to_download = (
+            td
+            for td in to_download
+            if td.size is not None and td.size <= max_filing_size
+        )
+    if download_metadata.size_order is not None:
+        sign = -1 if download_metadata.size_order == SIZE_ORDER_LARGEST_FIRST else 1
+        # Filings of equal size keep their order, i.e. newest first
+        to_download = sorted(
+            to_download, key=lambda td: (td.size is None, sign * (td.size or 0))
+        )
+    if download_metadata.max_total_size is not None:
+        to_download = iter_within_budget(to_download, download_metadata.max_total_size)
+    return to_download
+
+
+def skip_filings(
+    download_metadata: DownloadMetadata, to_download: Iterable[ToDownload]
+) -> Iterable[ToDownload]:
+    if download_metadata.accession_numbers_to_skip is None:
+        return to_download
+    return (
+        td
+        for td in to_download
+        if td.accession_number not in download_metadata.accession_numbers_to_skip
+    )
+
+
+def iter_within_budget(
+    to_download: Iterable[ToDownload], max_total_size: int
+) -> Iterator[ToDownload]:
+    remaining = max_total_size
+    for td in to_download:
+        if td.size is not None and td.size <= remaining:
+            remaining -= td.size
+            yield td
+
+
+def estimate_download(
+    download_metadata: DownloadMetadata,
+    to_download: Iterable[ToDownload],
+    bytes_per_sec: float,
+) -> DownloadEstimate:
+    """Estimate how many bytes and how long downloading the planned filings takes.
+
+    Every document is a request subject to the SEC rate limit, and the full
+    submissions are transferred at ``bytes_per_sec``, so the download takes at
+    least as long as the slower of the two. Documents selected by document
+    filters are not known before their filing index is fetched, so only the
+    index requests are counted for them.
+    """
+    num_filings = num_bytes = num_filings_of_unknown_size = 0
+    for td in plan_filings(download_metadata, to_download):
+        num_filings += 1
+        if td.size is None:
+            num_filings_of_unknown_size += 1
+        elif download_metadata.download_full_submission:
+            num_bytes += td.size
+
+    requests_per_filing = (
+        download_metadata.download_full_submission
+        + download_metadata.download_details
+        + has_document_filters(download_metadata)
+    )
+    num_requests = num_filings * requests_per_filing
+    return DownloadEstimate(
+        num_filings=num_filings,
+        num_bytes=num_bytes,
+        num_filings_of_unknown_size=num_filings_of_unknown_size,
+        num_requests=num_requests,
+        seconds=max(num_requests / SEC_REQUESTS_PER_SEC_MAX, num_bytes / bytes_per_sec),
+    )
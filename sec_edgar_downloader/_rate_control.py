@@ -0,0 +1,102 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from ._constants import (
+    ADAPTIVE_RATE_DECREASE_FACTOR,
+    ADAPTIVE_RATE_INCREASE,
+    ADAPTIVE_RATE_MIN,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    SEC_REQUESTS_PER_SEC_MAX,
+)
+
+
+class AdaptiveRateController:
+    """Paces requests at a rate that adapts to how SEC responds to them.
+
+    The rate starts at ``max_rate`` and follows an additive increase,
+    multiplicative decrease scheme: it is cut by
+    ``ADAPTIVE_RATE_DECREASE_FACTOR`` every time a request is throttled or
+    fails, and grows back by ``ADAPTIVE_RATE_INCREASE`` requests per second with
+    every request that succeeds. Below ``max_rate``, requests are spaced evenly
+    at the current rate; at ``max_rate``, pacing is left to the global rate
+    limiter. A ``Retry-After`` sent by SEC holds back all requests until it has
+    passed, since SEC throttles by IP address rather than by connection.
+
+    The controller only computes delays, so that it can be shared by threads
+    that sleep and by coroutines that await.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = SEC_REQUESTS_PER_SEC_MAX,
+        min_rate: float = ADAPTIVE_RATE_MIN,
+    ) -> None:
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate = max_rate
+        self._lock = threading.Lock()
+        # Earliest time at which the next request may be sent
+        self._next = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a slot for a request, returning how long to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + (1 / self.rate if self.rate < self.max_rate else 0)
+            return start - now
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + ADAPTIVE_RATE_INCREASE)
+
+    def back_off(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Slow down after a throttled or failed request.
+
+        :param attempt: number of times the request has been retried so far.
+        :param retry_after: seconds SEC asked to wait before retrying, if any.
+        :return: seconds to wait before retrying the request.
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * ADAPTIVE_RATE_DECREASE_FACTOR)
+            if retry_after is not None:
+                self._next = max(self._next, time.monotonic() + retry_after)
+        return get_retry_delay(attempt, retry_after)
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Return a jittered exponential backoff, or ``retry_after`` if SEC sent one.
+
+    The backoff is drawn uniformly up to a ceiling that doubles with every
+    attempt, so that workers throttled at the same time do not retry in lockstep.
+    """
+    if retry_after is not None:
+        return retry_after
+    ceiling = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given either in seconds or as an HTTP date."""
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
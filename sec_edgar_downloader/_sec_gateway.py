@@ -1,16 +1,30 @@
-from typing import Any
+import asyncio
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
 
 import requests
 from pyrate_limiter import Duration, Limiter, Rate
 from requests import Response
+from requests.adapters import HTTPAdapter
 
+from ._compression import compress_chunks
 from ._constants import (
+    COMPRESSION_GZIP,
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_POOL_SIZE,
     HOST_DATA_SEC,
     HOST_WWW_SEC,
+    RETRY_STATUS_CODES,
+    SEC_MAX_RETRIES,
     SEC_REQUESTS_PER_SEC_MAX,
     STANDARD_HEADERS,
     URL_CIK_MAPPING,
 )
+from ._rate_control import AdaptiveRateController, parse_retry_after
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
 # 10 requests per second rate limit set by SEC:
 # https://www.sec.gov/os/webmaster-faq#developers
@@ -20,28 +34,287 @@ SEC_THROTTLE_LIMIT_RATE = Rate(SEC_REQUESTS_PER_SEC_MAX, Duration.SECOND)
 # buffer_ms adds a small delay buffer to account for timing variations (default: 50ms).
 limiter = Limiter(SEC_THROTTLE_LIMIT_RATE)
 
+# Shared by all gateways, since SEC throttles by IP address
+rate_controller = AdaptiveRateController()
+
 
 @limiter.as_decorator(name="sec_global_rate_limit", weight=1)
-def _call_sec(uri: str, user_agent: str, host: str) -> Response:
-    resp = requests.get(
-        uri,
-        headers={
+def _send_sec(
+    session: requests.Session,
+    uri: str,
+    stream: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    return session.get(uri, stream=stream, headers=headers)
+
+
+def _call_sec(
+    session: requests.Session,
+    uri: str,
+    stream: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Send a request to SEC, retrying it while SEC throttles or fails it.
+
+    Throttled (429), unavailable (503) and other transient server error
+    responses, as well as connection errors and timeouts, are retried up to
+    ``SEC_MAX_RETRIES`` times after a jittered exponential backoff, or after the
+    ``Retry-After`` sent by SEC. Every retry also slows down all other requests.
+    """
+    attempt = 0
+    while True:
+        time.sleep(rate_controller.reserve())
+        try:
+            resp = _send_sec(session, uri, stream=stream, headers=headers)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= SEC_MAX_RETRIES:
+                raise
+            delay = rate_controller.back_off(attempt)
+        else:
+            if resp.status_code not in RETRY_STATUS_CODES or attempt >= SEC_MAX_RETRIES:
+                break
+            resp.close()
+            delay = rate_controller.back_off(
+                attempt, parse_retry_after(resp.headers.get("Retry-After"))
+            )
+        time.sleep(delay)
+        attempt += 1
+
+    try:
+        resp.raise_for_status()
+    except Exception:
+        # Release the connection of a streamed response back to the pool
+        resp.close()
+        raise
+    rate_controller.record_success()
+    return resp
+
+
+def _validate_gateway_sizes(pool_size: int, buffer_size: int) -> None:
+    if pool_size < 1:
+        raise ValueError("Invalid pool size. Please enter a number greater than 0.")
+    if buffer_size < 1:
+        raise ValueError("Invalid buffer size. Please enter a number greater than 0.")
+
+
+def _create_session(user_agent: str, host: str, pool_size: int) -> requests.Session:
+    session = requests.Session()
+    session.headers.update(
+        {
             **STANDARD_HEADERS,
             "User-Agent": user_agent,
             "Host": host,
-        },
+        }
     )
-    resp.raise_for_status()
+    # A single host is served per session, so one pool of up to pool_size
+    # keep-alive connections is all that is needed.
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SecGateway:
+    """Keeps one pooled, keep-alive HTTP session per SEC host.
+
+    Reusing connections across requests avoids paying for a new TCP and TLS
+    handshake on every filing. All requests still go through the global
+    SEC rate limiter. Filing bodies can be streamed in chunks of ``buffer_size``
+    bytes so that they never need to be held in memory all at once.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        _validate_gateway_sizes(pool_size, buffer_size)
+
+        self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.buffer_size = buffer_size
+        self._sessions: Dict[str, requests.Session] = {
+            host: _create_session(user_agent, host, pool_size)
+            for host in (HOST_WWW_SEC, HOST_DATA_SEC)
+        }
+
+    def __enter__(self) -> "SecGateway":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def session(self, host: str) -> requests.Session:
+        return self._sessions[host]
+
+    def close(self) -> None:
+        for session in self._sessions.values():
+            session.close()
+
+    def download_filing(self, uri: str) -> bytes:
+        return _call_sec(self.session(HOST_WWW_SEC), uri).content
+
+    def stream_filing(
+        self, uri: str, compression: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """Yield the body of a filing in chunks of at most ``buffer_size`` bytes.
+
+        The request is sent when iteration starts, and the connection is
+        released once the generator is exhausted or closed.
+
+        If ``compression`` is given, the body is compressed while it is streamed.
+        A body that was already sent gzip-encoded is passed through as received
+        when gzip is requested, without being decoded and encoded again.
+        """
+        with _call_sec(self.session(HOST_WWW_SEC), uri, stream=True) as resp:
+            if (
+                compression == COMPRESSION_GZIP
+                and resp.headers.get("Content-Encoding") == "gzip"
+            ):
+                yield from resp.raw.stream(self.buffer_size, decode_content=False)
+            elif compression is not None:
+                yield from compress_chunks(
+                    resp.iter_content(self.buffer_size), compression
+                )
+            else:
+                yield from resp.iter_content(self.buffer_size)
+
+    def get_list_of_available_filings(self, uri: str) -> Any:
+        return _call_sec(self.session(HOST_DATA_SEC), uri).json()
+
+    def get_if_modified(
+        self,
+        uri: str,
+        host: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[Response]:
+        """Conditionally fetch a resource, returning ``None`` if it is unchanged.
+
+        ``etag`` and ``last_modified`` are the validators returned with the
+        previously fetched copy, sent as ``If-None-Match`` and
+        ``If-Modified-Since``. An unchanged resource costs a bodiless 304.
+        """
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+        resp = _call_sec(self.session(host), uri, headers=headers)
+        if resp.status_code == HTTPStatus.NOT_MODIFIED:
+            return None
+        return resp
+
+    def get_ticker_metadata(self) -> Any:
+        return _call_sec(self.session(HOST_WWW_SEC), URL_CIK_MAPPING).json()
+
+
+@limiter.as_decorator(name="sec_global_rate_limit", weight=1)
+async def _send_sec_async(
+    client: "httpx.AsyncClient", uri: str, host: str, stream: bool = False
+) -> Any:
+    request = client.build_request("GET", uri, headers={"Host": host})
+    return await client.send(request, stream=stream)
+
+
+async def _call_sec_async(
+    client: "httpx.AsyncClient", uri: str, host: str, stream: bool = False
+) -> Any:
+    """Asyncio counterpart of :func:`_call_sec`, with the same retries."""
+    import httpx
+
+    attempt = 0
+    while True:
+        await asyncio.sleep(rate_controller.reserve())
+        try:
+            resp = await _send_sec_async(client, uri, host, stream=stream)
+        except httpx.TransportError:
+            if attempt >= SEC_MAX_RETRIES:
+                raise
+            delay = rate_controller.back_off(attempt)
+        else:
+            if resp.status_code not in RETRY_STATUS_CODES or attempt >= SEC_MAX_RETRIES:
+                break
+            await resp.aclose()
+            delay = rate_controller.back_off(
+                attempt, parse_retry_after(resp.headers.get("Retry-After"))
+            )
+        await asyncio.sleep(delay)
+        attempt += 1
+
+    try:
+        resp.raise_for_status()
+    except Exception:
+        await resp.aclose()
+        raise
+    rate_controller.record_success()
     return resp
 
 
-def download_filing(uri: str, user_agent: str) -> bytes:
-    return _call_sec(uri, user_agent, HOST_WWW_SEC).content
+class AsyncSecGateway:
+    """Asyncio counterpart of :class:`SecGateway` built on a single ``httpx`` client.
+
+    Requests acquire permits from the same global SEC rate limiter as the
+    synchronous gateway, so both share the 10 requests per second budget.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                "The asyncio download engine requires httpx. "
+                "Install it with: pip install sec-edgar-downloader[async]"
+            ) from exc
+
+        _validate_gateway_sizes(pool_size, buffer_size)
+
+        self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.buffer_size = buffer_size
+        self._client = httpx.AsyncClient(
+            headers={**STANDARD_HEADERS, "User-Agent": user_agent},
+            # Room for pool_size keep-alive connections to each of the two SEC hosts
+            limits=httpx.Limits(
+                max_connections=2 * pool_size, max_keepalive_connections=2 * pool_size
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncSecGateway":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
+    async def download_filing(self, uri: str) -> bytes:
+        resp = await _call_sec_async(self._client, uri, HOST_WWW_SEC)
+        return resp.content
 
-def get_list_of_available_filings(uri: str, user_agent: str) -> Any:
-    return _call_sec(uri, user_agent, HOST_DATA_SEC).json()
+    async def stream_filing(self, uri: str) -> AsyncIterator[bytes]:
+        """Yield the body of a filing in chunks of at most ``buffer_size`` bytes."""
+        resp = await _call_sec_async(self._client, uri, HOST_WWW_SEC, stream=True)
+        try:
+            async for chunk in resp.aiter_bytes(self.buffer_size):
+                yield chunk
+        finally:
+            await resp.aclose()
 
+    async def get_list_of_available_filings(self, uri: str) -> Any:
+        resp = await _call_sec_async(self._client, uri, HOST_DATA_SEC)
+        return resp.json()
 
-def get_ticker_metadata(user_agent: str) -> Any:
-    return _call_sec(URL_CIK_MAPPING, user_agent, HOST_WWW_SEC).json()
+    async def get_ticker_metadata(self) -> Any:
+        resp = await _call_sec_async(self._client, URL_CIK_MAPPING, HOST_WWW_SEC)
+        return resp.json()
@@ -0,0 +1,222 @@
+import binascii
+import io
+import os
+import re
+from pathlib import Path
+from typing import IO, BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ._compression import open_filing
+from ._constants import SGML_MAX_LINE_LENGTH
+from ._storage import ChunkReader, get_temp_path
+from ._types import DownloadPath, SubmissionDocument
+
+DOCUMENT_START_TAG = b"<DOCUMENT>"
+DOCUMENT_END_TAG = b"</DOCUMENT>"
+TEXT_START_TAG = b"<TEXT>"
+TEXT_END_TAG = b"</TEXT>"
+# Header tags of a document, before its <TEXT>, e.g. <TYPE>10-K
+DOCUMENT_HEADER_TAG_RE = re.compile(rb"<(TYPE|SEQUENCE|FILENAME|DESCRIPTION)>(.*)")
+# Tags that wrap the contents of XBRL, XML and PDF documents within <TEXT>
+CONTENTS_WRAPPER_TAGS = (b"<XBRL>", b"<XML>", b"<PDF>")
+# Header of uuencoded data, e.g. begin 644 image.jpg, as text can start with
+# "begin " too
+UUENCODE_BEGIN_RE = re.compile(rb"begin [0-7]{3,4} \S")
+UUENCODE_END = b"end"
+
+
+class DocumentContents:
+    """Decodes the contents of a document line by line as they are streamed.
+
+    Wrapper tags such as ``<XBRL>`` are dropped and uuencoded binaries are
+    decoded, so that whatever is written to ``f`` is the original document.
+    """
+
+    def __init__(self, f: Optional[BinaryIO]) -> None:
+        self.f = f
+        self.started = False
+        self.uuencoded = False
+        self.uudecoded = False
+        self.wrapper_end: Optional[bytes] = None
+        # Last line of text, held back in case it closes a wrapper tag
+        self.pending = b""
+
+    def feed(self, piece: bytes) -> None:
+        if self.started and not self.uuencoded:
+            self.feed_text(piece)
+        else:
+            # Wrapper tags and uuencoded data are short lines, which are always
+            # read whole
+            self.feed_line(piece)
+
+    def feed_line(self, line: bytes) -> None:
+        if self.uuencoded:
+            self.uudecode(line)
+            return
+
+        stripped = line.strip()
+        if self.wrapper_end is None and stripped in CONTENTS_WRAPPER_TAGS:
+            self.wrapper_end = b"</" + stripped[1:]
+        elif UUENCODE_BEGIN_RE.match(stripped):
+            self.started = self.uuencoded = True
+        else:
+            self.started = True
+            self.feed_text(line)
+
+    def feed_text(self, piece: bytes) -> None:
+        if self.wrapper_end is None:
+            self.write(piece)
+        else:
+            self.write(self.pending)
+            self.pending = piece
+
+    def uudecode(self, line: bytes) -> None:
+        line = line.rstrip(b"\r\n")
+        if self.uudecoded or not line:
+            return
+        if line == UUENCODE_END:
+            self.uudecoded = True
+            return
+
+        try:
+            data = binascii.a2b_uu(line)
+        except binascii.Error:
+            # Some encoders append garbage to lines, so only decode the bytes
+            # that the length character says the line holds, as the uu module did
+            num_bytes = (((line[0] - 32) & 63) * 4 + 5) // 3
+            data = binascii.a2b_uu(line[:num_bytes])
+        self.write(data)
+
+    def close(self) -> None:
+        if self.pending.strip() != self.wrapper_end:
+            self.write(self.pending)
+        if self.f is not None:
+            self.f.close()
+
+    def write(self, data: bytes) -> None:
+        if self.f is not None:
+            self.f.write(data)
+
+
+def split_submission(
+    source: Union[IO[bytes], Iterable[bytes]],
+    extract_to: Optional[DownloadPath] = None,
+) -> Iterator[SubmissionDocument]:
+    """Split a full submission into the documents it is made of.
+
+    The submission is read a line at a time, and lines are read in pieces of at
+    most 64 KiB, so memory use does not depend on the size of the submission or
+    of any of its documents. ``source`` may be a binary file object, e.g. as
+    returned by :func:`open_filing`, or an iterable of chunks of a submission
+    that is still being downloaded.
+
+    If ``extract_to`` is given, each document is also written to a file in that
+    folder, named after its ``<FILENAME>``, as it is read. Uuencoded binaries
+    are decoded, and XBRL, XML and PDF contents are unwrapped from their tags.
+
+    :param source: full submission to split.
+    :param extract_to: folder to extract the documents to. Defaults to None,
+        i.e. nothing is extracted.
+    :return: iterator of the documents of the submission, in order. Their
+        ``start`` and ``end`` offsets delimit their contents in the submission,
+        so that a memory map of an uncompressed submission can be sliced with them.
+    """
+    f = (
+        source
+        if isinstance(source, io.IOBase)
+        else io.BufferedReader(ChunkReader(source))
+    )
+    folder = None if extract_to is None else Path(extract_to).expanduser()
+
+    offset = 0
+    line_start = True
+    document: Optional[SubmissionDocument] = None
+    contents: Optional[DocumentContents] = None
+    # Temporary and final path of the document being extracted
+    extracting: Optional[Tuple[Path, Path]] = None
+    try:
+        for piece in iter(lambda: f.readline(SGML_MAX_LINE_LENGTH), b""):
+            # Lines longer than SGML_MAX_LINE_LENGTH are read in several pieces,
+            # and tags are only looked for in whole lines
+            is_line = line_start
+            line_start = piece.endswith(b"\n")
+            piece_start, offset = offset, offset + len(piece)
+            is_whole_line = is_line and (
+                line_start or len(piece) < SGML_MAX_LINE_LENGTH
+            )
+            tag = piece.strip() if is_whole_line else b""
+
+            if contents is not None and document is not None:
+                if tag != TEXT_END_TAG:
+                    contents.feed(piece)
+                    continue
+
+                document.end = piece_start
+                document.uuencoded = contents.uuencoded
+                contents.close()
+                if extracting is not None:
+                    os.replace(*extracting)
+                    extracting = None
+                contents = None
+            elif tag == DOCUMENT_START_TAG:
+                document = SubmissionDocument("", None, None, None, offset, offset)
+            elif document is None:
+                continue
+            elif tag == TEXT_START_TAG:
+                document.start = document.end = offset
+                sink = None
+                if folder is not None:
+                    extract_path = folder / get_extract_filename(document)
+                    document.path = extract_path
+                    folder.mkdir(parents=True, exist_ok=True)
+                    extracting = get_temp_path(extract_path), extract_path
+                    sink = extracting[0].open("xb")
+                contents = DocumentContents(sink)
+            elif tag == DOCUMENT_END_TAG:
+                yield document
+                document = None
+            elif tag:
+                match = DOCUMENT_HEADER_TAG_RE.fullmatch(tag)
+                if match is not None:
+                    field, value = match.groups()
+                    setattr(document, field.decode().lower(), value.decode().strip())
+    finally:
+        if contents is not None and contents.f is not None:
+            contents.f.close()
+        if extracting is not None:
+            extracting[0].unlink(missing_ok=True)
+
+
+def get_extract_filename(document: SubmissionDocument) -> str:
+    if document.filename:
+        # Never extract outside of the requested folder
+        return Path(document.filename).name
+    return f"document-{document.sequence or 0}.txt"
+
+
+def extract_submission(
+    path: DownloadPath, folder: Optional[DownloadPath] = None
+) -> List[SubmissionDocument]:
+    """Extract the documents of a saved full submission into separate files.
+
+    The submission is streamed from disk, whether or not it is compressed or
+    packed, so memory use does not depend on its size.
+
+    :param path: path to the full submission, as accepted by :func:`open_filing`.
+    :param folder: folder to extract the documents to. Defaults to the folder of
+        the full submission.
+    :return: the extracted documents, with the ``path`` they were extracted to.
+
+    Usage::
+
+        >>> from sec_edgar_downloader import extract_submission
+        >>> documents = extract_submission(
+        ...     "sec-edgar-filings/AAPL/10-K/0000320193-22-000108/full-submission.txt"
+        ... )
+        >>> [(d.type, d.filename) for d in documents][:2]
+        [('10-K', 'aapl-20220924.htm'), ('EX-4.1', 'a10-kexhibit41q42022.htm')]
+    """
+    path = Path(path).expanduser()
+    with open_filing(path) as f:
+        return list(
+            split_submission(f, path.parent if folder is None else Path(folder))
+        )
@@ -0,0 +1,287 @@
+import io
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from ._constants import PACK_SUFFIX
+from ._pack import FilingPack, open_pack
+from ._types import DownloadPath
+
+
+class StorageBackend(ABC):
+    """Storage in which downloaded documents are saved.
+
+    Documents are addressed by ``/``-separated keys relative to the
+    ``sec-edgar-filings`` folder, e.g.
+    ``AAPL/10-K/0000320193-22-000108/full-submission.txt``. A document must only
+    become visible once it has been written completely.
+    """
+
+    @abstractmethod
+    def size(self, key: str) -> Optional[int]:
+        """Return the size of the document stored under ``key``, or None if there is none.
+
+        Downloads compare it with the size listed in the submissions to detect
+        truncated documents.
+        """
+
+    def exists(self, key: str) -> bool:
+        """Return whether a document is stored under ``key``."""
+        return self.size(key) is not None
+
+    @abstractmethod
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> int:
+        """Store a document from a stream of chunks and return its size."""
+
+    @abstractmethod
+    def open(self, key: str) -> IO[bytes]:
+        """Open the document stored under ``key`` for reading."""
+
+    @abstractmethod
+    def list(self, prefix: str = "") -> List[str]:
+        """Return the sorted keys of all documents whose key starts with ``prefix``."""
+
+
+class LocalStorage(StorageBackend):
+    """Saves documents as files under a local folder, as :class:`Downloader` does.
+
+    :param root: relative or absolute path to the folder in which the documents
+        are saved, e.g. ``/path/to/save/location/sec-edgar-filings``.
+    """
+
+    def __init__(self, root: DownloadPath) -> None:
+        self.root = Path(root).expanduser().resolve()
+
+    def size(self, key: str) -> Optional[int]:
+        path = self.root / key
+        return path.stat().st_size if path.is_file() else None
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> int:
+        return save_document(chunks, self.root / key)
+
+    def open(self, key: str) -> IO[bytes]:
+        return (self.root / key).open("rb")
+
+    def list(self, prefix: str = "") -> List[str]:
+        folder = self.root / prefix.rpartition("/")[0]
+        keys = []
+        for path in folder.rglob("*"):
+            key = path.relative_to(self.root).as_posix()
+            # Skip in-progress temporary files, as well as the manifest and job
+            # journal, which are the only files directly under the root
+            if (
+                path.is_file()
+                and not path.name.startswith(".")
+                and "/" in key
+                and key.startswith(prefix)
+            ):
+                keys.append(key)
+        return sorted(keys)
+
+
+class PackStorage(StorageBackend):
+    """Appends documents to packs under a local folder, as the ``"pack"`` layout does.
+
+    Each document is stored in the pack of its company and form,
+    ``<ticker or CIK>/<form>.pack``, under the accession number and filename at
+    the end of its key. Documents are first streamed to a temporary file next to
+    the pack, so that concurrent downloads only hold the pack while their
+    document is copied into it.
+
+    :param root: relative or absolute path to the folder in which the packs are
+        saved, e.g. ``/path/to/save/location/sec-edgar-filings``.
+    """
+
+    def __init__(self, root: DownloadPath) -> None:
+        self.root = Path(root).expanduser().resolve()
+
+    def locate(self, key: str) -> Tuple[FilingPack, str, str]:
+        """Return the pack of a key, and the accession number and name within it."""
+        *folders, accession_number, name = key.split("/")
+        form_folder = self.root.joinpath(*folders)
+        pack = open_pack(form_folder.with_name(f"{form_folder.name}{PACK_SUFFIX}"))
+        return pack, accession_number, name
+
+    def size(self, key: str) -> Optional[int]:
+        pack, accession_number, name = self.locate(key)
+        document = pack.get(accession_number, name)
+        return None if document is None else document.size
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> int:
+        pack, accession_number, name = self.locate(key)
+        temp_path = get_temp_path(pack.path)
+        try:
+            num_bytes = save_document(chunks, temp_path)
+            pack.append(accession_number, name, temp_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return num_bytes
+
+    def open(self, key: str) -> IO[bytes]:
+        pack, accession_number, name = self.locate(key)
+        if pack.get(accession_number, name) is None:
+            raise FileNotFoundError(f"No document is stored under {key!r}.")
+        return pack.open(accession_number, name)
+
+    def list(self, prefix: str = "") -> List[str]:
+        keys = []
+        for pack_path in self.root.rglob(f"*{PACK_SUFFIX}"):
+            folder = pack_path.with_suffix("").relative_to(self.root).as_posix()
+            for document in open_pack(pack_path).list_documents():
+                key = f"{folder}/{document.accession_number}/{document.name}"
+                if key.startswith(prefix):
+                    keys.append(key)
+        return sorted(keys)
+
+
+class MemoryStorage(StorageBackend):
+    """Keeps documents in memory, for pipelines that never need them on disk."""
+
+    def __init__(self) -> None:
+        self.documents: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def size(self, key: str) -> Optional[int]:
+        with self._lock:
+            contents = self.documents.get(key)
+        return None if contents is None else len(contents)
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> int:
+        contents = b"".join(chunks)
+        with self._lock:
+            self.documents[key] = contents
+        return len(contents)
+
+    def open(self, key: str) -> IO[bytes]:
+        with self._lock:
+            if key not in self.documents:
+                raise FileNotFoundError(f"No document is stored under {key!r}.")
+            return io.BytesIO(self.documents[key])
+
+    def list(self, prefix: str = "") -> List[str]:
+        with self._lock:
+            return sorted(key for key in self.documents if key.startswith(prefix))
+
+
+class ObjectStorage(StorageBackend):
+    """Uploads documents to an S3-style object store while they are downloaded.
+
+    Documents are streamed straight into ``client.upload_fileobj``, so they are
+    never written to local disk first. ``client`` only needs the
+    ``upload_fileobj``, ``get_object`` and ``list_objects_v2`` methods of a
+    ``boto3`` S3 client, so S3-compatible stores and local stand-ins work too.
+
+    :param client: S3 client, e.g. ``boto3.client("s3")``.
+    :param bucket: name of the bucket in which documents are stored.
+    :param prefix: prefix prepended to every key, e.g. ``"sec-edgar-filings/"``.
+        Defaults to no prefix.
+
+    Usage::
+
+        >>> import boto3
+        >>> from sec_edgar_downloader import Downloader, ObjectStorage
+        >>> storage = ObjectStorage(boto3.client("s3"), "my-bucket", "filings/")
+        >>> dl = Downloader("MyCompanyName", "my.email@domain.com", storage=storage)
+    """
+
+    def __init__(self, client: Any, bucket: str, prefix: str = "") -> None:
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def size(self, key: str) -> Optional[int]:
+        # A listing of the key itself avoids a 404 error for missing documents
+        object_key = f"{self.prefix}{key}"
+        resp = self.client.list_objects_v2(
+            Bucket=self.bucket, Prefix=object_key, MaxKeys=1
+        )
+        for obj in resp.get("Contents", []):
+            if obj["Key"] == object_key:
+                return obj["Size"]
+        return None
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> int:
+        reader = ChunkReader(chunks)
+        self.client.upload_fileobj(reader, self.bucket, f"{self.prefix}{key}")
+        return reader.num_bytes
+
+    def open(self, key: str) -> IO[bytes]:
+        resp = self.client.get_object(Bucket=self.bucket, Key=f"{self.prefix}{key}")
+        return resp["Body"]
+
+    def list(self, prefix: str = "") -> List[str]:
+        keys: List[str] = []
+        kwargs = {"Bucket": self.bucket, "Prefix": f"{self.prefix}{prefix}"}
+        while True:
+            resp = self.client.list_objects_v2(**kwargs)
+            keys.extend(
+                obj["Key"][len(self.prefix) :] for obj in resp.get("Contents", [])
+            )
+            if not resp.get("IsTruncated"):
+                return sorted(keys)
+            kwargs["ContinuationToken"] = resp["NextContinuationToken"]
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only file object over a stream of chunks, consumed as it is read."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b""
+        self.num_bytes = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._buffer:
+            chunk: Optional[bytes] = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        self.num_bytes += n
+        return n
+
+
+def get_temp_path(save_path: Path) -> Path:
+    """Return a unique hidden path next to ``save_path`` for in-progress writes."""
+    return save_path.with_name(f".{save_path.name}.{uuid4().hex}.part")
+
+
+def save_document(
+    filing_contents: Union[bytes, Iterable[bytes]], save_path: Path
+) -> int:
+    """Write a document to disk atomically and return the number of bytes written.
+
+    ``filing_contents`` may be the full document or an iterable of chunks, which
+    are written one at a time so that memory use is bounded by the chunk size.
+    Chunks go to a temporary file in the destination folder, which is renamed
+    into place once complete, so an interrupted write never leaves a partial
+    document at ``save_path``.
+    """
+    # TODO: resolve URLs so that images show up in HTML files?
+    if isinstance(filing_contents, bytes):
+        filing_contents = [filing_contents]
+
+    # Create all parent directories as needed and write content to file
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = get_temp_path(save_path)
+    num_bytes = 0
+    try:
+        with temp_path.open("xb") as f:
+            for chunk in filing_contents:
+                f.write(chunk)
+                num_bytes += len(chunk)
+        os.replace(temp_path, save_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return num_bytes
@@ -0,0 +1,193 @@
+import json
+import re
+import sqlite3
+import zipfile
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# Columns of the submissions API's filing arrays, mapped to store columns
+SUBMISSIONS_COLUMNS = {
+    "accessionNumber": "accession_number",
+    "filingDate": "filing_date",
+    "reportDate": "report_date",
+    "acceptanceDateTime": "acceptance_date_time",
+    "act": "act",
+    "form": "form",
+    "fileNumber": "file_number",
+    "filmNumber": "film_number",
+    "items": "items",
+    "size": "size",
+    "isXBRL": "is_xbrl",
+    "isInlineXBRL": "is_inline_xbrl",
+    "primaryDocument": "primary_document",
+    "primaryDocDescription": "primary_doc_description",
+}
+
+# First pages and historical pages of each CIK in SEC's bulk submissions.zip
+ARCHIVE_ENTRY_PATTERN = re.compile(
+    r"CIK(?P<cik>\d{10})(?P<page>-submissions-\d+)?\.json"
+)
+# Number of archive entries merged per transaction while ingesting an archive
+ARCHIVE_COMMIT_INTERVAL = 1000
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS companies (
+    cik TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE TABLE IF NOT EXISTS pages (
+    cik TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (cik, name)
+);
+CREATE TABLE IF NOT EXISTS filings (
+    cik TEXT NOT NULL,
+    {", ".join(SUBMISSIONS_COLUMNS.values())},
+    PRIMARY KEY (cik, accession_number)
+);
+CREATE INDEX IF NOT EXISTS filings_by_date ON filings (cik, filing_date);
+"""
+
+
+class SubmissionsStore:
+    """Persistent SQLite store of the merged filing history of each CIK.
+
+    Filings from the recent block and all historical submissions pages are kept
+    in a single table keyed by accession number, along with the HTTP validators
+    of the last first-page response and the names of the historical pages that
+    were already merged. Historical pages never change, so each one only needs
+    to be fetched once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self.connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection whose changes are committed as one transaction.
+
+        A connection is opened per operation so that the store can be shared
+        across threads.
+        """
+        with closing(sqlite3.connect(self.path)) as conn:
+            with conn:
+                yield conn
+
+    def get_validators(self, cik: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return the ETag and Last-Modified of the last merged first page."""
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified FROM companies WHERE cik = ?", (cik,)
+            ).fetchone()
+        return row if row is not None else (None, None)
+
+    def has_company(self, cik: str) -> bool:
+        with self.connect() as conn:
+            row = conn.execute("SELECT 1 FROM companies WHERE cik = ?", (cik,))
+            return row.fetchone() is not None
+
+    def get_merged_pages(self, cik: str) -> Set[str]:
+        with self.connect() as conn:
+            rows = conn.execute("SELECT name FROM pages WHERE cik = ?", (cik,))
+            return {name for (name,) in rows}
+
+    def merge(
+        self,
+        conn: sqlite3.Connection,
+        cik: str,
+        filings_json: Dict[str, List[Any]],
+        page_name: Optional[str] = None,
+    ) -> None:
+        """Merge a submissions filing array, recording ``page_name`` if given."""
+        columns = [c for c in SUBMISSIONS_COLUMNS if c in filings_json]
+        conn.executemany(
+            f"INSERT OR REPLACE INTO filings "
+            f"(cik, {', '.join(SUBMISSIONS_COLUMNS[c] for c in columns)}) "
+            f"VALUES (?{', ?' * len(columns)})",
+            (
+                (cik, *row)
+                for row in zip(*(filings_json[c] for c in columns))  # noqa: B905
+            ),
+        )
+        if page_name is not None:
+            conn.execute(
+                "INSERT OR IGNORE INTO pages (cik, name) VALUES (?, ?)",
+                (cik, page_name),
+            )
+
+    def set_validators(
+        self,
+        conn: sqlite3.Connection,
+        cik: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO companies (cik, etag, last_modified) "
+            "VALUES (?, ?, ?)",
+            (cik, etag, last_modified),
+        )
+
+    def get_filings(self, cik: str) -> Dict[str, List[Any]]:
+        """Return the filing history of a CIK as columnar submissions arrays.
+
+        Filings are ordered newest first, like the submissions API.
+        """
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(SUBMISSIONS_COLUMNS.values())} FROM filings "
+                "WHERE cik = ? "
+                "ORDER BY filing_date DESC, acceptance_date_time DESC, "
+                "accession_number DESC",
+                (cik,),
+            ).fetchall()
+
+        return {
+            name: [row[i] for row in rows] for i, name in enumerate(SUBMISSIONS_COLUMNS)
+        }
+
+    def ingest_archive(self, archive_path: Path) -> int:
+        """Merge a local copy of SEC's bulk ``submissions.zip`` archive.
+
+        Entries are decoded one at a time straight from the archive rather than
+        extracted, and are committed in batches. Historical pages are recorded
+        as merged, so they are never fetched from the API later on.
+
+        :return: number of companies ingested.
+        """
+        num_companies = 0
+        with (
+            zipfile.ZipFile(archive_path) as archive,
+            closing(sqlite3.connect(self.path)) as conn,
+        ):
+            for i, info in enumerate(archive.infolist(), start=1):
+                name = Path(info.filename).name
+                match = ARCHIVE_ENTRY_PATTERN.fullmatch(name)
+                if match is None:
+                    continue
+
+                with archive.open(info) as f:
+                    submissions = json.load(f)
+
+                cik = match["cik"]
+                if match["page"] is None:
+                    self.merge(conn, cik, submissions["filings"]["recent"])
+                    # Keep the validators of a previous refresh, if any
+                    conn.execute(
+                        "INSERT OR IGNORE INTO companies (cik) VALUES (?)", (cik,)
+                    )
+                    num_companies += 1
+                else:
+                    self.merge(conn, cik, submissions, name)
+
+                if i % ARCHIVE_COMMIT_INTERVAL == 0:
+                    conn.commit()
+
+            conn.commit()
+
+        return num_companies
@@ -0,0 +1,42 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ._constants import CACHE_FOLDER_NAME
+
+
+def get_default_cache_folder() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / CACHE_FOLDER_NAME
+
+
+def read_ticker_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Return the cached mapping and its HTTP validators, if a usable cache exists."""
+    try:
+        with cache_path.open() as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or not isinstance(cached.get("mapping"), dict):
+        return None
+
+    return cached
+
+
+def encode_ticker_cache(
+    mapping: Dict[str, str], etag: Optional[str], last_modified: Optional[str]
+) -> bytes:
+    cached = {
+        "fetched_at": time.time(),
+        "etag": etag,
+        "last_modified": last_modified,
+        "mapping": mapping,
+    }
+    return json.dumps(cached).encode()
+
+
+def is_fresh(cached: Dict[str, Any], ttl: float) -> bool:
+    return time.time() - cached.get("fetched_at", 0) < ttl
@@ -2,9 +2,9 @@ import sys
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Set, Union
+from typing import Collection, Optional, Set, Tuple, Union
 
-from ._constants import DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE
+from ._constants import DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, STORAGE_LAYOUT_FOLDERS
 
 
 @dataclass
@@ -21,6 +21,34 @@ class DownloadMetadata:
     download_details: bool = False
     ticker: Optional[str] = None
     accession_numbers_to_skip: Optional[Set[str]] = None
+    # All requested forms or form wildcards, each of which is subject to the
+    # limit on its own. Defaults to just ``form``.
+    forms: Tuple[str, ...] = ()
+    # Compression in which full submissions are stored, if any
+    compression: Optional[str] = None
+    layout: str = STORAGE_LAYOUT_FOLDERS
+    # Filters selecting individual documents of each filing from its index, e.g.
+    # ("EX-21*",), and whether to download the full submission as well
+    document_types: Tuple[str, ...] = ()
+    document_filename: Optional[str] = None
+    max_document_size: Optional[int] = None
+    download_full_submission: bool = True
+    # Size rules applied to the full submissions of the planned filings
+    max_filing_size: Optional[int] = None
+    max_total_size: Optional[int] = None
+    size_order: Optional[str] = None
+    # Filters on the metadata columns of the submissions, applied to each filing
+    # before it is downloaded, e.g. 8-K items ("2.02",)
+    items: Tuple[str, ...] = ()
+    is_xbrl: Optional[bool] = None
+    is_inline_xbrl: Optional[bool] = None
+    report_after: Optional[date] = None
+    report_before: Optional[date] = None
+    primary_doc_description: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.forms:
+            self.forms = (self.form,)
 
 
 @dataclass
@@ -29,8 +57,72 @@ class ToDownload:
     primary_doc_uri: str
     accession_number: str
     details_doc_suffix: str
+    # Only set when filings of several companies are downloaded together
+    cik: Optional[str] = None
+    # Form under which the filing is saved. Defaults to the requested form
+    form: Optional[str] = None
+    # Size of the full submission in bytes, if listed in the submissions
+    size: Optional[int] = None
+
+
+@dataclass
+class DownloadedDocument:
+    path: Path
+    accession_number: str
+    # Unknown for documents saved under a ticker before the manifest existed
+    cik: Optional[str]
+    form: str
+    size: int
+    sha256: str
+    downloaded_at: datetime
+
+
+@dataclass
+class DownloadEstimate:
+    num_filings: int
+    # Total size of the full submissions of the filings whose size is known
+    num_bytes: int
+    num_filings_of_unknown_size: int
+    num_requests: int
+    seconds: float
+
+
+@dataclass
+class PackedDocument:
+    accession_number: str
+    name: str
+    # Position of the document in its pack
+    offset: int
+    size: int
+
+
+@dataclass
+class SubmissionDocument:
+    type: str
+    sequence: Optional[str]
+    filename: Optional[str]
+    description: Optional[str]
+    # Byte range of the document contents between <TEXT> and </TEXT> in the
+    # uncompressed submission, as stored, i.e. before uudecoding
+    start: int
+    end: int
+    # Whether the contents are a uuencoded binary, e.g. an image or PDF
+    uuencoded: bool = False
+    # Where the document was extracted to, if it was
+    path: Optional[Path] = None
+
+
+@dataclass
+class FilingIndexDocument:
+    filename: str
+    type: str
+    description: str
+    sequence: Optional[str] = None
+    size: Optional[int] = None
 
 
 DownloadPath = Union[str, Path]
 
 Date = Union[str, date, datetime]
+
+Forms = Union[str, Collection[str]]
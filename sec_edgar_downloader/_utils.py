@@ -1,10 +1,24 @@
+import fnmatch
+import sys
 from datetime import date
 from datetime import datetime
 from datetime import datetime as dt
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
-from ._constants import CIK_LENGTH, DATE_FORMAT_TOKENS
-from ._types import Date, DownloadMetadata
+from ._constants import (
+    CIK_LENGTH,
+    COMPRESSION_SUFFIXES,
+    DATE_FORMAT_TOKENS,
+    DEFAULT_AFTER_DATE,
+    DEFAULT_BEFORE_DATE,
+    FORM_WILDCARD_CHARS,
+    SIZE_ORDERS,
+    STORAGE_LAYOUTS,
+    SUPPORTED_FORMS,
+    TABLE_FORMATS,
+)
+from ._types import Date, DownloadMetadata, DownloadPath, Forms
 
 
 def is_cik(ticker_or_cik: str) -> bool:
@@ -62,9 +76,201 @@ def validate_and_parse_date(input_date: Date) -> date:
         )
 
 
-def within_requested_date_range(
+def validate_and_parse_limit(limit: Optional[int]) -> int:
+    if limit is None:
+        # If amount is not specified, obtain all available filings.
+        # We simply need a large number to denote this and the loop
+        # responsible for fetching the URLs will break appropriately.
+        return sys.maxsize
+
+    limit = int(limit)
+    if limit < 1:
+        raise ValueError("Invalid amount. Please enter a number greater than 1.")
+
+    return limit
+
+
+def validate_and_parse_max_workers(max_workers: int, pool_size: int) -> int:
+    max_workers = int(max_workers)
+    if max_workers < 1:
+        raise ValueError(
+            "Invalid number of workers. Please enter a number greater than 0."
+        )
+
+    # Workers beyond the size of the connection pool would open connections
+    # that urllib3 discards as soon as they are returned to the full pool
+    return min(max_workers, pool_size)
+
+
+def validate_and_parse_date_range(
+    after: Optional[Date], before: Optional[Date]
+) -> Tuple[date, date]:
+    # SEC allows for filing searches from 1994 onwards
+    if after is None:
+        after_date = DEFAULT_AFTER_DATE
+    else:
+        after_date = validate_and_parse_date(after)
+
+        if after_date < DEFAULT_AFTER_DATE:
+            after_date = DEFAULT_AFTER_DATE
+
+    if before is None:
+        before_date = DEFAULT_BEFORE_DATE
+    else:
+        before_date = validate_and_parse_date(before)
+
+    if after_date > before_date:
+        raise ValueError("After date cannot be greater than the before date.")
+
+    return after_date, before_date
+
+
+def validate_compression(compression: Optional[str]) -> None:
+    if compression is not None and compression not in COMPRESSION_SUFFIXES:
+        compression_options = ", ".join(COMPRESSION_SUFFIXES)
+        raise ValueError(
+            f"Invalid compression {compression!r}. "
+            f"Please enter one of: {compression_options}."
+        )
+
+
+def validate_layout(layout: str) -> None:
+    if layout not in STORAGE_LAYOUTS:
+        layout_options = ", ".join(STORAGE_LAYOUTS)
+        raise ValueError(
+            f"Invalid layout {layout!r}. Please enter one of: {layout_options}."
+        )
+
+
+def validate_and_parse_values(values: Optional[Forms]) -> Tuple[str, ...]:
+    if values is None:
+        return ()
+    if isinstance(values, str):
+        return (values,)
+    return tuple(dict.fromkeys(values))
+
+
+def validate_and_parse_report_date_range(
+    report_after: Optional[Date], report_before: Optional[Date]
+) -> Tuple[Optional[date], Optional[date]]:
+    report_after_date = (
+        None if report_after is None else validate_and_parse_date(report_after)
+    )
+    report_before_date = (
+        None if report_before is None else validate_and_parse_date(report_before)
+    )
+    if (
+        report_after_date is not None
+        and report_before_date is not None
+        and report_after_date > report_before_date
+    ):
+        raise ValueError(
+            "Report after date cannot be greater than the report before date."
+        )
+
+    return report_after_date, report_before_date
+
+
+def validate_max_size(max_size: Optional[int], description: str) -> None:
+    if max_size is not None and max_size < 1:
+        raise ValueError(
+            f"Invalid maximum {description}. Please enter a number greater than 0."
+        )
+
+
+def validate_size_order(size_order: Optional[str]) -> None:
+    if size_order is not None and size_order not in SIZE_ORDERS:
+        size_order_options = ", ".join(SIZE_ORDERS)
+        raise ValueError(
+            f"Invalid size order {size_order!r}. "
+            f"Please enter one of: {size_order_options}."
+        )
+
+
+def has_document_filters(download_metadata: DownloadMetadata) -> bool:
+    return bool(
+        download_metadata.document_types
+        or download_metadata.document_filename is not None
+        or download_metadata.max_document_size is not None
+    )
+
+
+def validate_document_selection(download_metadata: DownloadMetadata) -> None:
+    if not (
+        download_metadata.download_full_submission
+        or download_metadata.download_details
+        or has_document_filters(download_metadata)
+    ):
+        raise ValueError(
+            "Invalid document selection. Please download the full submission, "
+            "the filing details or the documents matching a document filter."
+        )
+
+
+def validate_table_format(table_format: str) -> None:
+    if table_format not in TABLE_FORMATS:
+        table_format_options = ", ".join(TABLE_FORMATS)
+        raise ValueError(
+            f"Invalid table format {table_format!r}. "
+            f"Please enter one of: {table_format_options}."
+        )
+
+
+def validate_form(form: str) -> None:
+    if form not in SUPPORTED_FORMS:
+        form_options = ", ".join(sorted(SUPPORTED_FORMS))
+        raise ValueError(
+            f"{form!r} forms are not supported. "
+            f"Please choose from the following: {form_options}."
+        )
+
+
+def is_form_wildcard(form: str) -> bool:
+    return any(c in form for c in FORM_WILDCARD_CHARS)
+
+
+def validate_and_parse_forms(forms: Forms) -> Tuple[str, ...]:
+    parsed_forms = (forms,) if isinstance(forms, str) else tuple(dict.fromkeys(forms))
+    if not parsed_forms:
+        raise ValueError("Invalid forms. Please enter at least one form.")
+
+    for form in parsed_forms:
+        if not is_form_wildcard(form):
+            validate_form(form)
+        elif not fnmatch.filter(SUPPORTED_FORMS, form):
+            raise ValueError(
+                f"Form wildcard {form!r} does not match any supported form. "
+                "Please choose a wildcard that matches at least one supported form."
+            )
+
+    return parsed_forms
+
+
+def summarize_num_downloaded(
+    forms: Forms, num_downloaded: Dict[str, int]
+) -> Union[int, Dict[str, int]]:
+    # A single form keeps returning the total number of filings downloaded
+    if isinstance(forms, str) and not is_form_wildcard(forms):
+        return sum(num_downloaded.values())
+    return num_downloaded
+
+
+def resolve_download_folder(download_folder: Optional[DownloadPath]) -> Path:
+    if download_folder is None:
+        return Path.cwd()
+    elif isinstance(download_folder, Path):
+        return download_folder
+    else:
+        return Path(download_folder).expanduser().resolve()
+
+
+def overlaps_requested_date_range(
     download_metadata: DownloadMetadata,
-    filing_date: str,
+    filing_from: Optional[str],
+    filing_to: Optional[str],
 ) -> bool:
-    target_date = dt.strptime(filing_date, DATE_FORMAT_TOKENS).date()
-    return download_metadata.after <= target_date <= download_metadata.before
+    # ISO 8601 dates compare correctly as strings, so no parsing is needed.
+    # Missing bounds are treated as unbounded so the page is never skipped.
+    return (filing_to is None or filing_to >= download_metadata.after.isoformat()) and (
+        filing_from is None or filing_from <= download_metadata.before.isoformat()
+    )
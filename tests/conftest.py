@@ -2,13 +2,17 @@
 
 import json
 import shutil
+import zipfile
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, Union
+from unittest import mock
 
 import pytest
 
 from sec_edgar_downloader import Downloader
+from sec_edgar_downloader._rate_control import AdaptiveRateController
+from sec_edgar_downloader._sec_gateway import SecGateway
 
 
 @pytest.fixture(scope="function")
@@ -53,6 +57,21 @@ def user_agent(company_name, email) -> str:
     return f"{company_name} {email}"
 
 
+@pytest.fixture(scope="function")
+def gateway(user_agent):
+    with SecGateway(user_agent) as gw:
+        yield gw
+
+
+@pytest.fixture(scope="function")
+def rate_controller(request):
+    # Backoffs are not carried over to the global controller used by other tests.
+    # Tests can pass the controller's arguments as an indirect parameter.
+    controller = AdaptiveRateController(**getattr(request, "param", {}))
+    with mock.patch("sec_edgar_downloader._sec_gateway.rate_controller", controller):
+        yield controller
+
+
 @pytest.fixture(scope="session")
 def accession_number() -> str:
     return "0000320193-22-000108"
@@ -119,3 +138,15 @@ def accession_number_to_metadata() -> Dict[str, Dict[str, Union[str, date]]]:
     assert len(accession_number_to_metadata) == 1988
 
     return accession_number_to_metadata
+
+
+@pytest.fixture(scope="function")
+def submissions_archive(tmp_path) -> Path:
+    """A small submissions.zip with the same layout as SEC's bulk archive."""
+    test_data_path = Path(__file__).parent / "test_data" / "sample_api_responses"
+    archive_path = tmp_path / "submissions.zip"
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for p in sorted(test_data_path.glob("*.json")):
+            archive.write(p, p.name)
+        archive.writestr("README.txt", "not a submissions file")
+    return archive_path
@@ -0,0 +1,106 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sec_edgar_downloader import AsyncDownloader
+from sec_edgar_downloader._constants import SUPPORTED_FORMS
+
+
+def test_async_downloader_defaults():
+    dl = AsyncDownloader("foo", "bar@baz.com", "folder-foo", pool_size=4)
+
+    assert dl.user_agent == "foo bar@baz.com"
+    assert dl.download_folder == Path.cwd() / "folder-foo"
+    assert dl.gateway.pool_size == 4
+    assert dl.ticker_to_cik_mapping is None
+    assert dl.supported_forms == sorted(SUPPORTED_FORMS)
+
+    asyncio.run(dl.aclose())
+
+
+@patch(
+    "sec_edgar_downloader._AsyncDownloader.get_ticker_to_cik_mapping_async",
+    new_callable=AsyncMock,
+    return_value={"AAPL": "0000320193"},
+)
+@patch(
+    "sec_edgar_downloader._AsyncDownloader.fetch_and_save_filings_async",
+    new_callable=AsyncMock,
+    return_value=3,
+)
+def test_async_downloader_get_given_ticker(
+    mock_fetch, mock_mapping, form_10k, apple_ticker, apple_cik
+):
+    async def run():
+        async with AsyncDownloader("foo", "bar@baz.com") as dl:
+            first = await dl.get(form_10k, apple_ticker, limit=3)
+            second = await dl.get(form_10k, apple_ticker.lower(), limit=3)
+            return dl, first, second
+
+    dl, first, second = asyncio.run(run())
+
+    assert first == second == 3
+    # Mapping is only fetched once, on first use of a ticker
+    assert mock_mapping.await_count == 1
+    assert dl.ticker_to_cik_mapping == {"AAPL": "0000320193"}
+
+    download_metadata, gateway = mock_fetch.await_args_list[0].args
+    assert gateway is dl.gateway
+    assert download_metadata.cik == apple_cik
+    assert download_metadata.ticker == apple_ticker
+    assert download_metadata.form == form_10k
+    assert download_metadata.limit == 3
+
+
+@patch(
+    "sec_edgar_downloader._AsyncDownloader.get_ticker_to_cik_mapping_async",
+    new_callable=AsyncMock,
+)
+@patch(
+    "sec_edgar_downloader._AsyncDownloader.fetch_and_save_filings_async",
+    new_callable=AsyncMock,
+    return_value=1,
+)
+def test_async_downloader_get_given_cik(mock_fetch, mock_mapping, form_10k):
+    async def run():
+        async with AsyncDownloader("foo", "bar@baz.com") as dl:
+            return await dl.get(form_10k, "320193")
+
+    assert asyncio.run(run()) == 1
+    # CIKs do not require the ticker to CIK mapping
+    assert mock_mapping.await_count == 0
+    download_metadata = mock_fetch.await_args.args[0]
+    assert download_metadata.cik == "0000320193"
+    assert download_metadata.ticker is None
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_msg",
+    [
+        ({"form": "10-INVALID"}, "'10-INVALID' forms are not supported"),
+        ({"limit": 0}, "Please enter a number greater than 1."),
+        (
+            {"after": "2020-01-02", "before": "2020-01-01"},
+            "After date cannot be greater than the before date",
+        ),
+        ({"ticker_or_cik": "12345678910"}, "Invalid CIK"),
+    ],
+)
+@patch(
+    "sec_edgar_downloader._AsyncDownloader.fetch_and_save_filings_async",
+    new_callable=AsyncMock,
+)
+def test_async_downloader_get_validation(mock_fetch, kwargs, expected_msg, apple_cik):
+    kwargs = {"form": "10-K", "ticker_or_cik": apple_cik, **kwargs}
+
+    async def run():
+        async with AsyncDownloader("foo", "bar@baz.com") as dl:
+            await dl.get(**kwargs)
+
+    with pytest.raises(ValueError) as exc_info:
+        asyncio.run(run())
+
+    assert expected_msg in str(exc_info.value)
+    assert mock_fetch.await_count == 0
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import sys
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+
+from sec_edgar_downloader._async_orchestrator import (
+    aggregate_filings_to_download_async,
+    fetch_and_save_filings_async,
+    get_ticker_to_cik_mapping_async,
+)
+from sec_edgar_downloader._constants import (
+    DEFAULT_AFTER_DATE,
+    DEFAULT_BEFORE_DATE,
+    FILING_FULL_SUBMISSION_FILENAME,
+    ROOT_SAVE_FOLDER_NAME,
+    SEC_REQUESTS_PER_SEC_MAX,
+)
+from sec_edgar_downloader._orchestrator import aggregate_filings_to_download
+from sec_edgar_downloader._sec_gateway import AsyncSecGateway, SecGateway
+from sec_edgar_downloader._types import DownloadMetadata
+
+SAMPLE_API_RESPONSES = Path(__file__).parent / "test_data" / "sample_api_responses"
+# Controller arguments under which failed requests are retried without pacing
+UNPACED = {"min_rate": SEC_REQUESTS_PER_SEC_MAX}
+
+
+def _sec_handler(requested_uris, failing_uris=()):
+    def handler(request: httpx.Request) -> httpx.Response:
+        uri = str(request.url)
+        requested_uris.append(uri)
+        if uri in failing_uris:
+            return httpx.Response(500)
+        if "data.sec.gov/submissions/" in uri:
+            json_path = SAMPLE_API_RESPONSES / uri.split("/")[-1]
+            return httpx.Response(200, json=json.loads(json_path.read_text()))
+        if "sec.gov/files/company_tickers_exchange.json" in uri:
+            return httpx.Response(
+                200,
+                json={
+                    "fields": ["cik", "name", "ticker", "exchange"],
+                    "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"]],
+                },
+            )
+        return httpx.Response(200, content=f"contents of {uri}".encode())
+
+    return handler
+
+
+def _async_gateway(user_agent, requested_uris, **kwargs):
+    transport = httpx.MockTransport(_sec_handler(requested_uris, **kwargs))
+    return AsyncSecGateway(user_agent, transport=transport)
+
+
+@pytest.mark.parametrize(
+    "form,limit,after_date,before_date,include_amends",
+    [
+        ("10-K", 3, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, False),
+        ("10-K", sys.maxsize, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, False),
+        ("10-K", sys.maxsize, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, True),
+        ("10-K", sys.maxsize, date(2008, 1, 1), date(2012, 1, 1), False),
+        ("DEF 14A", sys.maxsize, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, True),
+    ],
+)
+def test_aggregate_filings_to_download_async_matches_sync(
+    user_agent, apple_cik, form, limit, after_date, before_date, include_amends
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form=form,
+        cik=apple_cik,
+        limit=limit,
+        after=after_date,
+        before=before_date,
+        include_amends=include_amends,
+    )
+
+    async def run():
+        async with _async_gateway(user_agent, []) as gateway:
+            return await aggregate_filings_to_download_async(download_metadata, gateway)
+
+    def sync_page(_, uri):
+        return json.loads((SAMPLE_API_RESPONSES / uri.split("/")[-1]).read_text())
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(SecGateway, "get_list_of_available_filings", sync_page)
+        expected = aggregate_filings_to_download(
+            download_metadata, SecGateway(user_agent)
+        )
+
+    assert asyncio.run(run()) == expected
+
+
+def test_aggregate_filings_to_download_async_stops_at_limit(user_agent, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik, limit=1
+    )
+    requested_uris = []
+
+    async def run():
+        async with _async_gateway(user_agent, requested_uris) as gateway:
+            return await aggregate_filings_to_download_async(download_metadata, gateway)
+
+    result = asyncio.run(run())
+
+    assert len(result) == 1
+    # Limit is reached on the first page, so no additional pages are requested
+    assert requested_uris == [
+        "https://data.sec.gov/submissions/CIK0000320193.json",
+    ]
+
+
+def test_fetch_and_save_filings_async(tmp_path, user_agent, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form="10-K",
+        cik=apple_cik,
+        limit=3,
+        download_details=True,
+        accession_numbers_to_skip={"0000320193-22-000108"},
+    )
+    requested_uris = []
+
+    async def run():
+        async with _async_gateway(user_agent, requested_uris) as gateway:
+            return await fetch_and_save_filings_async(download_metadata, gateway)
+
+    num_downloaded = asyncio.run(run())
+
+    assert num_downloaded == 2
+    filings_path = tmp_path / ROOT_SAVE_FOLDER_NAME / apple_cik / "10-K"
+    saved = sorted(
+        p.relative_to(filings_path).as_posix() for p in filings_path.rglob("*.*")
+    )
+    assert saved == [
+        "0000320193-20-000096/full-submission.txt",
+        "0000320193-20-000096/primary-document.html",
+        "0000320193-21-000105/full-submission.txt",
+        "0000320193-21-000105/primary-document.html",
+    ]
+    full_submission = (
+        filings_path / "0000320193-21-000105" / FILING_FULL_SUBMISSION_FILENAME
+    )
+    assert full_submission.read_bytes() == (
+        b"contents of https://www.sec.gov/Archives/edgar/data/320193/"
+        b"000032019321000105/0000320193-21-000105.txt"
+    )
+
+    # Files that already exist are not downloaded again
+    requested_uris.clear()
+    asyncio.run(run())
+    assert requested_uris == ["https://data.sec.gov/submissions/CIK0000320193.json"]
+
+
+@mock.patch("sec_edgar_downloader._rate_control.RETRY_BACKOFF_BASE", 0.01)
+@pytest.mark.parametrize("rate_controller", [UNPACED], indirect=True)
+def test_fetch_and_save_filings_async_given_exception(
+    tmp_path, user_agent, apple_cik, capsys, rate_controller
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form="10-K", cik=apple_cik, limit=2
+    )
+    failing_uri = (
+        "https://www.sec.gov/Archives/edgar/data/320193/"
+        "000032019322000108/0000320193-22-000108.txt"
+    )
+
+    async def run():
+        async with _async_gateway(
+            user_agent, [], failing_uris={failing_uri}
+        ) as gateway:
+            return await fetch_and_save_filings_async(download_metadata, gateway)
+
+    assert asyncio.run(run()) == 1
+    assert "0000320193-22-000108" in capsys.readouterr().out
+
+
+@mock.patch("sec_edgar_downloader._rate_control.RETRY_BACKOFF_BASE", 0.01)
+@pytest.mark.parametrize("rate_controller", [UNPACED], indirect=True)
+def test_fetch_and_save_filings_async_given_pagination_failure(
+    tmp_path, user_agent, apple_cik, rate_controller
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form="10-K", cik=apple_cik
+    )
+    failing_uri = "https://data.sec.gov/submissions/CIK0000320193-submissions-001.json"
+
+    async def run():
+        async with _async_gateway(
+            user_agent, [], failing_uris={failing_uri}
+        ) as gateway:
+            return await fetch_and_save_filings_async(download_metadata, gateway)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+
+def test_get_ticker_to_cik_mapping_async(user_agent):
+    async def run():
+        async with _async_gateway(user_agent, []) as gateway:
+            return await get_ticker_to_cik_mapping_async(gateway)
+
+    assert asyncio.run(run()) == {"AAPL": "0000320193"}
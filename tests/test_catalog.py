@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from sec_edgar_downloader._catalog import list_filings, to_table
+from sec_edgar_downloader._sec_gateway import SecGateway
+from sec_edgar_downloader._submissions_store import (
+    SUBMISSIONS_COLUMNS,
+    SubmissionsStore,
+)
+from sec_edgar_downloader._types import DownloadMetadata
+
+RECENT = {
+    "accessionNumber": ["0000320193-22-000108", "0000320193-22-000070"],
+    "filingDate": ["2022-10-28", "2022-07-29"],
+    "reportDate": ["2022-09-24", "2022-06-25"],
+    "form": ["10-K", "10-Q"],
+    "items": ["", ""],
+    "size": [11032712, 6263290],
+    "isXBRL": [1, 1],
+    "primaryDocument": ["aapl-20220924.htm", "aapl-20220625.htm"],
+}
+# Older pages may lack some columns
+ADDITIONAL = {
+    "accessionNumber": ["0000320193-96-000023"],
+    "filingDate": ["1996-12-19"],
+    "form": ["10-K"],
+    "primaryDocument": [""],
+}
+
+
+def get_list_of_available_filings(_, submissions_uri):
+    if submissions_uri.endswith("CIK0000320193.json"):
+        return {
+            "filings": {
+                "recent": RECENT,
+                "files": [
+                    {
+                        "name": "CIK0000320193-submissions-001.json",
+                        "filingFrom": "1994-01-26",
+                        "filingTo": "2002-12-19",
+                    }
+                ],
+            }
+        }
+    return ADDITIONAL
+
+
+@pytest.mark.parametrize("use_store", [False, True])
+def test_list_filings(tmp_path, gateway, form_10k, apple_cik, use_store):
+    download_metadata = DownloadMetadata(Path("."), form_10k, apple_cik)
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3") if use_store else None
+
+    with (
+        patch.object(
+            SecGateway,
+            "get_list_of_available_filings",
+            autospec=True,
+            side_effect=get_list_of_available_filings,
+        ),
+        patch.object(SecGateway, "get_if_modified") as mock_get_if_modified,
+        patch.object(SecGateway, "stream_filing") as mock_stream_filing,
+    ):
+        mock_get_if_modified.return_value.json.return_value = (
+            get_list_of_available_filings(None, "CIK0000320193.json")
+        )
+        mock_get_if_modified.return_value.headers = {}
+        catalog = list_filings(download_metadata, gateway, store)
+
+    assert list(catalog) == list(SUBMISSIONS_COLUMNS)
+    assert catalog["accessionNumber"] == [
+        "0000320193-22-000108",
+        "0000320193-96-000023",
+    ]
+    assert catalog["reportDate"] == ["2022-09-24", None]
+    assert catalog["size"] == [11032712, None]
+    assert catalog["acceptanceDateTime"] == [None, None]
+    # Nothing is downloaded
+    assert mock_stream_filing.call_count == 0
+
+
+def test_to_table():
+    catalog = {"accessionNumber": ["0000320193-22-000108"], "form": ["10-K"]}
+    pyarrow = SimpleNamespace(table=lambda columns: ("arrow", columns))
+    pandas = SimpleNamespace(DataFrame=lambda columns: ("pandas", columns))
+
+    assert to_table(catalog, "dict") is catalog
+    with patch.dict(sys.modules, {"pyarrow": pyarrow, "pandas": pandas}):
+        assert to_table(catalog, "arrow") == ("arrow", catalog)
+        assert to_table(catalog, "pandas") == ("pandas", catalog)
+
+    with patch.dict(sys.modules, {"pandas": None}):
+        with pytest.raises(ImportError) as exc_info:
+            to_table(catalog, "pandas")
+    assert "pip install sec-edgar-downloader[pandas]" in str(exc_info.value)
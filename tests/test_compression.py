@@ -0,0 +1,63 @@
+import gzip
+
+import pytest
+import zstandard
+
+from sec_edgar_downloader import open_filing
+from sec_edgar_downloader._compression import compress_chunks
+from sec_edgar_downloader._pack import FilingPack
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_compress_chunks(compression):
+    chunks = [b"sample ", b"", b"file ", b"content"] * 1000
+    compressed = b"".join(compress_chunks(iter(chunks), compression))
+
+    if compression == "gzip":
+        assert gzip.decompress(compressed) == b"".join(chunks)
+    else:
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert decompressor.decompress(compressed) == b"".join(chunks)
+    assert len(compressed) < len(b"".join(chunks))
+
+
+@pytest.mark.parametrize(
+    "suffix, compression", [("", None), (".gz", "gzip"), (".zst", "zstd")]
+)
+def test_open_filing(tmp_path, suffix, compression):
+    path = tmp_path / "full-submission.txt"
+    contents = [b"sample ", b"file ", b"content"]
+    stored = contents if compression is None else compress_chunks(contents, compression)
+    (tmp_path / f"{path.name}{suffix}").write_bytes(b"".join(stored))
+
+    # Compressed documents can be opened with or without their suffix
+    for open_path in {path.with_name(f"{path.name}{suffix}"), path}:
+        with open_filing(open_path) as f:
+            assert f.read() == b"sample file content"
+
+    with open_filing(str(path)) as f:
+        assert f.read(6) == b"sample"
+
+
+@pytest.mark.parametrize(
+    "suffix, compression", [("", None), (".gz", "gzip"), (".zst", "zstd")]
+)
+def test_open_filing_given_pack(tmp_path, suffix, compression):
+    source = tmp_path / "source"
+    contents = [b"sample ", b"file ", b"content"]
+    stored = contents if compression is None else compress_chunks(contents, compression)
+    source.write_bytes(b"".join(stored))
+    pack = FilingPack(tmp_path / "AAPL" / "10-K.pack")
+    pack.append("acc_num_0", f"full-submission.txt{suffix}", source)
+
+    path = tmp_path / "AAPL" / "10-K" / "acc_num_0" / "full-submission.txt"
+    with open_filing(path) as f:
+        assert f.read() == b"sample file content"
+
+    with pytest.raises(FileNotFoundError):
+        open_filing(path.with_name("primary-document.html"))
+
+
+def test_open_filing_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_filing(tmp_path / "full-submission.txt")
@@ -1,5 +1,5 @@
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
@@ -7,6 +7,9 @@ import pytest
 
 from sec_edgar_downloader._constants import DATE_FORMAT_TOKENS, SUPPORTED_FORMS
 from sec_edgar_downloader._Downloader import Downloader
+from sec_edgar_downloader._sec_gateway import SecGateway
+from sec_edgar_downloader._storage import MemoryStorage
+from sec_edgar_downloader._types import DownloadEstimate, ToDownload
 
 
 @patch(
@@ -257,3 +260,675 @@ def test_pre_default_after_date(_, form_10k, apple_cik):
 
     assert mocked_fetch.call_count == 1
     assert mocked_fetch.call_args_list[0].args[0].after == datetime(1994, 1, 1).date()
+
+
+@patch(
+    "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+    return_value={"AAPL": "0000320193"},
+)
+def test_gateway_reused_across_get_calls(_, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", pool_size=3)
+
+    assert dl.gateway.pool_size == 3
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+    ) as mocked_fetch:
+        dl.get(form_10k, apple_cik)
+        dl.get(form_10k, apple_cik)
+
+    assert mocked_fetch.call_count == 2
+    assert (
+        mocked_fetch.call_args_list[0].args[1]
+        is mocked_fetch.call_args_list[1].args[1]
+        is dl.gateway
+    )
+
+
+@patch(
+    "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+    return_value={"AAPL": "0000320193"},
+)
+def test_max_workers(_, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com")
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+    ) as mocked_fetch:
+        dl.get(form_10k, apple_cik)
+        dl.get(form_10k, apple_cik, max_workers=4)
+
+        # Workers are capped at the size of the connection pool
+        dl.get(form_10k, apple_cik, max_workers=dl.gateway.pool_size + 5)
+
+    assert mocked_fetch.call_args_list[0].args[2] == 1
+    assert mocked_fetch.call_args_list[1].args[2] == 4
+    assert mocked_fetch.call_args_list[2].args[2] == dl.gateway.pool_size
+
+    with pytest.raises(ValueError) as exc_info:
+        dl.get(form_10k, apple_cik, max_workers=0)
+
+    assert "Invalid number of workers" in str(exc_info.value)
+
+
+@patch(
+    "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+    return_value={"AAPL": "0000320193"},
+)
+def test_multiple_forms(_, apple_cik):
+    dl = Downloader("foo", "bar@baz.com")
+    num_downloaded = {"10-K": 1, "8-K": 2}
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+        return_value=num_downloaded,
+    ) as mocked_fetch:
+        assert dl.get(["10-K", "8-K"], apple_cik, limit=2) == num_downloaded
+        assert dl.get("10-K", apple_cik) == 3
+
+    download_metadata = mocked_fetch.call_args_list[0].args[0]
+    assert download_metadata.form == "10-K"
+    assert download_metadata.forms == ("10-K", "8-K")
+    assert download_metadata.limit == 2
+
+    with pytest.raises(ValueError):
+        dl.get(["10-K", "10-INVALID"], apple_cik)
+
+
+@patch(
+    "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+    return_value={"AAPL": "0000320193", "MSFT": "0000789019"},
+)
+def test_get_many(_, tmp_path, form_10k):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings_many",
+        side_effect=lambda dms, *_, **__: [{dm.form: 1} for dm in dms],
+    ) as mocked_fetch:
+        assert dl.get_many(
+            form_10k, ["AAPL", "0000789019", "AAPL"], limit=1, max_workers=4
+        ) == {"AAPL": 1, "0000789019": 1}
+        assert dl.get_many([form_10k], ["MSFT"]) == {"MSFT": {form_10k: 1}}
+
+    download_metadatas, gateway, max_workers, store, refresh = (
+        mocked_fetch.call_args_list[0].args
+    )
+    assert [(dm.cik, dm.ticker) for dm in download_metadatas] == [
+        ("0000320193", "AAPL"),
+        ("0000789019", None),
+    ]
+    assert all(dm.limit == 1 for dm in download_metadatas)
+    assert gateway is dl.gateway
+    assert max_workers == 4
+    assert store is None
+    assert refresh is True
+
+
+@patch(
+    "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+    return_value={"AAPL": "0000320193"},
+)
+def test_get_many_validates_all_companies_up_front(_, form_10k):
+    dl = Downloader("foo", "bar@baz.com")
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings_many"
+    ) as mocked_fetch:
+        with pytest.raises(ValueError) as exc_info:
+            dl.get_many(form_10k, ["AAPL", "FAKE-TICKER"])
+        assert "Ticker 'FAKE-TICKER' is invalid" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            dl.get_many(form_10k, [])
+        assert "Invalid tickers or CIKs" in str(exc_info.value)
+
+    assert mocked_fetch.call_count == 0
+
+
+def test_compression(tmp_path, form_10k, apple_cik):
+    with pytest.raises(ValueError) as exc_info:
+        Downloader("foo", "bar@baz.com", tmp_path, compression="bz2")
+    assert "Invalid compression 'bz2'" in str(exc_info.value)
+
+    dl = Downloader("foo", "bar@baz.com", tmp_path, compression="zstd")
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_fetch,
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings_many",
+            side_effect=lambda dms, *_, **__: [{dm.form: 1} for dm in dms],
+        ) as mocked_fetch_many,
+        patch(
+            "sec_edgar_downloader._Downloader.crawl_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_crawl,
+    ):
+        dl.get(form_10k, apple_cik)
+        dl.get_many(form_10k, [apple_cik])
+        dl.crawl(form_10k, after="2024-01-01", before="2024-01-02")
+
+    assert mocked_fetch.call_args.args[0].compression == "zstd"
+    assert mocked_fetch_many.call_args.args[0][0].compression == "zstd"
+    assert mocked_crawl.call_args.args[0].compression == "zstd"
+
+
+def test_layout(tmp_path, form_10k, apple_cik):
+    with pytest.raises(ValueError) as exc_info:
+        Downloader("foo", "bar@baz.com", tmp_path, layout="zip")
+    assert "Invalid layout 'zip'" in str(exc_info.value)
+
+    dl = Downloader("foo", "bar@baz.com", tmp_path, layout="pack")
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+        return_value={form_10k: 1},
+    ) as mocked_fetch:
+        dl.get(form_10k, apple_cik)
+
+    assert mocked_fetch.call_args.args[0].layout == "pack"
+
+
+def test_storage(tmp_path, form_10k, apple_cik):
+    with pytest.raises(ValueError) as exc_info:
+        Downloader("foo", "bar@baz.com", tmp_path, layout="pack", storage=object())
+    assert "Invalid layout 'pack' for a storage backend" in str(exc_info.value)
+
+    storage = MemoryStorage()
+    dl = Downloader("foo", "bar@baz.com", tmp_path, storage=storage)
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_fetch,
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings_many",
+            side_effect=lambda dms, *_, **__: [{dm.form: 1} for dm in dms],
+        ) as mocked_fetch_many,
+        patch(
+            "sec_edgar_downloader._Downloader.crawl_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_crawl,
+    ):
+        dl.get(form_10k, apple_cik)
+        dl.get_many(form_10k, [apple_cik])
+        dl.crawl(form_10k, after="2024-01-01", before="2024-01-02")
+
+    # The storage backend, rather than the manifest, tracks saved documents
+    for mocked in (mocked_fetch, mocked_fetch_many, mocked_crawl):
+        assert mocked.call_args.kwargs["storage"] is storage
+        assert mocked.call_args.kwargs["manifest"] is None
+
+
+def test_document_filters(tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_fetch,
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings_many",
+            side_effect=lambda dms, *_, **__: [{dm.form: 1} for dm in dms],
+        ) as mocked_fetch_many,
+        patch(
+            "sec_edgar_downloader._Downloader.crawl_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_crawl,
+    ):
+        kwargs = {
+            "document_types": "EX-21*",
+            "document_filename": "*.htm",
+            "max_document_size": 10_000,
+            "download_full_submission": False,
+        }
+        dl.get(form_10k, apple_cik, **kwargs)
+        dl.get_many(form_10k, [apple_cik], **kwargs)
+        dl.crawl(form_10k, after="2024-01-01", before="2024-01-02", **kwargs)
+
+        with pytest.raises(ValueError) as exc_info:
+            dl.get(form_10k, apple_cik, max_document_size=0)
+        assert "Invalid maximum document size" in str(exc_info.value)
+
+        # Something must be left to download
+        for download in (
+            lambda: dl.get(form_10k, apple_cik, download_full_submission=False),
+            lambda: dl.get_many(form_10k, [apple_cik], download_full_submission=False),
+            lambda: dl.crawl(form_10k, download_full_submission=False),
+        ):
+            with pytest.raises(ValueError) as exc_info:
+                download()
+            assert "Invalid document selection" in str(exc_info.value)
+
+    for download_metadata in (
+        mocked_fetch.call_args.args[0],
+        mocked_fetch_many.call_args.args[0][0],
+        mocked_crawl.call_args.args[0],
+    ):
+        assert download_metadata.document_types == ("EX-21*",)
+        assert download_metadata.document_filename == "*.htm"
+        assert download_metadata.max_document_size == 10_000
+        assert not download_metadata.download_full_submission
+    assert mocked_fetch.call_count == 1
+
+
+def test_size_rules(tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+            return_value={form_10k: 1},
+        ) as mocked_fetch,
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings_many",
+            side_effect=lambda dms, *_, **__: [{dm.form: 1} for dm in dms],
+        ) as mocked_fetch_many,
+    ):
+        kwargs = {
+            "max_filing_size": 1000,
+            "max_total_size": 5000,
+            "size_order": "largest-first",
+        }
+        dl.get(form_10k, apple_cik, **kwargs)
+        dl.get_many(form_10k, [apple_cik], **kwargs)
+
+        for invalid_kwargs, error in [
+            ({"max_filing_size": 0}, "Invalid maximum filing size"),
+            ({"max_total_size": -1}, "Invalid maximum total size"),
+            ({"size_order": "newest-first"}, "Invalid size order 'newest-first'"),
+        ]:
+            with pytest.raises(ValueError) as exc_info:
+                dl.get(form_10k, apple_cik, **invalid_kwargs)
+            assert error in str(exc_info.value)
+
+    for download_metadata in (
+        mocked_fetch.call_args.args[0],
+        mocked_fetch_many.call_args.args[0][0],
+    ):
+        assert download_metadata.max_filing_size == 1000
+        assert download_metadata.max_total_size == 5000
+        assert download_metadata.size_order == "largest-first"
+    assert mocked_fetch.call_count == 1
+
+
+def test_estimate(tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    to_download_list = [
+        ToDownload(f"raw_{i}", f"pd_{i}", f"acc_num_{i}", ".htm", size=size)
+        for i, size in enumerate([3_000_000, 1_000_000, None])
+    ]
+
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.iter_filings",
+            return_value=iter(to_download_list),
+        ) as mocked_iter_filings,
+        patch.object(SecGateway, "stream_filing") as mock_stream_filing,
+    ):
+        estimate = dl.estimate(
+            form_10k, apple_cik, max_total_size=2_000_000, bytes_per_sec=500_000
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            dl.estimate(form_10k, apple_cik, bytes_per_sec=0)
+        assert "Invalid download bandwidth" in str(exc_info.value)
+
+    assert mocked_iter_filings.call_args.args[0].max_total_size == 2_000_000
+    assert estimate == DownloadEstimate(
+        num_filings=1,
+        num_bytes=1_000_000,
+        num_filings_of_unknown_size=0,
+        num_requests=1,
+        seconds=2.0,
+    )
+    # Nothing is downloaded
+    assert mock_stream_filing.call_count == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_metadata_filters(tmp_path, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+            return_value={"8-K": 1},
+        ) as mocked_fetch,
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings_many",
+            side_effect=lambda dms, *_, **__: [{dm.form: 1} for dm in dms],
+        ) as mocked_fetch_many,
+        patch(
+            "sec_edgar_downloader._Downloader.iter_filings", return_value=[]
+        ) as mocked_iter_filings,
+    ):
+        kwargs = {
+            "items": "2.02",
+            "is_xbrl": True,
+            "is_inline_xbrl": False,
+            "report_after": "2022-01-01",
+            "report_before": datetime(2022, 12, 31),
+            "primary_doc_description": "*earnings*",
+        }
+        dl.get("8-K", apple_cik, **kwargs)
+        dl.get_many("8-K", [apple_cik], **kwargs)
+        dl.estimate("8-K", apple_cik, **kwargs)
+
+        with pytest.raises(ValueError) as exc_info:
+            dl.get(
+                "8-K", apple_cik, report_after="2022-12-31", report_before="2022-01-01"
+            )
+        assert "Report after date cannot be greater" in str(exc_info.value)
+
+    for download_metadata in (
+        mocked_fetch.call_args.args[0],
+        mocked_fetch_many.call_args.args[0][0],
+        mocked_iter_filings.call_args.args[0],
+    ):
+        assert download_metadata.items == ("2.02",)
+        assert download_metadata.is_xbrl
+        assert download_metadata.is_inline_xbrl is False
+        assert download_metadata.report_after == date(2022, 1, 1)
+        assert download_metadata.report_before == date(2022, 12, 31)
+        assert download_metadata.primary_doc_description == "*earnings*"
+    assert mocked_fetch.call_count == 1
+
+
+def test_list_filings(tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    catalog = {"accessionNumber": ["0000320193-22-000108"], "form": [form_10k]}
+
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.list_filings", return_value=catalog
+        ) as mocked_list_filings,
+        patch(
+            "sec_edgar_downloader._Downloader.to_table",
+            side_effect=lambda c, table_format: (table_format, c),
+        ),
+    ):
+        assert dl.list_filings(form_10k, apple_cik, limit=1, items="2.02") == (
+            "dict",
+            catalog,
+        )
+        assert dl.list_filings(form_10k, apple_cik, table_format="arrow") == (
+            "arrow",
+            catalog,
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            dl.list_filings(form_10k, apple_cik, table_format="csv")
+        assert "Invalid table format 'csv'" in str(exc_info.value)
+
+    download_metadata = mocked_list_filings.call_args_list[0].args[0]
+    assert download_metadata.cik == apple_cik
+    assert download_metadata.limit == 1
+    assert download_metadata.items == ("2.02",)
+    assert mocked_list_filings.call_count == 2
+    # Nothing is downloaded
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_ticker_to_cik_mapping_loaded_lazily(tmp_path, form_10k, apple_cik):
+    with (
+        patch(
+            "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+            return_value={"AAPL": "0000320193"},
+        ) as mock_mapping,
+        patch(
+            "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+        ) as mocked_fetch,
+    ):
+        dl = Downloader(
+            "foo", "bar@baz.com", cache_folder=tmp_path, ticker_cache_ttl=60
+        )
+        assert mock_mapping.call_count == 0
+
+        # CIKs do not require the mapping
+        dl.get(form_10k, apple_cik)
+        assert mock_mapping.call_count == 0
+
+        dl.get(form_10k, "AAPL")
+        dl.get(form_10k, "aapl")
+        assert mock_mapping.call_count == 1
+
+    assert mocked_fetch.call_count == 3
+    assert mocked_fetch.call_args.args[0].cik == apple_cik
+    assert mock_mapping.call_args.args == (
+        dl.gateway,
+        tmp_path / "company_tickers_exchange.json",
+        60,
+    )
+
+
+def test_default_cache_folder(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert Downloader("foo", "bar@baz.com").cache_folder == (
+        tmp_path / "sec-edgar-downloader"
+    )
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert Downloader("foo", "bar@baz.com").cache_folder == (
+        Path.home() / ".cache" / "sec-edgar-downloader"
+    )
+
+
+def test_cache_submissions(tmp_path, form_10k, apple_cik):
+    assert Downloader("foo", "bar@baz.com").submissions_store is None
+
+    dl = Downloader("foo", "bar@baz.com", cache_folder=tmp_path, cache_submissions=True)
+    assert dl.submissions_store.path == tmp_path / "submissions.sqlite3"
+    assert dl.submissions_store.path.exists()
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings",
+    ) as mocked_fetch:
+        dl.get(form_10k, apple_cik)
+
+    assert mocked_fetch.call_args.args[3] is dl.submissions_store
+    assert mocked_fetch.call_args.args[4] is True
+
+
+def test_ingest_submissions_archive(tmp_path, submissions_archive, form_10k, apple_cik):
+
+    with pytest.raises(ValueError) as exc_info:
+        Downloader("foo", "bar@baz.com").ingest_submissions_archive(submissions_archive)
+    assert "Submissions store is disabled" in str(exc_info.value)
+
+    dl = Downloader(
+        "foo",
+        "bar@baz.com",
+        tmp_path,
+        cache_folder=tmp_path,
+        cache_submissions=True,
+        refresh_submissions=False,
+    )
+    assert dl.ingest_submissions_archive(str(submissions_archive)) == 1
+
+    # Filings are served from the ingested archive without any API requests
+    with (
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, return_value=[b"content"]
+        ) as mock_stream_filing,
+        patch.object(SecGateway, "get_if_modified", autospec=True) as mock_refresh,
+        patch.object(
+            SecGateway, "get_list_of_available_filings", autospec=True
+        ) as mock_get_list_of_available_filings,
+    ):
+        assert dl.get(form_10k, apple_cik, limit=3) == 3
+
+    assert mock_refresh.call_count == 0
+    assert mock_get_list_of_available_filings.call_count == 0
+    assert mock_stream_filing.call_count == 3
+
+
+def test_crawl(tmp_path):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+
+    with patch(
+        "sec_edgar_downloader._Downloader.crawl_and_save_filings",
+        return_value={"8-K": 3},
+    ) as mock_crawl:
+        assert (
+            dl.crawl("8-K", after="2023-03-01", before="2023-03-07", max_workers=2) == 3
+        )
+
+    download_metadata, gateway, max_workers = mock_crawl.call_args.args
+    assert download_metadata.form == "8-K"
+    assert download_metadata.after == date(2023, 3, 1)
+    assert download_metadata.before == date(2023, 3, 7)
+    assert download_metadata.download_folder == tmp_path
+    assert gateway is dl.gateway
+    assert max_workers == 2
+
+    with pytest.raises(ValueError):
+        dl.crawl("FAKE-FORM")
+
+
+@patch(
+    "sec_edgar_downloader._Downloader.get_ticker_to_cik_mapping",
+    return_value={"AAPL": "0000320193"},
+)
+def test_manifest(_, tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    assert dl.manifest.path == tmp_path / "sec-edgar-filings" / "manifest.sqlite3"
+
+    with patch(
+        "sec_edgar_downloader._Downloader.fetch_and_save_filings"
+    ) as mocked_fetch:
+        dl.get(form_10k, apple_cik)
+    assert mocked_fetch.call_args.kwargs["manifest"] is dl.manifest
+
+    filing_folder = tmp_path / "sec-edgar-filings" / apple_cik / form_10k / "acc_num"
+    filing_folder.mkdir(parents=True)
+    (filing_folder / "full-submission.txt").write_bytes(b"filing")
+
+    assert not dl.is_downloaded("acc_num")
+    assert dl.rebuild_manifest() == 1
+    assert dl.is_downloaded("acc_num")
+    assert [d.accession_number for d in dl.list_downloaded("AAPL", form_10k)] == [
+        "acc_num"
+    ]
+    assert dl.list_downloaded(form="8-K") == []
+
+    (filing_folder / "full-submission.txt").unlink()
+    assert dl.rebuild_manifest() == 0
+    assert dl.list_downloaded() == []
+
+
+def _to_download(i):
+    return ToDownload(
+        raw_filing_uri=f"raw_{i}",
+        primary_doc_uri=f"pd_{i}",
+        accession_number=f"acc_num_{i}",
+        details_doc_suffix=".xml",
+    )
+
+
+def test_resume_after_crash_during_downloads(tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    streamed = []
+
+    def crash_on_third_filing(_, uri, compression=None):
+        if uri == "raw_2" and uri not in streamed:
+            streamed.append(uri)
+            raise KeyboardInterrupt
+        streamed.append(uri)
+        return [uri.encode()]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            return_value=[_to_download(i) for i in range(4)],
+        ) as mock_iter_filings,
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=crash_on_third_filing,
+        ),
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            dl.get(form_10k, apple_cik, job_id="backfill")
+
+        with pytest.raises(ValueError):
+            dl.get(form_10k, apple_cik, job_id="backfill")
+
+        # The job is continued from its journal without any metadata requests
+        assert Downloader("foo", "bar@baz.com", tmp_path).resume("backfill") == 2
+        assert mock_iter_filings.call_count == 1
+        assert dl.resume("backfill") == 0
+
+    assert streamed == ["raw_0", "raw_1", "raw_2", "raw_2", "raw_3"]
+
+    with pytest.raises(ValueError):
+        dl.resume("missing")
+
+
+def test_resume_after_crash_during_pagination(tmp_path, form_10k, apple_cik):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+    pages = [[_to_download(0), _to_download(1)], [_to_download(2)]]
+
+    def crash_after_first_page(*_):
+        yield from pages[0]
+        raise KeyboardInterrupt
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            side_effect=[crash_after_first_page(), iter(pages[0] + pages[1])],
+        ) as mock_iter_filings,
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode()],
+        ) as mock_stream_filing,
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            dl.get([form_10k], apple_cik, job_id="backfill")
+
+        # The job had not found all of its filings, so they are looked up again.
+        # Its result has the same shape as that of the get() call that started it.
+        assert dl.resume("backfill", max_workers=2) == {form_10k: 3}
+
+    assert mock_iter_filings.call_count == 2
+    # Filings are downloaded by two workers, in no particular order
+    assert sorted(c.args[1] for c in mock_stream_filing.call_args_list) == [
+        "raw_0",
+        "raw_1",
+        "raw_2",
+    ]
+
+
+def test_resume_crawl(tmp_path, form_10k):
+    dl = Downloader("foo", "bar@baz.com", tmp_path)
+
+    def crash(*_):
+        yield _to_download(0)
+        raise KeyboardInterrupt
+
+    with (
+        patch(
+            "sec_edgar_downloader._edgar_index.iter_index_filings",
+            side_effect=crash,
+        ),
+        patch(
+            "sec_edgar_downloader._Downloader.iter_index_filings",
+            return_value=[_to_download(0), _to_download(1)],
+        ) as mock_iter_index_filings,
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode()],
+        ),
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            dl.crawl(form_10k, job_id="crawl")
+
+        assert dl.resume("crawl") == 2
+
+    download_metadata = mock_iter_index_filings.call_args.args[0]
+    assert download_metadata.cik == ""
+    assert download_metadata.forms == (form_10k,)
@@ -0,0 +1,267 @@
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from sec_edgar_downloader._constants import (
+    FILING_FULL_SUBMISSION_FILENAME,
+    ROOT_SAVE_FOLDER_NAME,
+)
+from sec_edgar_downloader._edgar_index import (
+    crawl_and_save_filings,
+    get_index_uris,
+    iter_index_filings,
+    iter_lines,
+    parse_master_index,
+)
+from sec_edgar_downloader._sec_gateway import SecGateway
+from sec_edgar_downloader._types import DownloadMetadata
+
+SAMPLE_INDEX = Path(__file__).parent / "test_data" / "sample_index"
+
+FULL_INDEX_2023_Q1 = (
+    "https://www.sec.gov/Archives/edgar/full-index/2023/QTR1/master.idx"
+)
+DAILY_INDEX_2023_04_03 = (
+    "https://www.sec.gov/Archives/edgar/daily-index/2023/QTR2/master.20230403.idx"
+)
+DAILY_INDEX_2023_04_04 = (
+    "https://www.sec.gov/Archives/edgar/daily-index/2023/QTR2/master.20230404.idx"
+)
+
+
+def _mock_stream_index(_, uri, compression=None):
+    index_path = {
+        FULL_INDEX_2023_Q1: SAMPLE_INDEX / "master.idx",
+        DAILY_INDEX_2023_04_03: SAMPLE_INDEX / "master.20230403.idx",
+    }.get(uri)
+    if index_path is None:
+        resp = requests.Response()
+        resp.status_code = 404
+        raise requests.HTTPError("Not Found", response=resp)
+
+    contents = index_path.read_bytes()
+    # Split records across chunks
+    for i in range(0, len(contents), 64):
+        yield contents[i : i + 64]
+
+
+def _download_metadata(tmp_path, **kwargs):
+    return DownloadMetadata(
+        download_folder=tmp_path,
+        form="8-K",
+        cik="",
+        after=date(2023, 1, 1),
+        before=date(2023, 4, 4),
+        **kwargs,
+    )
+
+
+def test_get_index_uris():
+    # Whole quarters use the full-index, partial quarters the daily-index
+    assert get_index_uris(date(2023, 1, 1), date(2023, 4, 4)) == [
+        DAILY_INDEX_2023_04_04,
+        DAILY_INDEX_2023_04_03,
+        FULL_INDEX_2023_Q1,
+    ]
+    # Weekends are skipped
+    assert get_index_uris(date(2023, 4, 1), date(2023, 4, 2)) == []
+    assert get_index_uris(date(2022, 10, 1), date(2022, 12, 31)) == [
+        "https://www.sec.gov/Archives/edgar/full-index/2022/QTR4/master.idx"
+    ]
+    assert get_index_uris(date(2022, 12, 30), date(2023, 1, 2)) == [
+        "https://www.sec.gov/Archives/edgar/daily-index/2023/QTR1/master.20230102.idx",
+        "https://www.sec.gov/Archives/edgar/daily-index/2022/QTR4/master.20221230.idx",
+    ]
+
+
+def test_iter_lines():
+    assert list(iter_lines([b"a|b\r\nc", b"|d\n", b"", b"caf\xe9"])) == [
+        "a|b",
+        "c|d",
+        "café",
+    ]
+
+
+def test_parse_master_index():
+    # Records are only read after the header
+    assert list(parse_master_index(["1|A|8-K|2023-01-01|edgar/data/1/a.txt"])) == []
+
+    lines = (SAMPLE_INDEX / "master.20230403.idx").read_text().splitlines()
+    lines.append("not a record")
+
+    assert list(parse_master_index(lines)) == [
+        (
+            "320193",
+            "4",
+            "2023-04-03",
+            "edgar/data/320193/0000320193-23-000040.txt",
+        ),
+        (
+            "1067983",
+            "8-K",
+            "2023-04-03",
+            "edgar/data/1067983/0001193125-23-090100.txt",
+        ),
+        (
+            "1318605",
+            "8-K",
+            "2023-04-03",
+            "edgar/data/1318605/0000950170-23-010500.txt",
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        (
+            {},
+            [
+                "0001193125-23-090100",
+                "0000950170-23-010500",
+                # Records of the quarterly index are sorted by CIK, not date
+                "0001193125-23-071235",
+                "0000320193-23-000005",
+                "0000950170-23-000567",
+            ],
+        ),
+        ({"limit": 2}, ["0001193125-23-090100", "0000950170-23-010500"]),
+        # The newest filings of an index file are kept, not the lowest CIKs
+        (
+            {"limit": 3},
+            [
+                "0001193125-23-090100",
+                "0000950170-23-010500",
+                "0001193125-23-071235",
+            ],
+        ),
+        (
+            {"include_amends": True, "limit": 6},
+            [
+                "0001193125-23-090100",
+                "0000950170-23-010500",
+                "0001193125-23-075000",
+                "0001193125-23-071235",
+                "0000320193-23-000005",
+                "0000950170-23-000567",
+            ],
+        ),
+    ],
+)
+def test_iter_index_filings(tmp_path, gateway, kwargs, expected):
+    with patch.object(
+        SecGateway, "stream_filing", autospec=True, side_effect=_mock_stream_index
+    ):
+        result = list(
+            iter_index_filings(_download_metadata(tmp_path, **kwargs), gateway)
+        )
+
+    assert [td.accession_number for td in result] == expected
+    assert result[0].cik == "0001067983"
+    assert result[0].raw_filing_uri == (
+        "https://www.sec.gov/Archives/edgar/data/1067983/"
+        "000119312523090100/0001193125-23-090100.txt"
+    )
+
+
+def test_iter_index_filings_given_multiple_forms(tmp_path, gateway):
+    with patch.object(
+        SecGateway, "stream_filing", autospec=True, side_effect=_mock_stream_index
+    ):
+        result = list(
+            iter_index_filings(
+                _download_metadata(tmp_path, limit=1, forms=("8-K", "4", "10-*")),
+                gateway,
+            )
+        )
+
+    # Index files stop being read once every requested form has reached the limit
+    assert [(td.accession_number, td.form) for td in result] == [
+        ("0000320193-23-000040", "4"),
+        ("0001193125-23-090100", "8-K"),
+        ("0000320193-23-000006", "10-Q"),
+    ]
+
+
+def test_iter_index_filings_given_date_range(tmp_path, gateway):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form="8-K",
+        cik="",
+        after=date(2023, 1, 1),
+        before=date(2023, 3, 31),
+    )
+
+    with patch.object(
+        SecGateway, "stream_filing", autospec=True, side_effect=_mock_stream_index
+    ) as mock_stream_filing:
+        result = list(iter_index_filings(download_metadata, gateway))
+
+    assert len(result) == 3
+    assert mock_stream_filing.call_count == 1
+
+    # Records outside of the date range are filtered out
+    download_metadata.after = date(2023, 2, 1)
+    download_metadata.before = date(2023, 3, 1)
+    with (
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=_mock_stream_index
+        ),
+        patch(
+            "sec_edgar_downloader._edgar_index.get_index_uris",
+            return_value=[FULL_INDEX_2023_Q1],
+        ),
+    ):
+        result = list(iter_index_filings(download_metadata, gateway))
+
+    assert [td.accession_number for td in result] == ["0000320193-23-000005"]
+
+
+def test_iter_index_filings_given_server_error(tmp_path, gateway):
+    resp = requests.Response()
+    resp.status_code = 500
+
+    with (
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=requests.HTTPError("Server Error", response=resp),
+        ),
+        pytest.raises(requests.HTTPError),
+    ):
+        list(iter_index_filings(_download_metadata(tmp_path), gateway))
+
+
+def test_crawl_and_save_filings(tmp_path, gateway):
+    def mock_stream_filing(self, uri, compression=None):
+        if "/Archives/edgar/data/" in uri:
+            return [f"contents of {uri}".encode()]
+        return _mock_stream_index(self, uri)
+
+    with patch.object(
+        SecGateway, "stream_filing", autospec=True, side_effect=mock_stream_filing
+    ):
+        num_downloaded = crawl_and_save_filings(
+            _download_metadata(
+                tmp_path, accession_numbers_to_skip={"0000320193-23-000005"}
+            ),
+            gateway,
+            max_workers=2,
+        )
+
+    assert num_downloaded == {"8-K": 4}
+    root = tmp_path / ROOT_SAVE_FOLDER_NAME
+    saved = sorted(
+        p.relative_to(root).as_posix()
+        for p in root.glob(f"*/8-K/*/{FILING_FULL_SUBMISSION_FILENAME}")
+    )
+    assert saved == [
+        "0000789019/8-K/0001193125-23-071235/full-submission.txt",
+        "0001000045/8-K/0000950170-23-000567/full-submission.txt",
+        "0001067983/8-K/0001193125-23-090100/full-submission.txt",
+        "0001318605/8-K/0000950170-23-010500/full-submission.txt",
+    ]
@@ -161,9 +161,10 @@ def test_integration_verify_file_contents(
 
 def test_integration_verify_folder_structure(network_downloader):
     """Download a number of filings from different companies to ensure
-    that the file directory looks as follows, with 9 directories, 7 files:
+    that the file directory looks as follows, with 9 directories, 8 files:
 
     sec_edgar_filings
+    ├── manifest.sqlite3
     ├── AAPL
     │   ├── 10-K
     │   │   └── 0000320193-20-000096
@@ -220,7 +221,7 @@ def test_integration_verify_folder_structure(network_downloader):
     assert downloaded_filing.is_file()
 
     # Ensure that only one ticker is present after AAPL downloads
-    assert len(list(filings_save_path.glob("*"))) == 1
+    assert len([p for p in filings_save_path.iterdir() if p.is_dir()]) == 1
 
     # Verify IBM Form 4 download
     ticker = "IBM"
@@ -242,4 +243,5 @@ def test_integration_verify_folder_structure(network_downloader):
     assert downloaded_filing.is_file()
 
     # Ensure that two tickers are present after AAPL and IBM downloads
-    assert len(list(filings_save_path.glob("*"))) == 2
+    assert len([p for p in filings_save_path.iterdir() if p.is_dir()]) == 2
+    assert (filings_save_path / "manifest.sqlite3").is_file()
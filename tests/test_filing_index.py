@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from sec_edgar_downloader._filing_index import (
+    get_document_uri,
+    get_filing_index_uri,
+    load_filing_index,
+    parse_filing_index,
+    select_documents,
+)
+from sec_edgar_downloader._orchestrator import get_to_download
+from sec_edgar_downloader._sec_gateway import SecGateway
+from sec_edgar_downloader._storage import MemoryStorage
+from sec_edgar_downloader._types import DownloadMetadata, FilingIndexDocument
+
+FILING_INDEX_HTML = """
+<html><body>
+<table class="tableFile2"><tr><td>Not a document table</td>
+<td><a href="/x.htm">x</a></td><td>x</td><td>x</td><td>1</td></tr></table>
+<table class="tableFile" summary="Document Format Files">
+<tr><th>Seq</th><th>Description</th><th>Document</th><th>Type</th><th>Size</th></tr>
+<tr>
+<td>1</td><td>10-K</td>
+<td><a href="/ix?doc=/Archives/edgar/data/320193/000032019322000108/aapl-20220924.htm">
+aapl-20220924.htm</a> &nbsp;&nbsp;<span>iXBRL</span></td>
+<td>10-K</td><td>1,538,187</td>
+</tr>
+<tr>
+<td>2</td><td>Subsidiaries</td>
+<td><a href="/Archives/edgar/data/320193/000032019322000108/a10-kexhibit21.htm">
+a10-kexhibit21.htm</a></td>
+<td>EX-21.1</td><td>4452</td>
+</tr>
+<tr>
+<td>&nbsp;</td><td>Complete submission text file</td>
+<td><a href="/Archives/edgar/data/320193/000032019322000108/0000320193-22-000108.txt">
+0000320193-22-000108.txt</a></td>
+<td>&nbsp;</td><td>11032712</td>
+</tr>
+<tr><td>3</td><td>No document</td><td></td><td>EX-99</td><td>1</td></tr>
+</table>
+<table class="tableFile" summary="Data Files">
+<tr>
+<td>4</td><td>XBRL INSTANCE</td>
+<td><a href="/Archives/edgar/data/320193/000032019322000108/aapl-20220924_htm.xml">
+aapl-20220924_htm.xml</a></td>
+<td>XML</td><td></td>
+</tr>
+</table>
+</body></html>
+"""
+
+
+def test_parse_filing_index():
+    assert parse_filing_index(FILING_INDEX_HTML) == [
+        FilingIndexDocument("aapl-20220924.htm", "10-K", "10-K", "1", 1538187),
+        FilingIndexDocument("a10-kexhibit21.htm", "EX-21.1", "Subsidiaries", "2", 4452),
+        FilingIndexDocument(
+            "0000320193-22-000108.txt",
+            "",
+            "Complete submission text file",
+            None,
+            11032712,
+        ),
+        FilingIndexDocument("aapl-20220924_htm.xml", "XML", "XBRL INSTANCE", "4"),
+    ]
+    assert parse_filing_index("<html></html>") == []
+
+
+def test_get_filing_index_uri(apple_cik):
+    td = get_to_download(apple_cik, "0000320193-22-000108", "aapl-20220924.htm")
+    folder_uri = "https://www.sec.gov/Archives/edgar/data/320193/000032019322000108"
+
+    assert get_filing_index_uri(td) == (f"{folder_uri}/0000320193-22-000108-index.htm")
+    assert get_document_uri(td, "a10-kexhibit21.htm") == (
+        f"{folder_uri}/a10-kexhibit21.htm"
+    )
+
+
+def test_select_documents(tmp_path, form_10k, apple_cik):
+    documents = parse_filing_index(FILING_INDEX_HTML)
+    download_metadata = DownloadMetadata(tmp_path, form_10k, apple_cik)
+
+    def select(**kwargs):
+        return [
+            d.filename
+            for d in select_documents(
+                DownloadMetadata(tmp_path, form_10k, apple_cik, **kwargs), documents
+            )
+        ]
+
+    assert select_documents(download_metadata, documents) == documents
+    # Types are matched case-insensitively, and may be wildcards
+    assert select(document_types=("ex-21*", "XML")) == [
+        "a10-kexhibit21.htm",
+        "aapl-20220924_htm.xml",
+    ]
+    assert select(document_filename="*.htm") == [
+        "aapl-20220924.htm",
+        "a10-kexhibit21.htm",
+    ]
+    # Documents of unknown size are skipped
+    assert select(max_document_size=5000) == ["a10-kexhibit21.htm"]
+    # All filters must match
+    assert select(document_types=("10-K",), max_document_size=5000) == []
+
+
+def test_load_filing_index(gateway, apple_cik):
+    td = get_to_download(apple_cik, "0000320193-22-000108", "aapl-20220924.htm")
+    storage = MemoryStorage()
+    key = f"{apple_cik}/10-K/{td.accession_number}/{td.accession_number}-index.htm"
+
+    with patch.object(
+        SecGateway, "download_filing", return_value=FILING_INDEX_HTML.encode()
+    ) as mocked:
+        documents = load_filing_index(gateway, td, storage, key)
+        # The saved index is read back instead of being requested again
+        assert load_filing_index(gateway, td, storage, key) == documents
+
+    mocked.assert_called_once_with(get_filing_index_uri(td))
+    assert len(documents) == 4
+    assert storage.documents[key] == FILING_INDEX_HTML.encode()
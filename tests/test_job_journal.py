@@ -0,0 +1,118 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from sec_edgar_downloader._job_journal import (
+    JOB_KIND_GET,
+    JobJournal,
+    decode_download_metadata,
+    encode_download_metadata,
+)
+from sec_edgar_downloader._types import DownloadMetadata, ToDownload
+
+
+def _to_download(i):
+    return ToDownload(
+        raw_filing_uri=f"raw_{i}",
+        primary_doc_uri=f"pd_{i}",
+        accession_number=f"acc_num_{i}",
+        details_doc_suffix=".xml",
+        form="SC 13G" if i % 2 else None,
+        size=i * 1000 if i % 2 else None,
+    )
+
+
+def test_encode_download_metadata(form_10k, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("/tmp/filings"),
+        form=form_10k,
+        cik=apple_cik,
+        limit=5,
+        after=date(2020, 1, 1),
+        before=date(2021, 1, 1),
+        include_amends=True,
+        ticker="AAPL",
+        accession_numbers_to_skip={"b", "a"},
+        forms=(form_10k, "SC 13*"),
+        document_types=("EX-21*",),
+        download_full_submission=False,
+        max_total_size=10_000,
+        size_order="smallest-first",
+        items=("2.02",),
+        is_xbrl=True,
+        report_after=date(2022, 1, 1),
+    )
+
+    encoded = encode_download_metadata(download_metadata)
+    assert decode_download_metadata(encoded) == download_metadata
+
+    download_metadata.accession_numbers_to_skip = None
+    encoded = encode_download_metadata(download_metadata)
+    assert decode_download_metadata(encoded) == download_metadata
+
+
+def test_job_journal(tmp_path, form_10k, apple_cik):
+    journal = JobJournal(tmp_path / "filings" / "jobs.sqlite3")
+    # Nothing is created until the journal is used
+    assert not (tmp_path / "filings").exists()
+
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik
+    )
+    job = journal.create_job("job", JOB_KIND_GET, download_metadata, [form_10k])
+    assert not job.planned
+
+    with pytest.raises(ValueError) as exc_info:
+        journal.create_job("job", JOB_KIND_GET, download_metadata, form_10k)
+    assert "Job 'job' already exists" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        journal.get_job("missing")
+    assert "Job 'missing' does not exist" in str(exc_info.value)
+
+    job.plan(_to_download(i) for i in range(4))
+    assert job.planned
+    job.complete(_to_download(0))
+    job.complete(_to_download(2))
+
+    resumed = journal.get_job("job")
+    assert resumed.planned
+    assert resumed.kind == JOB_KIND_GET
+    # A collection of a single form is not mistaken for a single form
+    assert resumed.form == [form_10k]
+    assert resumed.download_metadata == download_metadata
+    assert resumed.get_pending() == [_to_download(1), _to_download(3)]
+
+    # An interrupted plan records nothing
+    interrupted = journal.create_job(
+        "interrupted", JOB_KIND_GET, download_metadata, form_10k
+    )
+
+    def interrupted_plan():
+        yield _to_download(0)
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.plan(interrupted_plan())
+    assert not journal.get_job("interrupted").planned
+    assert journal.get_job("interrupted").form == form_10k
+    assert interrupted.get_pending() == []
+
+
+def test_job_journal_not_locked_while_planning(tmp_path, form_10k, apple_cik):
+    journal = JobJournal(tmp_path / "jobs.sqlite3")
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik
+    )
+    job = journal.create_job("job", JOB_KIND_GET, download_metadata, form_10k)
+
+    def plan():
+        yield _to_download(0)
+        # Other jobs sharing the journal are recorded while filings are found
+        journal.create_job("other", JOB_KIND_GET, download_metadata, form_10k)
+        yield _to_download(1)
+
+    job.plan(plan())
+    assert job.get_pending() == [_to_download(0), _to_download(1)]
+    assert not journal.get_job("other").planned
@@ -0,0 +1,96 @@
+import hashlib
+from datetime import datetime, timezone
+
+from sec_edgar_downloader._manifest import Manifest
+from sec_edgar_downloader._pack import FilingPack
+
+
+def test_manifest(tmp_path, apple_cik):
+    root = tmp_path / "sec-edgar-filings"
+    manifest = Manifest(root / "manifest.sqlite3")
+    # Nothing is created until the manifest is used
+    assert not root.exists()
+
+    ten_k = root / apple_cik / "10-K" / "0000320193-22-000108" / "full-submission.txt"
+    eight_k = root / apple_cik / "8-K" / "0000320193-23-000005" / "full-submission.txt"
+    downloaded_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert manifest.get_downloaded_sizes([ten_k, eight_k]) == {}
+    assert not manifest.is_downloaded("0000320193-22-000108")
+
+    manifest.record(
+        ten_k, "0000320193-22-000108", apple_cik, "10-K", 3, "abc", downloaded_at
+    )
+    manifest.record(eight_k, "0000320193-23-000005", apple_cik, "8-K", 5, "def")
+
+    assert manifest.get_downloaded_sizes([ten_k, eight_k]) == {ten_k: 3, eight_k: 5}
+    assert manifest.is_downloaded("0000320193-22-000108")
+    assert [d.path for d in manifest.list_downloaded()] == [ten_k, eight_k]
+    assert manifest.list_downloaded(form="8-K")[0].path == eight_k
+    assert manifest.list_downloaded(cik="0000789019") == []
+
+    (document,) = manifest.list_downloaded(apple_cik, "10-K")
+    assert document.accession_number == "0000320193-22-000108"
+    assert document.cik == apple_cik
+    assert document.size == 3
+    assert document.sha256 == "abc"
+    assert document.downloaded_at == downloaded_at
+
+
+def test_manifest_rebuilt_from_existing_tree(tmp_path, apple_cik):
+    root = tmp_path / "sec-edgar-filings"
+    filing_folder = root / "AAPL" / "10-K" / "0000320193-22-000108"
+    filing_folder.mkdir(parents=True)
+    (filing_folder / "full-submission.txt").write_bytes(b"filing")
+    (filing_folder / "primary-document.html").write_bytes(b"document")
+    # Interrupted downloads are not recorded
+    (filing_folder / ".full-submission.txt.abc.part").write_bytes(b"fil")
+    cik_folder = root / apple_cik / "8-K" / "0000320193-23-000005"
+    cik_folder.mkdir(parents=True)
+    (cik_folder / "full-submission.txt").write_bytes(b"8-K")
+
+    manifest = Manifest(root / "manifest.sqlite3")
+    # Existing documents are not hashed until the manifest is rebuilt
+    assert manifest.list_downloaded() == []
+
+    assert manifest.rebuild() == 3
+    documents = manifest.list_downloaded()
+    assert [d.path.relative_to(root).as_posix() for d in documents] == [
+        "0000320193/8-K/0000320193-23-000005/full-submission.txt",
+        "AAPL/10-K/0000320193-22-000108/full-submission.txt",
+        "AAPL/10-K/0000320193-22-000108/primary-document.html",
+    ]
+    assert documents[0].cik == apple_cik
+    # The CIK of documents saved under a ticker is unknown
+    assert documents[1].cik is None
+    assert documents[1].form == "10-K"
+    assert documents[1].size == 6
+    assert documents[1].sha256 == hashlib.sha256(b"filing").hexdigest()
+
+    (cik_folder / "full-submission.txt").unlink()
+    assert manifest.rebuild() == 2
+    assert not manifest.is_downloaded("0000320193-23-000005")
+
+
+def test_manifest_rebuilt_from_packs(tmp_path, apple_cik):
+    root = tmp_path / "sec-edgar-filings"
+    source = tmp_path / "source"
+    source.write_bytes(b"filing")
+    FilingPack(root / apple_cik / "10-K.pack").append(
+        "0000320193-22-000108", "full-submission.txt", source
+    )
+    FilingPack(root / "AAPL" / "8-K.pack").append(
+        "0000320193-23-000005", "full-submission.txt", source
+    )
+
+    manifest = Manifest(root / "manifest.sqlite3")
+    assert manifest.rebuild() == 2
+    documents = manifest.list_downloaded()
+
+    assert [d.path.relative_to(root).as_posix() for d in documents] == [
+        "0000320193/10-K/0000320193-22-000108/full-submission.txt",
+        "AAPL/8-K/0000320193-23-000005/full-submission.txt",
+    ]
+    assert [d.cik for d in documents] == [apple_cik, None]
+    assert documents[0].size == 6
+    assert documents[0].sha256 == hashlib.sha256(b"filing").hexdigest()
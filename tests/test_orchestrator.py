@@ -1,22 +1,47 @@
+import hashlib
 import json
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import date
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from requests.exceptions import RequestException
 
-from sec_edgar_downloader._constants import DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE
+from sec_edgar_downloader._constants import (
+    DEFAULT_AFTER_DATE,
+    DEFAULT_BEFORE_DATE,
+    FILING_FULL_SUBMISSION_FILENAME,
+    ROOT_SAVE_FOLDER_NAME,
+)
+from sec_edgar_downloader._filing_index import get_document_uri, get_filing_index_uri
+from sec_edgar_downloader._manifest import Manifest
 from sec_edgar_downloader._orchestrator import (
+    aggregate_filings_from_store,
     aggregate_filings_to_download,
     fetch_and_save_filings,
+    fetch_and_save_filings_many,
+    filter_filings_page,
     get_save_location,
     get_ticker_to_cik_mapping,
     get_to_download,
+    map_bounded,
     save_document,
 )
-from sec_edgar_downloader._types import DownloadMetadata, ToDownload
+from sec_edgar_downloader._pack import FilingPack
+from sec_edgar_downloader._sec_gateway import SecGateway
+from sec_edgar_downloader._storage import LocalStorage, MemoryStorage
+from sec_edgar_downloader._submissions_store import SubmissionsStore
+from sec_edgar_downloader._types import (
+    DownloadMetadata,
+    FilingIndexDocument,
+    ToDownload,
+)
 
 
 def test_get_save_location(user_agent, form_10k, apple_cik):
@@ -62,15 +87,80 @@ def test_get_save_location_given_ticker(user_agent, form_10k, apple_cik):
     )
 
 
+def test_get_save_location_given_compression(form_10k, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form=form_10k, cik=apple_cik, compression="zstd"
+    )
+    accession_number = "0000320193-22-000108"
+
+    assert get_save_location(
+        download_metadata, accession_number, FILING_FULL_SUBMISSION_FILENAME
+    ) == Path(
+        "./sec-edgar-filings/0000320193/10-K/0000320193-22-000108/"
+        "full-submission.txt.zst"
+    )
+    # Other documents are stored uncompressed
+    assert get_save_location(
+        download_metadata, accession_number, "primary-document.html"
+    ) == Path(
+        "./sec-edgar-filings/0000320193/10-K/0000320193-22-000108/"
+        "primary-document.html"
+    )
+
+
 def test_save_document(tmp_path):
     sample_contents = b"example data to write"
     save_path = tmp_path / "foo" / "bar" / "baz" / "filing.txt"
     assert not save_path.exists()
 
-    save_document(sample_contents, save_path)
+    num_bytes = save_document(sample_contents, save_path)
 
     assert save_path.exists()
     assert save_path.stat().st_size > 0
+    assert num_bytes == len(sample_contents)
+
+
+def test_save_document_given_chunks(tmp_path):
+    save_path = tmp_path / "foo" / "filing.txt"
+
+    num_bytes = save_document(iter([b"abc", b"def", b"g"]), save_path)
+
+    assert num_bytes == 7
+    assert save_path.read_bytes() == b"abcdefg"
+    # Only the final document remains, no temporary files
+    assert list(save_path.parent.iterdir()) == [save_path]
+
+
+def test_save_document_given_interrupted_stream(tmp_path):
+    save_path = tmp_path / "foo" / "filing.txt"
+
+    def interrupted_stream():
+        yield b"partial contents"
+        raise RequestException("Connection reset")
+
+    with pytest.raises(RequestException):
+        save_document(interrupted_stream(), save_path)
+
+    # Neither a truncated document nor a temporary file is left behind
+    assert list(save_path.parent.iterdir()) == []
+
+
+def test_save_document_overwrites_atomically(tmp_path):
+    save_path = tmp_path / "filing.txt"
+    save_path.write_bytes(b"old")
+
+    def interrupted_stream():
+        yield b"new"
+        raise RequestException("Connection reset")
+
+    with pytest.raises(RequestException):
+        save_document(interrupted_stream(), save_path)
+
+    assert save_path.read_bytes() == b"old"
+
+    save_document([b"new"], save_path)
+
+    assert save_path.read_bytes() == b"new"
 
 
 @pytest.mark.skipif(
@@ -91,7 +181,7 @@ def test_save_document(tmp_path):
     ],
 )
 def test_aggregate_filings_to_download_given_multiple_pages(
-    user_agent,
+    gateway,
     apple_cik,
     accession_number_to_metadata,
     form: str,
@@ -112,14 +202,13 @@ def test_aggregate_filings_to_download_given_multiple_pages(
         download_details=True,
     )
 
-    with patch(
-        "sec_edgar_downloader._orchestrator.get_list_of_available_filings",
-        autospec=True,
+    with patch.object(
+        SecGateway, "get_list_of_available_filings", autospec=True
     ) as mock_get_list_of_available_filings:
         mock_get_list_of_available_filings.side_effect = (
             _mock_sec_api_response_multi_page
         )
-        result = aggregate_filings_to_download(download_metadata, user_agent)
+        result = aggregate_filings_to_download(download_metadata, gateway)
 
     assert len(result) == expected_num_results
     for td in result:
@@ -131,6 +220,478 @@ def test_aggregate_filings_to_download_given_multiple_pages(
         assert metadata["filingDate"] <= before_date
 
 
+def _mock_paginated_submissions(num_pages, delays=None):
+    """Return a fake submissions API with one yearly 10-K per additional page."""
+
+    def filing_date(i):
+        return f"{2025 - i}-01-01"
+
+    def page(i):
+        return {
+            "accessionNumber": [f"0000320193-00-{i:06}"],
+            "form": ["10-K"],
+            "primaryDocument": ["doc.htm"],
+            "filingDate": [filing_date(i)],
+        }
+
+    def get_list_of_available_filings(_, submissions_uri):
+        name = submissions_uri.split("/")[-1]
+        if name == "CIK0000320193.json":
+            return {
+                "filings": {
+                    "recent": page(0),
+                    "files": [
+                        {
+                            "name": f"CIK0000320193-submissions-{i:03}.json",
+                            "filingFrom": filing_date(i),
+                            "filingTo": filing_date(i),
+                        }
+                        for i in range(1, num_pages + 1)
+                    ],
+                }
+            }
+        i = int(name.split("-")[-1].split(".")[0])
+        if delays is not None:
+            time.sleep(delays[i])
+        return page(i)
+
+    return get_list_of_available_filings
+
+
+@pytest.mark.parametrize("limit,expected_requests", [(sys.maxsize, 26), (5, 11)])
+def test_aggregate_filings_to_download_prefetches_pages_in_order(
+    user_agent, apple_cik, limit, expected_requests
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik, limit=limit
+    )
+    # Later pages in a window finish first, but results stay in page order
+    delays = [0.01 * (10 - i % 10) for i in range(26)]
+
+    with (
+        SecGateway(user_agent, pool_size=10) as gw,
+        patch.object(
+            SecGateway,
+            "get_list_of_available_filings",
+            autospec=True,
+            side_effect=_mock_paginated_submissions(25, delays),
+        ) as mock_get_list_of_available_filings,
+    ):
+        result = aggregate_filings_to_download(download_metadata, gw)
+
+    assert [td.accession_number for td in result] == [
+        f"0000320193-00-{i:06}" for i in range(min(limit, 26))
+    ]
+    # Pages are fetched in windows of pool_size, and no window is requested
+    # once the limit has been reached
+    assert mock_get_list_of_available_filings.call_count == expected_requests
+
+
+@pytest.mark.parametrize(
+    "after_date,before_date,expected_years,expected_requests",
+    [
+        # Only the pages within the date range are requested
+        (date(2015, 6, 1), date(2018, 6, 1), [2018, 2017, 2016], 4),
+        # Pages older than the date range are never requested
+        (date(2024, 6, 1), DEFAULT_BEFORE_DATE, [2025], 1),
+        # Pages newer than the date range are skipped as well
+        (DEFAULT_AFTER_DATE, date(2000, 6, 1), [2000], 2),
+    ],
+)
+def test_aggregate_filings_to_download_skips_pages_outside_date_range(
+    gateway, apple_cik, after_date, before_date, expected_years, expected_requests
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form="10-K",
+        cik=apple_cik,
+        after=after_date,
+        before=before_date,
+    )
+
+    with patch.object(
+        SecGateway,
+        "get_list_of_available_filings",
+        autospec=True,
+        side_effect=_mock_paginated_submissions(25),
+    ) as mock_get_list_of_available_filings:
+        result = aggregate_filings_to_download(download_metadata, gateway)
+
+    assert [int(td.accession_number[-2:]) for td in result] == [
+        2025 - year for year in expected_years
+    ]
+    assert mock_get_list_of_available_filings.call_count == expected_requests
+
+
+def test_aggregate_filings_to_download_prefetches_pages_concurrently(
+    user_agent, apple_cik
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik
+    )
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    get_page = _mock_paginated_submissions(8)
+
+    def tracking_get_page(self, submissions_uri):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return get_page(self, submissions_uri)
+
+    with (
+        SecGateway(user_agent, pool_size=4) as gw,
+        patch.object(
+            SecGateway,
+            "get_list_of_available_filings",
+            autospec=True,
+            side_effect=tracking_get_page,
+        ),
+    ):
+        result = aggregate_filings_to_download(download_metadata, gw)
+
+    assert len(result) == 9
+    assert max_in_flight == 4
+
+
+@pytest.mark.parametrize(
+    "include_amends,limit,expected",
+    [
+        (False, sys.maxsize, ["01", "04"]),
+        (True, sys.maxsize, ["01", "02", "04"]),
+        (True, 2, ["01", "02"]),
+    ],
+)
+def test_filter_filings_page(apple_cik, include_amends, limit, expected):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form="10-K",
+        cik=apple_cik,
+        limit=limit,
+        after=date(2020, 1, 1),
+        before=date(2021, 12, 31),
+        include_amends=include_amends,
+    )
+    filings_json = {
+        "accessionNumber": [f"0000320193-00-0000{i:02}" for i in range(6)],
+        "form": ["10-K", "10-K", "10-K/A", "10-Q", "10-K", "10-K"],
+        "primaryDocument": ["doc.htm"] * 6,
+        # Date bounds are inclusive
+        "filingDate": [
+            "2022-01-01",
+            "2021-12-31",
+            "2021-06-01",
+            "2021-01-01",
+            "2020-01-01",
+            "2019-12-31",
+        ],
+    }
+
+    fetched_counts = {}
+    result = filter_filings_page(download_metadata, filings_json, fetched_counts)
+
+    assert [td.accession_number[-2:] for td in result] == expected
+    # Amends are saved under their base form
+    assert {td.form for td in result} == {"10-K"}
+    assert fetched_counts == {"10-K": len(expected)}
+
+
+def test_filter_filings_page_given_sizes(apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik
+    )
+    filings_json = {
+        "accessionNumber": ["0000320193-00-000000", "0000320193-00-000001"],
+        "form": ["10-K", "10-K"],
+        "primaryDocument": ["doc.htm"] * 2,
+        "filingDate": ["2021-01-01"] * 2,
+        "size": [12345, None],
+    }
+
+    result = filter_filings_page(download_metadata, filings_json, {})
+
+    assert [td.size for td in result] == [12345, None]
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({}, ["00", "01", "02", "03"]),
+        ({"items": ("2.02",)}, ["00", "02"]),
+        ({"items": ("5.02", "9.01")}, ["00", "01"]),
+        ({"is_xbrl": True}, ["00", "02"]),
+        ({"is_xbrl": False}, ["01"]),
+        ({"is_inline_xbrl": True}, ["02"]),
+        # Filings without a report date never match a report date range
+        ({"report_after": date(2022, 7, 1)}, ["00", "02"]),
+        ({"report_before": date(2022, 6, 30)}, ["01"]),
+        (
+            {"report_after": date(2022, 7, 1), "report_before": date(2022, 9, 30)},
+            ["00"],
+        ),
+        ({"primary_doc_description": "*earnings*"}, ["00", "02"]),
+        # All filters must match, and the limit counts matching filings only
+        ({"items": ("2.02",), "is_inline_xbrl": True}, ["02"]),
+        ({"items": ("2.02",), "limit": 1}, ["00"]),
+    ],
+)
+def test_filter_filings_page_given_metadata_filters(apple_cik, kwargs, expected):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="8-K", cik=apple_cik, **kwargs
+    )
+    filings_json = {
+        "accessionNumber": [f"0000320193-00-0000{i:02}" for i in range(4)],
+        "form": ["8-K"] * 4,
+        "primaryDocument": ["doc.htm"] * 4,
+        "filingDate": ["2022-10-27"] * 4,
+        "reportDate": ["2022-09-24", "2022-06-25", "2022-10-27", ""],
+        "items": ["2.02,9.01", "5.02", "2.02", ""],
+        "isXBRL": [1, 0, 1, None],
+        "isInlineXBRL": [0, 0, 1, None],
+        "primaryDocDescription": ["Q4 Earnings Release", "8-K", "EARNINGS", None],
+    }
+
+    result = filter_filings_page(download_metadata, filings_json, {})
+
+    assert [td.accession_number[-2:] for td in result] == expected
+
+
+def test_filter_filings_page_given_missing_metadata(apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="8-K", cik=apple_cik, items=("2.02",)
+    )
+    filings_json = {
+        "accessionNumber": ["0000320193-00-000000"],
+        "form": ["8-K"],
+        "primaryDocument": ["doc.htm"],
+        "filingDate": ["2022-10-27"],
+    }
+
+    assert filter_filings_page(download_metadata, filings_json, {}) == []
+
+
+def test_filter_filings_page_given_multiple_forms(apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form="10-K",
+        cik=apple_cik,
+        limit=2,
+        forms=("10-K", "SC 13*"),
+    )
+    filings_json = {
+        "accessionNumber": [f"0000320193-00-0000{i:02}" for i in range(7)],
+        "form": ["10-K", "SC 13G", "SC 13G/A", "10-Q", "SC 13D", "10-K", "10-K"],
+        "primaryDocument": ["doc.htm"] * 7,
+        "filingDate": ["2021-01-01"] * 7,
+    }
+    fetched_counts = {}
+
+    result = filter_filings_page(download_metadata, filings_json, fetched_counts)
+
+    # Every requested form stops at the limit on its own
+    assert [(td.accession_number[-2:], td.form) for td in result] == [
+        ("00", "10-K"),
+        ("01", "SC 13G"),
+        ("04", "SC 13D"),
+        ("05", "10-K"),
+    ]
+    assert fetched_counts == {"10-K": 2, "SC 13*": 2}
+    # Limits carry over to subsequent pages
+    assert filter_filings_page(download_metadata, filings_json, fetched_counts) == []
+
+
+def _submissions_response(resp_json, etag='"v1"'):
+    return Mock(
+        status_code=200,
+        json=Mock(return_value=resp_json),
+        headers={"ETag": etag, "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+
+
+@pytest.mark.parametrize(
+    "form,limit,after_date,before_date,include_amends",
+    [
+        ("10-K", 3, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, False),
+        ("10-K", sys.maxsize, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, True),
+        ("10-K", sys.maxsize, date(2008, 1, 1), date(2012, 1, 1), False),
+        ("DEF 14A", sys.maxsize, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE, True),
+    ],
+)
+def test_aggregate_filings_from_store_matches_api(
+    tmp_path, gateway, apple_cik, form, limit, after_date, before_date, include_amends
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form=form,
+        cik=apple_cik,
+        limit=limit,
+        after=after_date,
+        before=before_date,
+        include_amends=include_amends,
+    )
+    first_page = _mock_sec_api_response_multi_page(None, "CIK0000320193.json")
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+
+    with (
+        patch.object(
+            SecGateway, "get_list_of_available_filings", autospec=True
+        ) as mock_get_list_of_available_filings,
+        patch.object(
+            SecGateway,
+            "get_if_modified",
+            autospec=True,
+            return_value=_submissions_response(first_page),
+        ),
+    ):
+        mock_get_list_of_available_filings.side_effect = (
+            _mock_sec_api_response_multi_page
+        )
+        expected = aggregate_filings_to_download(download_metadata, gateway)
+        result = aggregate_filings_from_store(download_metadata, gateway, store)
+
+    assert result == expected
+
+
+def test_aggregate_filings_from_store_refreshes_incrementally(
+    tmp_path, gateway, apple_cik
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik
+    )
+    first_page = _mock_sec_api_response_multi_page(None, "CIK0000320193.json")
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+
+    with (
+        patch.object(
+            SecGateway, "get_list_of_available_filings", autospec=True
+        ) as mock_get_list_of_available_filings,
+        patch.object(
+            SecGateway, "get_if_modified", autospec=True
+        ) as mock_get_if_modified,
+    ):
+        mock_get_list_of_available_filings.side_effect = (
+            _mock_sec_api_response_multi_page
+        )
+
+        # Initial refresh: the first page and all historical pages are merged
+        mock_get_if_modified.return_value = _submissions_response(first_page)
+        initial = aggregate_filings_from_store(download_metadata, gateway, store)
+        assert len(initial) == 27
+        assert mock_get_if_modified.call_args.kwargs == {
+            "etag": None,
+            "last_modified": None,
+        }
+        assert mock_get_list_of_available_filings.call_count == 1
+
+        # Unchanged first page: answered from the store without any pages
+        mock_get_if_modified.return_value = None
+        assert aggregate_filings_from_store(download_metadata, gateway, store) == (
+            initial
+        )
+        assert mock_get_if_modified.call_args.kwargs == {
+            "etag": '"v1"',
+            "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+        # New filing: it is merged without fetching historical pages again
+        recent = first_page["filings"]["recent"]
+        for column, value in [
+            ("accessionNumber", "0000320193-24-000123"),
+            ("filingDate", "2024-11-01"),
+            ("acceptanceDateTime", "2024-11-01T06:01:36.000Z"),
+            ("form", "10-K"),
+            ("primaryDocument", "aapl-20240928.htm"),
+        ]:
+            recent[column].insert(0, value)
+        mock_get_if_modified.return_value = _submissions_response(first_page, '"v2"')
+        updated = aggregate_filings_from_store(download_metadata, gateway, store)
+
+    assert mock_get_list_of_available_filings.call_count == 1
+    assert [td.accession_number for td in updated] == [
+        "0000320193-24-000123",
+        *(td.accession_number for td in initial),
+    ]
+    assert store.get_validators(apple_cik) == (
+        '"v2"',
+        "Wed, 01 Jan 2025 00:00:00 GMT",
+    )
+
+
+def test_aggregate_filings_from_store_without_refresh(tmp_path, gateway, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik
+    )
+    first_page = _mock_sec_api_response_multi_page(None, "CIK0000320193.json")
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+
+    with (
+        patch.object(
+            SecGateway,
+            "get_list_of_available_filings",
+            autospec=True,
+            side_effect=_mock_sec_api_response_multi_page,
+        ),
+        patch.object(
+            SecGateway,
+            "get_if_modified",
+            autospec=True,
+            return_value=_submissions_response(first_page),
+        ) as mock_get_if_modified,
+    ):
+        # CIKs missing from the store are still fetched
+        initial = aggregate_filings_from_store(
+            download_metadata, gateway, store, refresh=False
+        )
+        assert mock_get_if_modified.call_count == 1
+
+        # CIKs in the store are answered without any requests
+        assert (
+            aggregate_filings_from_store(
+                download_metadata, gateway, store, refresh=False
+            )
+            == initial
+        )
+        assert mock_get_if_modified.call_count == 1
+
+    assert len(initial) == 27
+
+
+def test_aggregate_filings_from_store_given_failed_refresh(
+    tmp_path, gateway, apple_cik
+):
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."), form="10-K", cik=apple_cik
+    )
+    first_page = _mock_sec_api_response_multi_page(None, "CIK0000320193.json")
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+
+    with (
+        patch.object(
+            SecGateway,
+            "get_list_of_available_filings",
+            autospec=True,
+            side_effect=RequestException("Non-2xx status code detected"),
+        ),
+        patch.object(
+            SecGateway,
+            "get_if_modified",
+            autospec=True,
+            return_value=_submissions_response(first_page),
+        ),
+        pytest.raises(RequestException),
+    ):
+        aggregate_filings_from_store(download_metadata, gateway, store)
+
+    # Nothing is merged, so the next refresh starts over
+    assert store.get_validators(apple_cik) == (None, None)
+    assert store.get_filings(apple_cik)["accessionNumber"] == []
+
+
 def test_get_to_download_given_xml(apple_cik, accession_number, form_4_primary_doc):
     result = get_to_download(apple_cik, accession_number, form_4_primary_doc)
 
@@ -173,7 +734,7 @@ def test_get_to_download_given_cik_with_trailing_zero():
     assert result.details_doc_suffix == ".html"
 
 
-def test_fetch_and_save_filings_given_download_details(user_agent, form_10k, apple_cik):
+def test_fetch_and_save_filings_given_download_details(gateway, form_10k, apple_cik):
     limit = 2
     download_metadata = DownloadMetadata(
         download_folder=Path("."),
@@ -196,37 +757,39 @@ def test_fetch_and_save_filings_given_download_details(user_agent, form_10k, app
         for i in range(limit)
     ]
 
-    with patch(
-        "sec_edgar_downloader._orchestrator.aggregate_filings_to_download",
-        new=lambda x, y: to_download_list,
-    ), patch(
-        "sec_edgar_downloader._orchestrator.download_filing", autospec=True
-    ) as mock_download_filing, patch(
-        "sec_edgar_downloader._orchestrator.save_document", autospec=True
-    ) as mock_save_document:
-        num_downloaded = fetch_and_save_filings(download_metadata, user_agent)
-
-    assert num_downloaded == 2
-    assert mock_download_filing.call_count == 4
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(SecGateway, "stream_filing", autospec=True) as mock_stream_filing,
+        patch(
+            "sec_edgar_downloader._storage.save_document", autospec=True
+        ) as mock_save_document,
+    ):
+        num_downloaded = fetch_and_save_filings(download_metadata, gateway)
+
+    assert num_downloaded == {download_metadata.form: 2}
+    assert mock_stream_filing.call_count == 4
     assert mock_save_document.call_count == 4
 
     # Assert URIs
     expected_uris = {td.raw_filing_uri for td in to_download_list} | {
         td.primary_doc_uri for td in to_download_list
     }
-    actual_uris = {c.args[0] for c in mock_download_filing.call_args_list}
+    actual_uris = {c.args[1] for c in mock_stream_filing.call_args_list}
     assert len(expected_uris) == len(actual_uris) == 4
     assert expected_uris == actual_uris
 
-    # Assert user-agent
-    actual_user_agent = {c.args[1] for c in mock_download_filing.call_args_list}
-    assert len(actual_user_agent) == 1
-    assert actual_user_agent.pop() == user_agent
+    # Assert that the same gateway is reused for every download
+    actual_gateways = {id(c.args[0]) for c in mock_stream_filing.call_args_list}
+    assert len(actual_gateways) == 1
+    assert actual_gateways.pop() == id(gateway)
 
     # Assert save locations
     expected_acc_nums = {td.accession_number for td in to_download_list}
     paths = [c.args[1] for c in mock_save_document.call_args_list]
-    actual_acc_nums = {p.parts[3] for p in paths}
+    actual_acc_nums = {p.parent.name for p in paths}
     assert len(actual_acc_nums) == 2
     assert expected_acc_nums == actual_acc_nums
 
@@ -236,7 +799,7 @@ def test_fetch_and_save_filings_given_download_details(user_agent, form_10k, app
     assert actual_filenames.count("full-submission.txt") == 2
 
 
-def test_fetch_and_save_filings_skip_download_details(user_agent, form_10k, apple_cik):
+def test_fetch_and_save_filings_skip_download_details(gateway, form_10k, apple_cik):
     limit = 2
     download_metadata = DownloadMetadata(
         download_folder=Path("."),
@@ -259,23 +822,25 @@ def test_fetch_and_save_filings_skip_download_details(user_agent, form_10k, appl
         for i in range(limit)
     ]
 
-    with patch(
-        "sec_edgar_downloader._orchestrator.aggregate_filings_to_download",
-        new=lambda x, y: to_download_list,
-    ), patch(
-        "sec_edgar_downloader._orchestrator.download_filing", autospec=True
-    ) as mock_download_filing, patch(
-        "sec_edgar_downloader._orchestrator.save_document", autospec=True
-    ) as mock_save_document:
-        num_downloaded = fetch_and_save_filings(download_metadata, user_agent)
-
-    assert num_downloaded == 2
-    assert mock_download_filing.call_count == 2
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(SecGateway, "stream_filing", autospec=True) as mock_stream_filing,
+        patch(
+            "sec_edgar_downloader._storage.save_document", autospec=True
+        ) as mock_save_document,
+    ):
+        num_downloaded = fetch_and_save_filings(download_metadata, gateway)
+
+    assert num_downloaded == {download_metadata.form: 2}
+    assert mock_stream_filing.call_count == 2
     assert mock_save_document.call_count == 2
 
 
 def test_fetch_and_save_filings_given_paths_that_already_exist(
-    user_agent, form_10k, apple_cik
+    gateway, form_10k, apple_cik
 ):
     limit = 2
     download_metadata = DownloadMetadata(
@@ -299,22 +864,414 @@ def test_fetch_and_save_filings_given_paths_that_already_exist(
         for i in range(limit)
     ]
 
-    with patch.object(Path, "exists", return_value=True), patch(
-        "sec_edgar_downloader._orchestrator.download_filing", autospec=True
-    ) as mock_download_filing, patch(
-        "sec_edgar_downloader._orchestrator.aggregate_filings_to_download",
-        new=lambda x, y: to_download_list,
-    ), patch(
-        "sec_edgar_downloader._orchestrator.save_document", autospec=True
-    ) as mock_save_document:
-        fetch_and_save_filings(download_metadata, user_agent)
-
-    assert mock_download_filing.call_count == 0
+    with (
+        patch.object(LocalStorage, "size", return_value=1),
+        patch.object(SecGateway, "stream_filing", autospec=True) as mock_stream_filing,
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch(
+            "sec_edgar_downloader._storage.save_document", autospec=True
+        ) as mock_save_document,
+    ):
+        fetch_and_save_filings(download_metadata, gateway)
+
+    assert mock_stream_filing.call_count == 0
     assert mock_save_document.call_count == 0
 
 
+@pytest.mark.parametrize("use_manifest", [False, True])
+def test_fetch_and_save_filings_given_truncated_filing(
+    tmp_path, gateway, form_10k, apple_cik, use_manifest
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik, download_details=True
+    )
+    manifest = (
+        Manifest(tmp_path / ROOT_SAVE_FOLDER_NAME / "manifest.sqlite3")
+        if use_manifest
+        else None
+    )
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+            size=len(b"raw_0 complete"),
+        )
+        for i in range(2)
+    ]
+    for i, contents in enumerate([b"raw_0", b"raw_1 complete"]):
+        for name, document in [
+            (FILING_FULL_SUBMISSION_FILENAME, contents),
+            ("primary-document.xml", b"pd"),
+        ]:
+            path = get_save_location(download_metadata, f"acc_num_{i}", name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(document)
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode(), b" complete"],
+        ) as mock_stream_filing,
+    ):
+        fetch_and_save_filings(download_metadata, gateway, manifest=manifest)
+
+    # Only the full submission that is smaller than its listed size is replaced
+    assert [c.args[1] for c in mock_stream_filing.call_args_list] == ["raw_0"]
+    path = get_save_location(
+        download_metadata, "acc_num_0", FILING_FULL_SUBMISSION_FILENAME
+    )
+    assert path.read_bytes() == b"raw_0 complete"
+
+
+def test_fetch_and_save_filings_given_manifest(tmp_path, gateway, form_10k, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik, download_details=True
+    )
+    manifest = Manifest(tmp_path / ROOT_SAVE_FOLDER_NAME / "manifest.sqlite3")
+    assert manifest.list_downloaded() == []
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+        )
+        for i in range(2)
+    ]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode(), b"!"],
+        ) as mock_stream_filing,
+    ):
+        num_downloaded = fetch_and_save_filings(
+            download_metadata, gateway, max_workers=2, manifest=manifest
+        )
+        # Downloaded documents are skipped on re-runs, without touching storage
+        with patch.object(LocalStorage, "size", autospec=True) as mock_size:
+            fetch_and_save_filings(download_metadata, gateway, manifest=manifest)
+
+    assert num_downloaded == {form_10k: 2}
+    assert mock_stream_filing.call_count == 4
+    assert mock_size.call_count == 0
+
+    documents = manifest.list_downloaded(apple_cik, form_10k)
+    assert [d.path.name for d in documents] == [
+        FILING_FULL_SUBMISSION_FILENAME,
+        "primary-document.xml",
+    ] * 2
+    assert documents[0].accession_number == "acc_num_0"
+    assert documents[0].size == len(b"raw_0!")
+    assert documents[0].sha256 == hashlib.sha256(b"raw_0!").hexdigest()
+    assert documents[0].path.read_bytes() == b"raw_0!"
+
+
+def test_fetch_and_save_filings_given_unrecorded_documents(
+    tmp_path, gateway, form_10k, apple_cik
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik
+    )
+    manifest = Manifest(tmp_path / ROOT_SAVE_FOLDER_NAME / "manifest.sqlite3")
+    # The manifest exists before any document is saved, e.g. by the asyncio engine
+    assert manifest.list_downloaded() == []
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+            size=len(b"raw_0 complete"),
+        )
+        for i in range(2)
+    ]
+    for i, contents in enumerate([b"raw_0 complete", b"raw_1"]):
+        save_document(
+            contents,
+            get_save_location(
+                download_metadata, f"acc_num_{i}", FILING_FULL_SUBMISSION_FILENAME
+            ),
+        )
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode(), b" complete"],
+        ) as mock_stream_filing,
+    ):
+        fetch_and_save_filings(download_metadata, gateway, manifest=manifest)
+
+    # The complete document is recorded as found, and the truncated one replaced
+    assert [c.args[1] for c in mock_stream_filing.call_args_list] == ["raw_1"]
+    documents = manifest.list_downloaded()
+    assert [(d.accession_number, d.size) for d in documents] == [
+        ("acc_num_0", len(b"raw_0 complete")),
+        ("acc_num_1", len(b"raw_1 complete")),
+    ]
+    assert documents[0].sha256 == hashlib.sha256(b"raw_0 complete").hexdigest()
+
+
+@pytest.mark.parametrize("use_manifest", [False, True])
+def test_fetch_and_save_filings_given_compression(
+    tmp_path, gateway, form_10k, apple_cik, use_manifest
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form=form_10k,
+        cik=apple_cik,
+        download_details=True,
+        compression="gzip",
+    )
+    manifest = (
+        Manifest(tmp_path / ROOT_SAVE_FOLDER_NAME / "manifest.sqlite3")
+        if use_manifest
+        else None
+    )
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri="raw_0",
+            primary_doc_uri="pd_0",
+            accession_number="acc_num_0",
+            details_doc_suffix=".xml",
+        )
+    ]
+
+    def stream_filing(_, uri, compression=None):
+        return [f"{uri}:{compression}".encode()]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ),
+    ):
+        num_downloaded = fetch_and_save_filings(
+            download_metadata, gateway, manifest=manifest
+        )
+
+    assert num_downloaded == {form_10k: 1}
+    filing_folder = (
+        tmp_path / ROOT_SAVE_FOLDER_NAME / apple_cik / form_10k / "acc_num_0"
+    )
+    # Only the full submission is compressed
+    assert (filing_folder / f"{FILING_FULL_SUBMISSION_FILENAME}.gz").read_bytes() == (
+        b"raw_0:gzip"
+    )
+    assert (filing_folder / "primary-document.xml").read_bytes() == b"pd_0:None"
+    if use_manifest:
+        assert [d.path.name for d in manifest.list_downloaded()] == [
+            f"{FILING_FULL_SUBMISSION_FILENAME}.gz",
+            "primary-document.xml",
+        ]
+
+
+@pytest.mark.parametrize("use_manifest", [False, True])
+def test_fetch_and_save_filings_given_pack_layout(
+    tmp_path, gateway, form_10k, apple_cik, use_manifest
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form=form_10k,
+        cik=apple_cik,
+        download_details=True,
+        layout="pack",
+    )
+    manifest = (
+        Manifest(tmp_path / ROOT_SAVE_FOLDER_NAME / "manifest.sqlite3")
+        if use_manifest
+        else None
+    )
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+        )
+        for i in range(3)
+    ]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode()],
+        ) as mock_stream_filing,
+    ):
+        num_downloaded = fetch_and_save_filings(
+            download_metadata, gateway, max_workers=3, manifest=manifest
+        )
+        # Packed documents are skipped on re-runs
+        fetch_and_save_filings(download_metadata, gateway, manifest=manifest)
+
+    assert num_downloaded == {form_10k: 3}
+    assert mock_stream_filing.call_count == 6
+    # All documents live in a single file, and no temporary files are left behind
+    company_folder = tmp_path / ROOT_SAVE_FOLDER_NAME / apple_cik
+    assert [p.name for p in company_folder.iterdir()] == ["10-K.pack"]
+
+    pack = FilingPack(company_folder / "10-K.pack")
+    assert len(pack.list_documents()) == 6
+    with pack.open("acc_num_1", "primary-document.xml") as f:
+        assert f.read() == b"pd_1"
+    if use_manifest:
+        assert [d.path for d in manifest.list_downloaded()][:2] == [
+            company_folder / form_10k / "acc_num_0" / FILING_FULL_SUBMISSION_FILENAME,
+            company_folder / form_10k / "acc_num_0" / "primary-document.xml",
+        ]
+
+
+def test_fetch_and_save_filings_given_storage(tmp_path, gateway, form_10k, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form=form_10k,
+        cik=apple_cik,
+        download_details=True,
+        compression="gzip",
+    )
+    storage = MemoryStorage()
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+        )
+        for i in range(2)
+    ]
+
+    def stream_filing(_, uri, compression=None):
+        return [uri.encode()]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ) as mock_stream_filing,
+    ):
+        num_downloaded = fetch_and_save_filings(
+            download_metadata, gateway, max_workers=2, storage=storage
+        )
+        # Documents in the storage backend are skipped on re-runs
+        fetch_and_save_filings(download_metadata, gateway, storage=storage)
+        # Filings of several companies are saved to the storage backend too
+        fetch_and_save_filings_many(
+            [replace(download_metadata, cik="0000789019")], gateway, storage=storage
+        )
+
+    assert num_downloaded == {form_10k: 2}
+    assert mock_stream_filing.call_count == 8
+    assert storage.list(f"{apple_cik}/") == [
+        f"{apple_cik}/10-K/acc_num_0/full-submission.txt.gz",
+        f"{apple_cik}/10-K/acc_num_0/primary-document.xml",
+        f"{apple_cik}/10-K/acc_num_1/full-submission.txt.gz",
+        f"{apple_cik}/10-K/acc_num_1/primary-document.xml",
+    ]
+    assert len(storage.list("0000789019/")) == 4
+    with storage.open(f"{apple_cik}/10-K/acc_num_1/primary-document.xml") as f:
+        assert f.read() == b"pd_1"
+    # Nothing is written to the download folder
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_and_save_filings_given_document_filters(
+    tmp_path, gateway, form_10k, apple_cik
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form=form_10k,
+        cik=apple_cik,
+        document_types=("EX-21*",),
+        download_full_submission=False,
+    )
+    td = get_to_download(apple_cik, "0000320193-22-000108", "aapl-20220924.htm")
+    documents = [
+        FilingIndexDocument("aapl-20220924.htm", "10-K", "10-K", "1", 1538187),
+        FilingIndexDocument("a10-kexhibit21.htm", "EX-21.1", "Subsidiaries", "2", 4452),
+    ]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: [td],
+        ),
+        patch(
+            "sec_edgar_downloader._filing_index.parse_filing_index",
+            return_value=documents,
+        ),
+        patch.object(
+            SecGateway, "download_filing", autospec=True, return_value=b"index"
+        ) as mock_download_filing,
+        patch.object(
+            SecGateway,
+            "stream_filing",
+            autospec=True,
+            side_effect=lambda _, uri, compression=None: [uri.encode()],
+        ) as mock_stream_filing,
+    ):
+        num_downloaded = fetch_and_save_filings(download_metadata, gateway)
+        # The full submission can be downloaded along with the selected documents
+        fetch_and_save_filings(
+            replace(download_metadata, download_full_submission=True), gateway
+        )
+
+    assert num_downloaded == {form_10k: 1}
+    # The filing index is saved with the documents, so it is only requested once
+    assert [c.args[1] for c in mock_download_filing.call_args_list] == [
+        get_filing_index_uri(td)
+    ]
+    # The selected document is not downloaded again
+    assert [c.args[1] for c in mock_stream_filing.call_args_list] == [
+        get_document_uri(td, "a10-kexhibit21.htm"),
+        td.raw_filing_uri,
+    ]
+    filing_folder = (
+        tmp_path / ROOT_SAVE_FOLDER_NAME / apple_cik / form_10k / td.accession_number
+    )
+    assert sorted(p.name for p in filing_folder.iterdir()) == [
+        f"{td.accession_number}-index.htm",
+        "a10-kexhibit21.htm",
+        FILING_FULL_SUBMISSION_FILENAME,
+    ]
+
+
 def test_fetch_and_save_filings_given_accession_numbers_to_skip(
-    user_agent, form_10k, apple_cik
+    gateway, form_10k, apple_cik
 ):
     limit = 2
     download_metadata = DownloadMetadata(
@@ -339,22 +1296,24 @@ def test_fetch_and_save_filings_given_accession_numbers_to_skip(
         for i in range(limit)
     ]
 
-    with patch(
-        "sec_edgar_downloader._orchestrator.aggregate_filings_to_download",
-        new=lambda x, y: to_download_list,
-    ), patch(
-        "sec_edgar_downloader._orchestrator.download_filing", autospec=True
-    ) as mock_download_filing, patch(
-        "sec_edgar_downloader._orchestrator.save_document", autospec=True
-    ) as mock_save_document:
-        num_downloaded = fetch_and_save_filings(download_metadata, user_agent)
-
-    assert num_downloaded == 1
-    assert mock_download_filing.call_count == 1
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(SecGateway, "stream_filing", autospec=True) as mock_stream_filing,
+        patch(
+            "sec_edgar_downloader._storage.save_document", autospec=True
+        ) as mock_save_document,
+    ):
+        num_downloaded = fetch_and_save_filings(download_metadata, gateway)
+
+    assert num_downloaded == {download_metadata.form: 1}
+    assert mock_stream_filing.call_count == 1
     assert mock_save_document.call_count == 1
 
 
-def test_fetch_and_save_filings_given_exception(user_agent, form_10k, apple_cik):
+def test_fetch_and_save_filings_given_exception(gateway, form_10k, apple_cik):
     limit = 2
     download_metadata = DownloadMetadata(
         download_folder=Path("."),
@@ -377,26 +1336,341 @@ def test_fetch_and_save_filings_given_exception(user_agent, form_10k, apple_cik)
         for i in range(limit)
     ]
 
-    with patch(
-        "sec_edgar_downloader._orchestrator.download_filing", autospec=True
-    ) as mock_download_filing, patch(
-        "sec_edgar_downloader._orchestrator.aggregate_filings_to_download",
-        new=lambda x, y: to_download_list,
-    ), patch(
-        "sec_edgar_downloader._orchestrator.save_document", autospec=True
-    ) as mock_save_document:
-        mock_download_filing.side_effect = RequestException("Error")
-        fetch_and_save_filings(download_metadata, user_agent)
+    with (
+        patch.object(SecGateway, "stream_filing", autospec=True) as mock_stream_filing,
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch(
+            "sec_edgar_downloader._storage.save_document", autospec=True
+        ) as mock_save_document,
+    ):
+        mock_stream_filing.side_effect = RequestException("Error")
+        fetch_and_save_filings(download_metadata, gateway)
 
     assert mock_save_document.call_count == 0
 
 
-def test_get_ticker_to_cik_mapping(user_agent, sample_cik_ticker_payload):
-    with patch(
-        "sec_edgar_downloader._orchestrator.get_ticker_metadata",
-        new=lambda x: sample_cik_ticker_payload,
+def test_fetch_and_save_filings_given_store(tmp_path, gateway, form_10k, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik
+    )
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri="raw_0",
+            primary_doc_uri="pd_0",
+            accession_number="acc_num_0",
+            details_doc_suffix=".xml",
+        )
+    ]
+
+    with (
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, return_value=[b"content"]
+        ),
+        patch(
+            "sec_edgar_downloader._orchestrator.aggregate_filings_from_store",
+            return_value=to_download_list,
+        ) as mock_aggregate_filings_from_store,
+    ):
+        assert fetch_and_save_filings(download_metadata, gateway, store=store) == {
+            download_metadata.form: 1
+        }
+
+    assert mock_aggregate_filings_from_store.call_args.args == (
+        download_metadata,
+        gateway,
+        store,
+        True,
+        True,
+    )
+
+
+def test_fetch_and_save_filings_given_multiple_forms(tmp_path, gateway, apple_cik):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form="10-K", cik=apple_cik, forms=("10-K", "SC 13*")
+    )
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".html",
+            form=form,
+        )
+        for i, form in enumerate(["SC 13G", "SC 13D", "SC 13G"])
+    ]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, return_value=[b"content"]
+        ),
+    ):
+        num_downloaded = fetch_and_save_filings(download_metadata, gateway)
+
+    # Requested forms without any filings are reported too
+    assert num_downloaded == {"10-K": 0, "SC 13G": 2, "SC 13D": 1}
+    company_folder = tmp_path / ROOT_SAVE_FOLDER_NAME / apple_cik
+    assert sorted(
+        p.relative_to(company_folder).as_posix()
+        for p in company_folder.glob(f"*/*/{FILING_FULL_SUBMISSION_FILENAME}")
+    ) == [
+        "SC 13D/acc_num_1/full-submission.txt",
+        "SC 13G/acc_num_0/full-submission.txt",
+        "SC 13G/acc_num_2/full-submission.txt",
+    ]
+
+
+def test_fetch_and_save_filings_many(tmp_path, gateway, form_10k):
+    download_metadatas = [
+        DownloadMetadata(download_folder=tmp_path, form=form_10k, cik=cik)
+        for cik in ["0000000001", "0000000002", "0000000003"]
+    ]
+    streamed = []
+
+    def aggregate(download_metadata, *_):
+        cik = download_metadata.cik
+        if cik == "0000000001":
+            # A slow company does not hold up the others
+            time.sleep(0.2)
+        elif cik == "0000000003":
+            raise RequestException("Error")
+        return [
+            ToDownload(
+                raw_filing_uri=f"raw_{cik}_{i}",
+                primary_doc_uri=f"pd_{cik}_{i}",
+                accession_number=f"acc_num_{i}",
+                details_doc_suffix=".html",
+            )
+            for i in range(2)
+        ]
+
+    def stream_filing(_, uri, compression=None):
+        streamed.append(uri)
+        return [uri.encode()]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            side_effect=aggregate,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ),
+    ):
+        num_downloaded = fetch_and_save_filings_many(
+            download_metadatas, gateway, max_workers=2
+        )
+
+    # A company whose submissions cannot be fetched is reported as empty
+    assert num_downloaded == [{form_10k: 2}, {form_10k: 2}, {form_10k: 0}]
+    assert streamed[:2] == ["raw_0000000002_0", "raw_0000000002_1"]
+    assert sorted(streamed[2:]) == ["raw_0000000001_0", "raw_0000000001_1"]
+    assert (
+        tmp_path
+        / ROOT_SAVE_FOLDER_NAME
+        / "0000000001"
+        / form_10k
+        / "acc_num_1"
+        / FILING_FULL_SUBMISSION_FILENAME
+    ).read_bytes() == b"raw_0000000001_1"
+
+
+def test_fetch_and_save_filings_many_downloads_first(tmp_path, gateway, form_10k):
+    download_metadatas = [
+        DownloadMetadata(download_folder=tmp_path, form=form_10k, cik=cik)
+        for cik in ["0000000001", "0000000002", "0000000003"]
+    ]
+    events = []
+
+    def aggregate(download_metadata, *_):
+        cik = download_metadata.cik
+        events.append(f"aggregate_{cik}")
+        return [
+            ToDownload(
+                raw_filing_uri=f"raw_{cik}_{i}",
+                primary_doc_uri=f"pd_{cik}_{i}",
+                accession_number=f"acc_num_{i}",
+                details_doc_suffix=".html",
+            )
+            for i in range(2)
+        ]
+
+    def stream_filing(_, uri, compression=None):
+        events.append(uri)
+        return [uri.encode()]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            side_effect=aggregate,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ),
     ):
-        result = get_ticker_to_cik_mapping(user_agent)
+        fetch_and_save_filings_many(download_metadatas, gateway, max_workers=1)
+
+    # The next company is only aggregated once the queued downloads ran
+    assert events == [
+        "aggregate_0000000001",
+        "raw_0000000001_0",
+        "raw_0000000001_1",
+        "aggregate_0000000002",
+        "raw_0000000002_0",
+        "raw_0000000002_1",
+        "aggregate_0000000003",
+        "raw_0000000003_0",
+        "raw_0000000003_1",
+    ]
+
+
+def test_fetch_and_save_filings_many_fetches_pages_serially(
+    tmp_path, user_agent, apple_cik
+):
+    download_metadatas = [
+        DownloadMetadata(download_folder=tmp_path / str(i), form="10-K", cik=apple_cik)
+        for i in range(2)
+    ]
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    get_page = _mock_paginated_submissions(8)
+
+    def tracking_get_page(self, submissions_uri):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return get_page(self, submissions_uri)
+
+    with (
+        SecGateway(user_agent, pool_size=4) as gw,
+        patch.object(
+            SecGateway,
+            "get_list_of_available_filings",
+            autospec=True,
+            side_effect=tracking_get_page,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, return_value=[b"content"]
+        ),
+    ):
+        num_downloaded = fetch_and_save_filings_many(
+            download_metadatas, gw, max_workers=2
+        )
+
+    assert num_downloaded == [{"10-K": 9}, {"10-K": 9}]
+    # Pages are not fetched by a pool of their own on top of the shared workers
+    assert max_in_flight == 2
+
+
+def test_fetch_and_save_filings_many_requeues_failed_filings(
+    tmp_path, gateway, form_10k
+):
+    download_metadatas = [
+        DownloadMetadata(download_folder=tmp_path, form=form_10k, cik=cik)
+        for cik in ["0000000001", "0000000002"]
+    ]
+    attempts = Counter()
+
+    def aggregate(download_metadata, *_):
+        cik = download_metadata.cik
+        return [
+            ToDownload(
+                raw_filing_uri=f"raw_{cik}_{i}",
+                primary_doc_uri=f"pd_{cik}_{i}",
+                accession_number=f"acc_num_{i}",
+                details_doc_suffix=".html",
+            )
+            for i in range(2)
+        ]
+
+    def stream_filing(_, uri, compression=None):
+        attempts[uri] += 1
+        # SEC throttles the first attempt, but recovers before it is queued again
+        if uri == "raw_0000000001_1" and attempts[uri] == 1:
+            raise RequestException("429 Too Many Requests")
+        # Failing filings are given up on after being queued again once
+        if uri == "raw_0000000002_0":
+            raise RequestException("503 Service Unavailable")
+        return [uri.encode()]
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            side_effect=aggregate,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ),
+    ):
+        num_downloaded = fetch_and_save_filings_many(
+            download_metadatas, gateway, max_workers=2
+        )
+
+    assert num_downloaded == [{form_10k: 2}, {form_10k: 1}]
+    assert attempts["raw_0000000001_1"] == 2
+    assert attempts["raw_0000000002_0"] == 2
+    assert attempts["raw_0000000001_0"] == attempts["raw_0000000002_1"] == 1
+
+
+def test_fetch_and_save_filings_many_given_store(
+    tmp_path, gateway, form_10k, apple_cik
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path,
+        form=form_10k,
+        cik=apple_cik,
+        accession_numbers_to_skip={"acc_num_0"},
+    )
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+        )
+        for i in range(2)
+    ]
+
+    with (
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, return_value=[b"content"]
+        ),
+        patch(
+            "sec_edgar_downloader._orchestrator.aggregate_filings_from_store",
+            return_value=to_download_list,
+        ) as mock_aggregate_filings_from_store,
+    ):
+        assert fetch_and_save_filings_many(
+            [download_metadata], gateway, store=store, refresh_store=False
+        ) == [{form_10k: 1}]
+
+    assert mock_aggregate_filings_from_store.call_args.args == (
+        download_metadata,
+        gateway,
+        store,
+        False,
+        False,
+    )
+
+
+def test_get_ticker_to_cik_mapping(gateway, sample_cik_ticker_payload):
+    with patch.object(
+        SecGateway, "get_ticker_metadata", new=lambda x: sample_cik_ticker_payload
+    ):
+        result = get_ticker_to_cik_mapping(gateway)
 
     assert result == {
         "AAPL": "0000320193",
@@ -406,7 +1680,122 @@ def test_get_ticker_to_cik_mapping(user_agent, sample_cik_ticker_payload):
     }
 
 
-def _mock_sec_api_response_multi_page(submissions_uri, _):
+def _ticker_metadata_response(payload, etag='"v1"'):
+    return Mock(
+        status_code=200,
+        json=Mock(return_value=payload),
+        headers={"ETag": etag, "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+
+
+def test_get_ticker_to_cik_mapping_given_cache(
+    tmp_path, gateway, sample_cik_ticker_payload
+):
+    cache_path = tmp_path / "cache" / "company_tickers_exchange.json"
+
+    with patch.object(
+        SecGateway,
+        "get_if_modified",
+        autospec=True,
+        return_value=_ticker_metadata_response(sample_cik_ticker_payload),
+    ) as mock_get_if_modified:
+        first = get_ticker_to_cik_mapping(gateway, cache_path, cache_ttl=60)
+        second = get_ticker_to_cik_mapping(gateway, cache_path, cache_ttl=60)
+
+    assert first == second
+    assert first["AAPL"] == "0000320193"
+    # The second call is served from the cache without any requests
+    assert mock_get_if_modified.call_count == 1
+    assert mock_get_if_modified.call_args.kwargs == {
+        "etag": None,
+        "last_modified": None,
+    }
+    cached = json.loads(cache_path.read_text())
+    assert cached["etag"] == '"v1"'
+    assert cached["mapping"] == first
+
+
+def test_get_ticker_to_cik_mapping_given_expired_cache(
+    tmp_path, gateway, sample_cik_ticker_payload
+):
+    cache_path = tmp_path / "company_tickers_exchange.json"
+    cache_path.write_text(
+        json.dumps(
+            {
+                "fetched_at": 0,
+                "etag": '"v1"',
+                "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                "mapping": {"AAPL": "0000320193"},
+            }
+        )
+    )
+
+    # Unchanged mapping: a 304 renews the cache without downloading the mapping
+    with patch.object(
+        SecGateway, "get_if_modified", autospec=True, return_value=None
+    ) as mock_get_if_modified:
+        result = get_ticker_to_cik_mapping(gateway, cache_path, cache_ttl=60)
+
+    assert result == {"AAPL": "0000320193"}
+    assert mock_get_if_modified.call_args.kwargs == {
+        "etag": '"v1"',
+        "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    cached = json.loads(cache_path.read_text())
+    assert cached["fetched_at"] > 0
+    assert cached["etag"] == '"v1"'
+
+    # Changed mapping: the new mapping and validators replace the cached ones
+    with patch.object(
+        SecGateway,
+        "get_if_modified",
+        autospec=True,
+        return_value=_ticker_metadata_response(sample_cik_ticker_payload, '"v2"'),
+    ):
+        result = get_ticker_to_cik_mapping(gateway, cache_path, cache_ttl=0)
+
+    assert len(result) == 4
+    assert json.loads(cache_path.read_text())["etag"] == '"v2"'
+
+
+@pytest.mark.parametrize("contents", ["not json", "[]", '{"mapping": null}'])
+def test_get_ticker_to_cik_mapping_given_corrupt_cache(
+    tmp_path, gateway, sample_cik_ticker_payload, contents
+):
+    cache_path = tmp_path / "company_tickers_exchange.json"
+    cache_path.write_text(contents)
+
+    with patch.object(
+        SecGateway,
+        "get_if_modified",
+        autospec=True,
+        return_value=_ticker_metadata_response(sample_cik_ticker_payload),
+    ) as mock_get_if_modified:
+        result = get_ticker_to_cik_mapping(gateway, cache_path, cache_ttl=60)
+
+    assert len(result) == 4
+    assert mock_get_if_modified.call_args.kwargs["etag"] is None
+
+
+def test_get_ticker_to_cik_mapping_given_unwritable_cache(
+    tmp_path, gateway, sample_cik_ticker_payload
+):
+    # The cache path's parent is a file, so the cache cannot be written
+    (tmp_path / "not-a-folder").write_text("")
+    cache_path = tmp_path / "not-a-folder" / "company_tickers_exchange.json"
+
+    with patch.object(
+        SecGateway,
+        "get_if_modified",
+        autospec=True,
+        return_value=_ticker_metadata_response(sample_cik_ticker_payload),
+    ):
+        result = get_ticker_to_cik_mapping(gateway, cache_path, cache_ttl=60)
+
+    assert len(result) == 4
+
+
+def _mock_sec_api_response_multi_page(_, submissions_uri):
     json_path = (
         Path(__file__).parent
         / "test_data"
@@ -416,3 +1805,137 @@ def _mock_sec_api_response_multi_page(submissions_uri, _):
     assert json_path.exists()
     with json_path.open() as f:
         return json.load(f)
+
+
+def test_fetch_and_save_filings_given_max_workers(gateway, form_10k, apple_cik):
+    limit = 8
+    download_metadata = DownloadMetadata(
+        download_folder=Path("."),
+        form=form_10k,
+        cik=apple_cik,
+        limit=limit,
+        download_details=True,
+    )
+
+    to_download_list = [
+        ToDownload(
+            raw_filing_uri=f"raw_{i}",
+            primary_doc_uri=f"pd_{i}",
+            accession_number=f"acc_num_{i}",
+            details_doc_suffix=".xml",
+        )
+        for i in range(limit)
+    ]
+    thread_names = set()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def stream_filing(_, uri, compression=None):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            thread_names.add(threading.current_thread().name)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        if uri == "raw_3":
+            raise RequestException("Error")
+        return uri.encode()
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=lambda *_: to_download_list,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ) as mock_stream_filing,
+        patch(
+            "sec_edgar_downloader._storage.save_document", autospec=True
+        ) as mock_save_document,
+    ):
+        num_downloaded = fetch_and_save_filings(
+            download_metadata, gateway, max_workers=4
+        )
+
+    # The failing accession number is queued again once, then skipped, but all
+    # others are counted
+    assert num_downloaded == {download_metadata.form: limit - 1}
+    assert mock_stream_filing.call_count == 2 * limit
+    assert mock_save_document.call_count == 2 * limit - 2
+    assert 1 < max_in_flight <= 4
+    assert len(thread_names) > 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_fetch_and_save_filings_downloads_while_paginating(
+    tmp_path, gateway, form_10k, apple_cik, max_workers
+):
+    download_metadata = DownloadMetadata(
+        download_folder=tmp_path, form=form_10k, cik=apple_cik
+    )
+    first_filing_saved = threading.Event()
+    saved_before_second_page = False
+
+    def iter_filings_to_download(*_):
+        nonlocal saved_before_second_page
+        for page in range(2):
+            if page == 1:
+                saved_before_second_page = first_filing_saved.wait(timeout=5)
+            yield ToDownload(
+                raw_filing_uri=f"raw_{page}",
+                primary_doc_uri=f"pd_{page}",
+                accession_number=f"acc_num_{page}",
+                details_doc_suffix=".xml",
+            )
+
+    def stream_filing(_, uri, compression=None):
+        yield uri.encode()
+        first_filing_saved.set()
+
+    with (
+        patch(
+            "sec_edgar_downloader._orchestrator.iter_filings_to_download",
+            new=iter_filings_to_download,
+        ),
+        patch.object(
+            SecGateway, "stream_filing", autospec=True, side_effect=stream_filing
+        ),
+    ):
+        num_downloaded = fetch_and_save_filings(
+            download_metadata, gateway, max_workers=max_workers
+        )
+
+    # The first filing is on disk before the second page is even requested
+    assert saved_before_second_page
+    assert num_downloaded == {form_10k: 2}
+
+
+def test_map_bounded():
+    max_pending = 3
+    lock = threading.Lock()
+    num_finished = 0
+    max_queued = 0
+
+    def items():
+        nonlocal max_queued
+        for i in range(20):
+            with lock:
+                max_queued = max(max_queued, i - num_finished)
+            yield i
+
+    def square(i):
+        nonlocal num_finished
+        time.sleep(0.01)
+        with lock:
+            num_finished += 1
+        return i * i
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(map_bounded(executor, square, items(), max_pending))
+
+    assert sorted(results) == [i * i for i in range(20)]
+    # Items are only pulled once a queued item has completed
+    assert max_queued <= max_pending
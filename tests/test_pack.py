@@ -0,0 +1,91 @@
+import mmap
+
+import pytest
+
+from sec_edgar_downloader._pack import FilingPack, open_pack
+
+
+def _append(pack, tmp_path, accession_number, name, contents):
+    source = tmp_path / "source"
+    source.write_bytes(contents)
+    pack.append(accession_number, name, source)
+
+
+def test_filing_pack(tmp_path):
+    path = tmp_path / "AAPL" / "10-K.pack"
+    pack = FilingPack(path)
+    assert ("acc_num_0", "full-submission.txt") not in pack
+    assert pack.list_documents() == []
+
+    _append(pack, tmp_path, "acc_num_0", "full-submission.txt", b"filing 0")
+    _append(pack, tmp_path, "acc_num_0", "primary-document.html", b"<html>")
+    _append(pack, tmp_path, "acc_num_1", "full-submission.txt", b"filing 1")
+
+    assert ("acc_num_0", "full-submission.txt") in pack
+    # Reads stop at the end of the document rather than of the pack
+    with pack.open("acc_num_0", "full-submission.txt") as f:
+        assert f.read(3) == b"fil"
+        assert f.read(100) == b"ing 0"
+        assert f.read() == b""
+    with pack.open("acc_num_1", "full-submission.txt") as f:
+        assert f.read() == b"filing 1"
+    with pytest.raises(KeyError):
+        pack.open("acc_num_2", "full-submission.txt")
+
+    # The index is read back from the pack itself
+    documents = FilingPack(path).list_documents()
+    assert [(d.accession_number, d.name, d.size) for d in documents] == [
+        ("acc_num_0", "full-submission.txt", 8),
+        ("acc_num_0", "primary-document.html", 6),
+        ("acc_num_1", "full-submission.txt", 8),
+    ]
+    # Documents can be sliced from a memory map of the pack by their offset
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert m[documents[1].offset : documents[1].offset + documents[1].size] == (
+            b"<html>"
+        )
+
+
+def test_filing_pack_ignores_partial_record(tmp_path):
+    path = tmp_path / "10-K.pack"
+    _append(FilingPack(path), tmp_path, "acc_num_0", "full-submission.txt", b"ok")
+    complete_size = path.stat().st_size
+
+    _append(FilingPack(path), tmp_path, "acc_num_1", "full-submission.txt", b"torn")
+    for size in range(complete_size + 1, path.stat().st_size):
+        with path.open("r+b") as f:
+            f.truncate(size)
+        pack = FilingPack(path)
+        assert [d.accession_number for d in pack.list_documents()] == ["acc_num_0"]
+
+    # The partial record is overwritten by the next append
+    _append(pack, tmp_path, "acc_num_2", "full-submission.txt", b"new")
+    assert [d.accession_number for d in FilingPack(path).list_documents()] == [
+        "acc_num_0",
+        "acc_num_2",
+    ]
+    with FilingPack(path).open("acc_num_2", "full-submission.txt") as f:
+        assert f.read() == b"new"
+
+
+def test_filing_pack_given_invalid_file(tmp_path):
+    path = tmp_path / "10-K.pack"
+    path.write_bytes(b"not a pack")
+
+    with pytest.raises(ValueError) as exc_info:
+        FilingPack(path).list_documents()
+    assert "is not a filing pack" in str(exc_info.value)
+
+
+def test_filing_pack_given_corrupt_record(tmp_path):
+    path = tmp_path / "10-K.pack"
+    _append(FilingPack(path), tmp_path, "acc_num_0", "full-submission.txt", b"ok")
+    with path.open("ab") as f:
+        f.write(b"X" * 64)
+
+    assert len(FilingPack(path).list_documents()) == 1
+
+
+def test_open_pack(tmp_path):
+    assert open_pack(tmp_path / "10-K.pack") is open_pack(tmp_path / "10-K.pack")
+    assert open_pack(tmp_path / "10-K.pack") is not open_pack(tmp_path / "8-K.pack")
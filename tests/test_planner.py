@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pytest
+
+from sec_edgar_downloader._planner import estimate_download, plan_filings
+from sec_edgar_downloader._types import DownloadMetadata, ToDownload
+
+
+def _to_download(i, size):
+    return ToDownload(
+        raw_filing_uri=f"raw_{i}",
+        primary_doc_uri=f"pd_{i}",
+        accession_number=f"acc_num_{i}",
+        details_doc_suffix=".xml",
+        size=size,
+    )
+
+
+# Newest first, as listed in the submissions
+FILINGS = [
+    _to_download(0, 300),
+    _to_download(1, None),
+    _to_download(2, 100),
+    _to_download(3, 200),
+    _to_download(4, 100),
+]
+
+
+def _plan(**kwargs):
+    download_metadata = DownloadMetadata(Path("."), "4", "0000320193", **kwargs)
+    return [td.accession_number[-1] for td in plan_filings(download_metadata, FILINGS)]
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({}, ["0", "1", "2", "3", "4"]),
+        ({"accession_numbers_to_skip": {"acc_num_0"}}, ["1", "2", "3", "4"]),
+        # Filings of unknown size are skipped by the size limits
+        ({"max_filing_size": 200}, ["2", "3", "4"]),
+        # Filings that do not fit in the remaining budget are skipped
+        ({"max_total_size": 350}, ["0"]),
+        ({"max_total_size": 450}, ["0", "2"]),
+        # Filings of equal size keep their order, and unknown sizes come last
+        ({"size_order": "smallest-first"}, ["2", "4", "3", "0", "1"]),
+        ({"size_order": "largest-first"}, ["0", "3", "2", "4", "1"]),
+        (
+            {"size_order": "smallest-first", "max_total_size": 450},
+            ["2", "4", "3"],
+        ),
+        (
+            {"size_order": "largest-first", "max_total_size": 450},
+            ["0", "2"],
+        ),
+        (
+            {"size_order": "largest-first", "max_filing_size": 250},
+            ["3", "2", "4"],
+        ),
+    ],
+)
+def test_plan_filings(kwargs, expected):
+    assert _plan(**kwargs) == expected
+
+
+def test_plan_filings_is_lazy_without_size_order():
+    def filings():
+        yield FILINGS[0]
+        raise AssertionError("Filings are consumed one at a time")
+
+    download_metadata = DownloadMetadata(
+        Path("."), "4", "0000320193", max_filing_size=500, max_total_size=500
+    )
+    assert next(iter(plan_filings(download_metadata, filings()))) == FILINGS[0]
+
+
+def test_estimate_download():
+    download_metadata = DownloadMetadata(Path("."), "4", "0000320193")
+
+    estimate = estimate_download(download_metadata, FILINGS, bytes_per_sec=100)
+    assert estimate.num_filings == 5
+    assert estimate.num_bytes == 700
+    assert estimate.num_filings_of_unknown_size == 1
+    assert estimate.num_requests == 5
+    # The transfer is slower than the rate limit
+    assert estimate.seconds == 7
+
+    download_metadata = DownloadMetadata(
+        Path("."),
+        "4",
+        "0000320193",
+        download_details=True,
+        document_types=("EX-21",),
+        download_full_submission=False,
+        max_filing_size=250,
+    )
+    estimate = estimate_download(download_metadata, FILINGS, bytes_per_sec=100)
+    assert estimate.num_filings == 3
+    # Only the detail documents and filing indexes are downloaded
+    assert estimate.num_bytes == 0
+    assert estimate.num_requests == 6
+    assert estimate.seconds == 0.6
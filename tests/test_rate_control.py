@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import pytest
+
+from sec_edgar_downloader._constants import (
+    ADAPTIVE_RATE_MIN,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF_MAX,
+    SEC_REQUESTS_PER_SEC_MAX,
+)
+from sec_edgar_downloader._rate_control import (
+    AdaptiveRateController,
+    get_retry_delay,
+    parse_retry_after,
+)
+
+
+def test_adaptive_rate_controller():
+    controller = AdaptiveRateController()
+    assert controller.rate == SEC_REQUESTS_PER_SEC_MAX
+
+    # At the maximum rate, pacing is left to the global rate limiter
+    assert controller.reserve() == 0
+    assert controller.reserve() == 0
+
+    with mock.patch(
+        "sec_edgar_downloader._rate_control.random.uniform",
+        side_effect=lambda a, b: b,
+    ):
+        assert controller.back_off(0) == 1
+    assert controller.rate == SEC_REQUESTS_PER_SEC_MAX / 2
+
+    # Below the maximum rate, requests are spaced evenly
+    assert controller.reserve() == 0
+    assert controller.reserve() == pytest.approx(0.2, abs=0.05)
+
+    # Successful requests ramp the rate back up to the maximum
+    controller.record_success()
+    assert controller.rate == pytest.approx(SEC_REQUESTS_PER_SEC_MAX / 2 + 0.1)
+    for _ in range(100):
+        controller.record_success()
+    assert controller.rate == SEC_REQUESTS_PER_SEC_MAX
+
+    # The rate never falls below the floor
+    for i in range(10):
+        controller.back_off(i, retry_after=0)
+    assert controller.rate == ADAPTIVE_RATE_MIN
+
+
+def test_adaptive_rate_controller_given_retry_after():
+    controller = AdaptiveRateController()
+
+    assert controller.back_off(0, retry_after=2) == 2
+    # All requests are held back until the Retry-After has passed
+    assert controller.reserve() == pytest.approx(2, abs=0.05)
+    assert controller.reserve() == pytest.approx(2.2, abs=0.05)
+
+
+def test_get_retry_delay():
+    assert get_retry_delay(3, retry_after=12.5) == 12.5
+
+    with mock.patch(
+        "sec_edgar_downloader._rate_control.random.uniform",
+        side_effect=lambda a, b: b,
+    ):
+        assert get_retry_delay(0) == 1
+        assert get_retry_delay(3) == 8
+        assert get_retry_delay(10) == RETRY_BACKOFF_MAX
+
+    for attempt in range(5):
+        assert 0 <= get_retry_delay(attempt) <= 2**attempt
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(" 5 ") == 5
+    assert parse_retry_after("86400") == RETRY_AFTER_MAX
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == (
+        pytest.approx(30, abs=2)
+    )
+    # Dates in the past and dates without a timezone are handled
+    assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 GMT") == 0
+    assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 -0000") == 0
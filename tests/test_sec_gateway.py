@@ -1,15 +1,22 @@
+import asyncio
+import gzip
+import io
 import time
 from unittest import mock
 
+import httpx
 import pytest
+import requests
+import urllib3
+import zstandard
 from requests.exceptions import RequestException
 
-from sec_edgar_downloader._sec_gateway import (
-    _call_sec,
-    download_filing,
-    get_list_of_available_filings,
-    get_ticker_metadata,
+from sec_edgar_downloader._constants import (
+    HOST_DATA_SEC,
+    HOST_WWW_SEC,
+    SEC_REQUESTS_PER_SEC_MAX,
 )
+from sec_edgar_downloader._sec_gateway import AsyncSecGateway, SecGateway, _call_sec
 
 
 # Source: https://stackoverflow.com/a/28507806/3820660
@@ -31,47 +38,378 @@ def mock_sec_request(*args, **kwargs):
             if self.status_code != 200:
                 raise RequestException("Non-2xx status code detected")
 
-    if "sec.gov/files/company_tickers_exchange.json" in args[0]:
+        def iter_content(self, chunk_size):
+            for i in range(0, len(self.byte_content), chunk_size):
+                yield self.byte_content[i : i + chunk_size]
+
+        def close(self):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_):
+            self.close()
+
+    # args[0] is the session when requests.Session.get is autospecced
+    uri = args[1]
+    if "sec.gov/files/company_tickers_exchange.json" in uri:
         return MockResponse({"key1": "value1"}, None, 200)
-    elif "sec.gov/Archives/edgar/data/" in args[0]:
+    elif "sec.gov/Archives/edgar/data/" in uri:
         return MockResponse(None, b"sample file content", 200)
-    elif "data.sec.gov/submissions/" in args[0]:
+    elif "data.sec.gov/submissions/" in uri:
         return MockResponse({"key1": "value1"}, None, 200)
-    elif "valid-url" in args[0]:
+    elif "valid-url" in uri:
         return MockResponse(None, None, 200)
 
     return MockResponse(None, None, 404)
 
 
-@mock.patch("requests.get", side_effect=mock_sec_request, autospec=True)
-def test_download_filing(_):
-    download_filing("data.sec.gov/submissions/", "user_agent")
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_download_filing(mock_get, gateway):
+    result = gateway.download_filing("sec.gov/Archives/edgar/data/")
+
+    assert result == b"sample file content"
+    assert mock_get.call_args.args[0] is gateway.session(HOST_WWW_SEC)
+
+
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_stream_filing(mock_get, user_agent):
+    with SecGateway(user_agent, buffer_size=4) as gw:
+        chunks = list(gw.stream_filing("sec.gov/Archives/edgar/data/"))
+
+    assert chunks == [b"samp", b"le f", b"ile ", b"cont", b"ent"]
+    assert mock_get.call_args.kwargs["stream"] is True
+
+
+def _encoded_response(body, content_encoding=None):
+    headers = {} if content_encoding is None else {"Content-Encoding": content_encoding}
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers.update(headers)
+    resp.raw = urllib3.HTTPResponse(
+        io.BytesIO(body), headers=headers, preload_content=False
+    )
+    return resp
+
+
+def test_stream_filing_gzip_passthrough(user_agent):
+    gzipped = gzip.compress(b"sample file content")
+    with (
+        mock.patch.object(
+            requests.Session, "get", return_value=_encoded_response(gzipped, "gzip")
+        ),
+        SecGateway(user_agent, buffer_size=4) as gw,
+    ):
+        chunks = list(gw.stream_filing("sec.gov/Archives/edgar/data/", "gzip"))
+
+    # The gzip-encoded body is stored as received, without being decoded
+    assert b"".join(chunks) == gzipped
+
+
+@pytest.mark.parametrize("content_encoding", [None, "gzip"])
+def test_stream_filing_compressed(user_agent, content_encoding):
+    body = b"sample file content"
+    if content_encoding == "gzip":
+        body = gzip.compress(body)
+    with (
+        mock.patch.object(
+            requests.Session,
+            "get",
+            return_value=_encoded_response(body, content_encoding),
+        ),
+        SecGateway(user_agent, buffer_size=4) as gw,
+    ):
+        chunks = list(gw.stream_filing("sec.gov/Archives/edgar/data/", "zstd"))
+
+    decompressed = (
+        zstandard.ZstdDecompressor().decompressobj().decompress(b"".join(chunks))
+    )
+    assert decompressed == b"sample file content"
+
+
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_get_list_of_available_filings(mock_get, gateway):
+    result = gateway.get_list_of_available_filings("data.sec.gov/submissions/")
 
+    assert result == {"key1": "value1"}
+    assert mock_get.call_args.args[0] is gateway.session(HOST_DATA_SEC)
 
-@mock.patch("requests.get", side_effect=mock_sec_request, autospec=True)
-def test_get_list_of_available_filings(_):
-    get_list_of_available_filings("sec.gov/Archives/edgar/data/", "user_agent")
 
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_get_ticker_metadata(mock_get, gateway):
+    result = gateway.get_ticker_metadata()
 
-@mock.patch("requests.get", side_effect=mock_sec_request, autospec=True)
-def test_get_ticker_metadata(_):
-    get_ticker_metadata("user_agent")
+    assert result == {"key1": "value1"}
+    assert mock_get.call_args.args[0] is gateway.session(HOST_WWW_SEC)
 
 
-@mock.patch("requests.get", side_effect=mock_sec_request, autospec=True)
-def test_call_sec_exception(_):
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_call_sec_exception(_, gateway):
     with pytest.raises(RequestException):
-        _call_sec("non-existent-url", "user_agent", "host")
+        _call_sec(gateway.session(HOST_WWW_SEC), "non-existent-url")
 
 
-@mock.patch("requests.get", side_effect=mock_sec_request, autospec=True)
-def test_call_sec_rate_limit(_):
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_call_sec_rate_limit(_, gateway):
     start = time.time()
     # SEC allows up to 10 requests per second before throttling customer requests
     # Therefore, 15 requests should take more than 1 second to complete
     for i in range(15):
-        _call_sec(f"valid-url-{i}", "user_agent", "host")
+        _call_sec(gateway.session(HOST_WWW_SEC), f"valid-url-{i}")
     diff = time.time() - start
     # Occasionally, this measurement is very close to 1, but slightly below.
     # Comparing against .99 will reduce the flakiness of this unit tests.
     assert diff > 0.99
+
+
+@mock.patch("requests.Session.get", side_effect=mock_sec_request, autospec=True)
+def test_gateway_reuses_session_per_host(mock_get, gateway):
+    gateway.download_filing("sec.gov/Archives/edgar/data/1")
+    gateway.download_filing("sec.gov/Archives/edgar/data/2")
+    gateway.get_list_of_available_filings("data.sec.gov/submissions/1")
+    gateway.get_list_of_available_filings("data.sec.gov/submissions/2")
+
+    sessions = [c.args[0] for c in mock_get.call_args_list]
+    assert sessions[0] is sessions[1] is gateway.session(HOST_WWW_SEC)
+    assert sessions[2] is sessions[3] is gateway.session(HOST_DATA_SEC)
+    assert sessions[0] is not sessions[2]
+
+
+def test_get_if_modified(gateway):
+    not_modified = mock.Mock(status_code=304)
+    modified = mock.Mock(status_code=200)
+
+    with mock.patch.object(
+        requests.Session, "get", autospec=True, side_effect=[not_modified, modified]
+    ) as mock_get:
+        first = gateway.get_if_modified(
+            "https://www.sec.gov/files/company_tickers_exchange.json",
+            HOST_WWW_SEC,
+            etag='"abc"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+        second = gateway.get_if_modified(
+            "https://data.sec.gov/submissions/CIK0000320193.json", HOST_DATA_SEC
+        )
+
+    assert first is None
+    assert second is modified
+    assert mock_get.call_args_list[0].args[0] is gateway.session(HOST_WWW_SEC)
+    assert mock_get.call_args_list[0].kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert mock_get.call_args_list[1].args[0] is gateway.session(HOST_DATA_SEC)
+    assert mock_get.call_args_list[1].kwargs["headers"] == {}
+
+
+def test_gateway_session_headers(user_agent, gateway):
+    www_headers = gateway.session(HOST_WWW_SEC).headers
+    data_headers = gateway.session(HOST_DATA_SEC).headers
+
+    assert www_headers["User-Agent"] == data_headers["User-Agent"] == user_agent
+    assert www_headers["Host"] == HOST_WWW_SEC
+    assert data_headers["Host"] == HOST_DATA_SEC
+    assert www_headers["Accept-Encoding"] == "gzip, deflate"
+
+
+def test_gateway_pool_size(user_agent):
+    with SecGateway(user_agent, pool_size=4) as gw:
+        for host in (HOST_WWW_SEC, HOST_DATA_SEC):
+            adapter = gw.session(host).get_adapter("https://" + host)
+            assert adapter._pool_maxsize == 4
+
+
+def test_gateway_invalid_pool_size(user_agent):
+    with pytest.raises(ValueError) as exc_info:
+        SecGateway(user_agent, pool_size=0)
+
+    assert "Invalid pool size" in str(exc_info.value)
+
+
+def test_gateway_close(user_agent):
+    gw = SecGateway(user_agent)
+    with mock.patch.object(requests.Session, "close", autospec=True) as mock_close:
+        gw.close()
+
+    assert mock_close.call_count == 2
+
+
+def test_async_gateway(user_agent):
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404)
+        if request.url.host == HOST_DATA_SEC or "/files/" in request.url.path:
+            return httpx.Response(200, json={"key1": "value1"})
+        return httpx.Response(200, content=b"sample file content")
+
+    async def run():
+        async with AsyncSecGateway(
+            user_agent, pool_size=2, transport=httpx.MockTransport(handler)
+        ) as gw:
+            assert gw.pool_size == 2
+            assert await gw.download_filing(
+                "https://www.sec.gov/Archives/edgar/data/"
+            ) == (b"sample file content")
+            assert await gw.get_list_of_available_filings(
+                "https://data.sec.gov/submissions/"
+            ) == {"key1": "value1"}
+            assert await gw.get_ticker_metadata() == {"key1": "value1"}
+            chunks = [
+                chunk
+                async for chunk in gw.stream_filing(
+                    "https://www.sec.gov/Archives/edgar/data/"
+                )
+            ]
+            assert chunks == [b"sample file content"]
+            with pytest.raises(httpx.HTTPStatusError):
+                await gw.download_filing("https://www.sec.gov/missing")
+
+    asyncio.run(run())
+
+    assert [r.headers["Host"] for r in requests_seen] == [
+        HOST_WWW_SEC,
+        HOST_DATA_SEC,
+        HOST_WWW_SEC,
+        HOST_WWW_SEC,
+        HOST_WWW_SEC,
+    ]
+    assert {r.headers["User-Agent"] for r in requests_seen} == {user_agent}
+
+
+def test_async_gateway_invalid_pool_size(user_agent):
+    with pytest.raises(ValueError) as exc_info:
+        AsyncSecGateway(user_agent, pool_size=0)
+
+    assert "Invalid pool size" in str(exc_info.value)
+
+
+def test_gateway_invalid_buffer_size(user_agent):
+    with pytest.raises(ValueError) as exc_info:
+        SecGateway(user_agent, buffer_size=0)
+
+    assert "Invalid buffer size" in str(exc_info.value)
+
+
+def _mock_response(status_code, headers=None):
+    resp = mock.Mock(status_code=status_code, headers=headers or {})
+    if status_code >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return resp
+
+
+@mock.patch("sec_edgar_downloader._rate_control.RETRY_BACKOFF_BASE", 0.01)
+def test_call_sec_retries_throttled_requests(gateway, rate_controller):
+    throttled = _mock_response(429, {"Retry-After": "0"})
+    unavailable = _mock_response(503)
+    ok = _mock_response(200)
+
+    with mock.patch.object(
+        requests.Session,
+        "get",
+        autospec=True,
+        side_effect=[throttled, unavailable, ok],
+    ) as mock_get:
+        assert _call_sec(gateway.session(HOST_WWW_SEC), "valid-url") is ok
+
+    assert mock_get.call_count == 3
+    # Retried responses release their connections
+    throttled.close.assert_called_once()
+    unavailable.close.assert_called_once()
+    # The rate is halved on every retry and ramps back up on success
+    assert rate_controller.rate == pytest.approx(SEC_REQUESTS_PER_SEC_MAX / 4 + 0.1)
+
+
+@mock.patch("sec_edgar_downloader._rate_control.RETRY_BACKOFF_BASE", 0.01)
+def test_call_sec_retries_connection_errors(gateway, rate_controller):
+    ok = _mock_response(200)
+
+    with mock.patch.object(
+        requests.Session,
+        "get",
+        autospec=True,
+        side_effect=[requests.ConnectionError("reset"), requests.Timeout(), ok],
+    ) as mock_get:
+        assert _call_sec(gateway.session(HOST_WWW_SEC), "valid-url") is ok
+
+    assert mock_get.call_count == 3
+
+
+@mock.patch("sec_edgar_downloader._sec_gateway.SEC_MAX_RETRIES", 1)
+@mock.patch("sec_edgar_downloader._rate_control.RETRY_BACKOFF_BASE", 0.01)
+def test_call_sec_gives_up_after_max_retries(gateway, rate_controller):
+    unavailable = [_mock_response(503), _mock_response(503)]
+    with (
+        mock.patch.object(
+            requests.Session, "get", autospec=True, side_effect=unavailable
+        ),
+        pytest.raises(requests.HTTPError),
+    ):
+        _call_sec(gateway.session(HOST_WWW_SEC), "valid-url")
+
+    for resp in unavailable:
+        resp.close.assert_called_once()
+
+    with (
+        mock.patch.object(
+            requests.Session,
+            "get",
+            autospec=True,
+            side_effect=requests.ConnectionError("reset"),
+        ) as mock_get,
+        pytest.raises(requests.ConnectionError),
+    ):
+        _call_sec(gateway.session(HOST_WWW_SEC), "valid-url")
+
+    assert mock_get.call_count == 2
+    assert rate_controller.rate < SEC_REQUESTS_PER_SEC_MAX
+
+
+@mock.patch("sec_edgar_downloader._rate_control.RETRY_BACKOFF_BASE", 0.01)
+def test_async_gateway_retries(user_agent, rate_controller):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.url.path)
+        if request.url.path.endswith("throttled") and len(attempts) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        if request.url.path.endswith("flaky") and attempts.count("/flaky") == 1:
+            raise httpx.ConnectError("reset", request=request)
+        if request.url.path.endswith("unavailable"):
+            return httpx.Response(503)
+        if request.url.path.endswith("unreachable"):
+            raise httpx.ConnectError("reset", request=request)
+        return httpx.Response(200, content=b"sample file content")
+
+    async def run():
+        async with AsyncSecGateway(
+            user_agent, transport=httpx.MockTransport(handler)
+        ) as gw:
+            assert await gw.download_filing("https://www.sec.gov/throttled") == (
+                b"sample file content"
+            )
+            assert await gw.download_filing("https://www.sec.gov/flaky") == (
+                b"sample file content"
+            )
+            with mock.patch("sec_edgar_downloader._sec_gateway.SEC_MAX_RETRIES", 1):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await gw.download_filing("https://www.sec.gov/unavailable")
+                with pytest.raises(httpx.ConnectError):
+                    await gw.download_filing("https://www.sec.gov/unreachable")
+
+    asyncio.run(run())
+
+    assert attempts == [
+        "/throttled",
+        "/throttled",
+        "/flaky",
+        "/flaky",
+        "/unavailable",
+        "/unavailable",
+        "/unreachable",
+        "/unreachable",
+    ]
@@ -0,0 +1,201 @@
+import binascii
+import gzip
+import io
+import mmap
+from unittest.mock import patch
+
+import pytest
+
+from sec_edgar_downloader import extract_submission, split_submission
+
+IMAGE = bytes(range(256)) * 3
+PDF = b"%PDF-1.4 report"
+
+
+def _uuencode(data, name="image.jpg"):
+    lines = [f"begin 644 {name}\n".encode()]
+    for i in range(0, len(data), 45):
+        line = binascii.b2a_uu(data[i : i + 45])
+        # Some encoders append garbage to lines
+        lines.append(line.rstrip(b"\n") + b"ab\n" if i == 0 else line)
+    return b"".join(lines + [b"`\n", b"end\n"])
+
+
+SUBMISSION = (
+    b"<SEC-DOCUMENT>0000320193-22-000108.txt : 20221028\n"
+    b"<SEC-HEADER>0000320193-22-000108.hdr.sgml : 20221028\n"
+    b"<TYPE>10-K\n"
+    b"</SEC-HEADER>\n"
+    b"<DOCUMENT>\n"
+    b"<TYPE>10-K\n"
+    b"<SEQUENCE>1\n"
+    b"<FILENAME>aapl-20220924.htm\n"
+    b"<DESCRIPTION>10-K\n"
+    b"<TEXT>\n"
+    b"<html><body>Annual report</body></html>\n"
+    b"<p>" + b"x" * 100 + b"</p>\n"
+    b"</TEXT>\n"
+    b"</DOCUMENT>\n"
+    b"<DOCUMENT>\n"
+    b"<TYPE>EX-101.SCH\n"
+    b"<SEQUENCE>2\n"
+    b"<FILENAME>aapl-20220924.xsd\n"
+    b"<DESCRIPTION>XBRL TAXONOMY EXTENSION SCHEMA DOCUMENT\n"
+    b"<TEXT>\n"
+    b"<XBRL>\n"
+    b"<?xml version='1.0'?>\n"
+    b"<schema/>\n"
+    b"</XBRL>\n"
+    b"</TEXT>\n"
+    b"</DOCUMENT>\n"
+    b"<DOCUMENT>\n"
+    b"<TYPE>GRAPHIC\n"
+    b"<SEQUENCE>3\n"
+    b"<FILENAME>../image.jpg\n"
+    b"<TEXT>\n" + _uuencode(IMAGE) + b"</TEXT>\n"
+    b"</DOCUMENT>\n"
+    b"<DOCUMENT>\n"
+    b"<TYPE>EX-99\n"
+    b"<UNKNOWN>tag\n"
+    b"\n"
+    b"<TEXT>\n"
+    b"Exhibit\n"
+    b"</TEXT>\n"
+    b"</DOCUMENT>\n"
+    b"<DOCUMENT>\n"
+    b"<TYPE>PDF\n"
+    b"<FILENAME>report.pdf\n"
+    b"<TEXT>\n"
+    b"<PDF>\n" + _uuencode(PDF, "report.pdf") + b"</PDF>\n"
+    b"</TEXT>\n"
+    b"</DOCUMENT>\n"
+    b"<DOCUMENT>\n"
+    b"<TYPE>EX-100\n"
+    b"<FILENAME>long.txt\n"
+    b"<TEXT>\n" + b"y" * 150 + b"\n"
+    b"</TEXT>\n"
+    b"</DOCUMENT>\n"
+    b"</SEC-DOCUMENT>"
+)
+
+
+def test_split_submission():
+    documents = list(split_submission(io.BytesIO(SUBMISSION)))
+
+    assert [(d.type, d.sequence, d.filename, d.uuencoded) for d in documents] == [
+        ("10-K", "1", "aapl-20220924.htm", False),
+        ("EX-101.SCH", "2", "aapl-20220924.xsd", False),
+        ("GRAPHIC", "3", "../image.jpg", True),
+        ("EX-99", None, None, False),
+        ("PDF", None, "report.pdf", True),
+        ("EX-100", None, "long.txt", False),
+    ]
+    assert documents[0].description == "10-K"
+    assert documents[2].description is None
+    assert all(d.path is None for d in documents)
+    # Byte ranges delimit the contents as stored in the submission
+    assert SUBMISSION[documents[0].start : documents[0].end] == (
+        b"<html><body>Annual report</body></html>\n<p>" + b"x" * 100 + b"</p>\n"
+    )
+    assert SUBMISSION[documents[3].start : documents[3].end] == b"Exhibit\n"
+    assert SUBMISSION[documents[2].start : documents[2].end] == _uuencode(IMAGE)
+
+
+def test_split_submission_given_chunks_and_long_lines(tmp_path):
+    # Submissions can be split while they are downloaded, and tags are only
+    # recognized at the start of a line, even if it is read in several pieces
+    chunks = [SUBMISSION[i : i + 7] for i in range(0, len(SUBMISSION), 7)]
+    with patch("sec_edgar_downloader._sgml.SGML_MAX_LINE_LENGTH", 64):
+        documents = list(split_submission(iter(chunks), tmp_path))
+
+    assert [d.type for d in documents] == [
+        "10-K",
+        "EX-101.SCH",
+        "GRAPHIC",
+        "EX-99",
+        "PDF",
+        "EX-100",
+    ]
+    assert documents[0].end - documents[0].start == 40 + 108
+    assert documents[2].path.read_bytes() == IMAGE
+    assert documents[5].path.read_bytes() == b"y" * 150 + b"\n"
+
+
+def test_split_submission_extracts_documents(tmp_path):
+    folder = tmp_path / "documents"
+    documents = list(split_submission(io.BytesIO(SUBMISSION), folder))
+
+    assert [d.path.name for d in documents] == [
+        "aapl-20220924.htm",
+        "aapl-20220924.xsd",
+        "image.jpg",
+        "document-0.txt",
+        "report.pdf",
+        "long.txt",
+    ]
+    assert documents[0].path.read_bytes() == (
+        b"<html><body>Annual report</body></html>\n<p>" + b"x" * 100 + b"</p>\n"
+    )
+    # Wrapper tags are dropped and binaries are uudecoded
+    assert documents[1].path.read_bytes() == b"<?xml version='1.0'?>\n<schema/>\n"
+    assert documents[2].path.read_bytes() == IMAGE
+    assert documents[4].path.read_bytes() == PDF
+    assert documents[5].path.read_bytes() == b"y" * 150 + b"\n"
+    assert sorted(p.name for p in folder.iterdir()) == sorted(
+        d.path.name for d in documents
+    )
+
+
+def test_split_submission_given_text_starting_with_begin(tmp_path):
+    text = b"begin of the letter to shareholders\nend\n"
+    submission = (
+        b"<DOCUMENT>\n"
+        b"<TYPE>EX-99\n"
+        b"<FILENAME>letter.txt\n"
+        b"<TEXT>\n" + text + b"</TEXT>\n"
+        b"</DOCUMENT>\n"
+    )
+
+    (document,) = split_submission(io.BytesIO(submission), tmp_path)
+
+    # Only a full uuencode header starts uuencoded data
+    assert not document.uuencoded
+    assert document.path.read_bytes() == text
+
+
+def test_split_submission_cleans_up_when_interrupted(tmp_path):
+    truncated = SUBMISSION[: SUBMISSION.index(b"<schema/>")]
+
+    documents = list(split_submission(io.BytesIO(truncated), tmp_path))
+    assert len(documents) == 1
+    # The partially extracted document is discarded
+    assert [p.name for p in tmp_path.iterdir()] == ["aapl-20220924.htm"]
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_extract_submission(tmp_path, compressed):
+    filing_folder = tmp_path / "AAPL" / "10-K" / "0000320193-22-000108"
+    filing_folder.mkdir(parents=True)
+    if compressed:
+        (filing_folder / "full-submission.txt.gz").write_bytes(
+            gzip.compress(SUBMISSION)
+        )
+    else:
+        (filing_folder / "full-submission.txt").write_bytes(SUBMISSION)
+
+    documents = extract_submission(filing_folder / "full-submission.txt")
+    assert (filing_folder / "image.jpg").read_bytes() == IMAGE
+    assert len(documents) == 6
+
+    documents = extract_submission(
+        filing_folder / "full-submission.txt", tmp_path / "documents"
+    )
+    assert documents[2].path == tmp_path / "documents" / "image.jpg"
+
+    if not compressed:
+        # Documents can be sliced from a memory map of the submission
+        with (
+            (filing_folder / "full-submission.txt").open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            assert m[documents[3].start : documents[3].end] == b"Exhibit\n"
@@ -0,0 +1,121 @@
+import io
+
+import pytest
+
+from sec_edgar_downloader import LocalStorage, MemoryStorage, ObjectStorage, PackStorage
+from sec_edgar_downloader._pack import open_pack
+from sec_edgar_downloader._storage import ChunkReader
+
+
+class LocalS3Client:
+    """Stand-in for the subset of a boto3 S3 client used by ObjectStorage."""
+
+    def __init__(self, page_size=1000):
+        self.buckets = {}
+        self.page_size = page_size
+
+    def upload_fileobj(self, fileobj, bucket, key):
+        # Uploads are read in parts, like multipart uploads of large objects
+        parts = list(iter(lambda: fileobj.read(4), b""))
+        self.buckets.setdefault(bucket, {})[key] = b"".join(parts)
+
+    def get_object(self, Bucket, Key):  # noqa: N803
+        return {"Body": io.BytesIO(self.buckets[Bucket][Key])}
+
+    def list_objects_v2(
+        self, Bucket, Prefix="", MaxKeys=None, ContinuationToken=None  # noqa: N803
+    ):
+        keys = sorted(k for k in self.buckets.get(Bucket, {}) if k.startswith(Prefix))
+        start = 0 if ContinuationToken is None else int(ContinuationToken)
+        page_size = min(self.page_size, MaxKeys or self.page_size)
+        page = keys[start : start + page_size]
+        resp = {"IsTruncated": start + page_size < len(keys)}
+        if page:
+            resp["Contents"] = [
+                {"Key": k, "Size": len(self.buckets[Bucket][k])} for k in page
+            ]
+        if resp["IsTruncated"]:
+            resp["NextContinuationToken"] = str(start + page_size)
+        return resp
+
+
+@pytest.fixture(params=["local", "pack", "memory", "object"])
+def storage(request, tmp_path):
+    if request.param == "local":
+        return LocalStorage(tmp_path / "sec-edgar-filings")
+    if request.param == "pack":
+        return PackStorage(tmp_path / "sec-edgar-filings")
+    if request.param == "memory":
+        return MemoryStorage()
+    return ObjectStorage(LocalS3Client(page_size=2), "bucket", "filings/")
+
+
+def test_storage(storage):
+    ten_k = "AAPL/10-K/0000320193-22-000108/full-submission.txt"
+    eight_k = "AAPL/8-K/0000320193-23-000005/full-submission.txt"
+    assert not storage.exists(ten_k)
+    assert storage.list() == []
+
+    assert storage.write_stream(ten_k, iter([b"sample ", b"file ", b"content"])) == 19
+    assert storage.write_stream(eight_k, [b"8-K"]) == 3
+    assert storage.write_stream("MSFT/10-K/acc/primary-document.html", [b""]) == 0
+
+    assert storage.exists(ten_k)
+    assert storage.size(ten_k) == 19
+    assert storage.size("MSFT/10-K/acc/primary-document.html") == 0
+    # Only whole keys exist, not their prefixes
+    assert not storage.exists(ten_k[:-1])
+    assert storage.size("AAPL/10-K/0000320193-22-000108") is None
+    with storage.open(ten_k) as f:
+        assert f.read() == b"sample file content"
+
+    assert storage.list() == [
+        ten_k,
+        eight_k,
+        "MSFT/10-K/acc/primary-document.html",
+    ]
+    assert storage.list("AAPL/1") == [ten_k]
+    assert storage.list("AAPL/10-K/") == [ten_k]
+    assert storage.list("GOOG/") == []
+
+
+def test_local_storage_layout(tmp_path):
+    root = tmp_path / "sec-edgar-filings"
+    storage = LocalStorage(root)
+    storage.write_stream("AAPL/10-K/acc/full-submission.txt", [b"filing"])
+    # Temporary files, the manifest and the job journal are not documents
+    (root / "AAPL" / "10-K" / "acc" / ".full-submission.txt.abc.part").touch()
+    (root / "manifest.sqlite3").touch()
+
+    assert (root / "AAPL/10-K/acc/full-submission.txt").read_bytes() == b"filing"
+    assert storage.list() == ["AAPL/10-K/acc/full-submission.txt"]
+
+
+def test_pack_storage_layout(tmp_path):
+    root = tmp_path / "sec-edgar-filings"
+    storage = PackStorage(root)
+    storage.write_stream("AAPL/10-K/acc_0/full-submission.txt", [b"filing 0"])
+    storage.write_stream("AAPL/10-K/acc_1/full-submission.txt", [b"filing 1"])
+
+    # Documents of a company and form share a pack, and no temporary file is left
+    assert sorted(p.name for p in (root / "AAPL").iterdir()) == ["10-K.pack"]
+    with open_pack(root / "AAPL" / "10-K.pack").open(
+        "acc_1", "full-submission.txt"
+    ) as f:
+        assert f.read() == b"filing 1"
+
+
+@pytest.mark.parametrize("storage", ["pack", "memory"], indirect=True)
+def test_storage_missing_document(storage):
+    with pytest.raises(FileNotFoundError):
+        storage.open("AAPL/10-K/acc/full-submission.txt")
+
+
+def test_chunk_reader():
+    reader = ChunkReader([b"", b"sample ", b"file content"])
+    assert reader.readable()
+    assert reader.read(3) == b"sam"
+    assert reader.read(100) == b"ple "
+    assert reader.read() == b"file content"
+    assert reader.read() == b""
+    assert reader.num_bytes == 19
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from sec_edgar_downloader._submissions_store import SubmissionsStore
+
+
+def test_submissions_store(tmp_path, apple_cik):
+    store = SubmissionsStore(tmp_path / "cache" / "submissions.sqlite3")
+
+    assert store.get_validators(apple_cik) == (None, None)
+    assert store.get_merged_pages(apple_cik) == set()
+    assert store.get_filings(apple_cik)["accessionNumber"] == []
+
+    with store.connect() as conn:
+        store.merge(
+            conn,
+            apple_cik,
+            {
+                "accessionNumber": ["0000320193-23-000002", "0000320193-23-000001"],
+                "filingDate": ["2023-02-01", "2023-01-01"],
+                "form": ["10-Q", "8-K"],
+            },
+        )
+        store.merge(
+            conn,
+            apple_cik,
+            {
+                "accessionNumber": ["0000320193-22-000001"],
+                "filingDate": ["2022-01-01"],
+                "form": ["10-K"],
+            },
+            "CIK0000320193-submissions-001.json",
+        )
+        # Merging a filing again replaces it rather than duplicating it
+        store.merge(
+            conn,
+            apple_cik,
+            {
+                "accessionNumber": ["0000320193-23-000002"],
+                "filingDate": ["2023-02-01"],
+                "form": ["10-Q"],
+                "size": [123],
+            },
+        )
+        store.set_validators(conn, apple_cik, '"v1"', None)
+        store.merge(
+            conn,
+            "0000789019",
+            {
+                "accessionNumber": ["0000789019-23-000001"],
+                "filingDate": ["2023-03-01"],
+                "form": ["10-K"],
+            },
+        )
+
+    # A new instance reads the persisted store
+    store = SubmissionsStore(tmp_path / "cache" / "submissions.sqlite3")
+    filings = store.get_filings(apple_cik)
+
+    assert store.get_validators(apple_cik) == ('"v1"', None)
+    assert store.get_merged_pages(apple_cik) == {"CIK0000320193-submissions-001.json"}
+    # Filings are returned newest first
+    assert filings["accessionNumber"] == [
+        "0000320193-23-000002",
+        "0000320193-23-000001",
+        "0000320193-22-000001",
+    ]
+    assert filings["form"] == ["10-Q", "8-K", "10-K"]
+    assert filings["size"] == [123, None, None]
+
+
+def test_submissions_store_ingest_archive(tmp_path, submissions_archive, apple_cik):
+    store = SubmissionsStore(tmp_path / "submissions.sqlite3")
+    with store.connect() as conn:
+        store.set_validators(conn, apple_cik, '"v1"', None)
+
+    # Commit in small batches to exercise intermediate commits
+    with patch("sec_edgar_downloader._submissions_store.ARCHIVE_COMMIT_INTERVAL", 1):
+        assert store.ingest_archive(submissions_archive) == 1
+
+    filings = store.get_filings(apple_cik)
+    assert len(filings["accessionNumber"]) == 1988
+    assert filings["accessionNumber"][0] == "0000320193-23-000079"
+    assert set(filings["accessionNumber"][-2:]) == {
+        "0000891618-94-000021",
+        "0000320193-94-000002",
+    }
+    assert store.has_company(apple_cik)
+    assert store.get_merged_pages(apple_cik) == {"CIK0000320193-submissions-001.json"}
+    # Validators of a previous refresh are kept
+    assert store.get_validators(apple_cik) == ('"v1"', None)
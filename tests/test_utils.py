@@ -1,15 +1,29 @@
+import sys
+from dataclasses import replace
 from datetime import date, datetime
 from pathlib import Path
 
 import pytest
 
-from sec_edgar_downloader._constants import DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE
 from sec_edgar_downloader._types import DownloadMetadata
 from sec_edgar_downloader._utils import (
     is_cik,
+    is_form_wildcard,
+    overlaps_requested_date_range,
+    resolve_download_folder,
+    summarize_num_downloaded,
     validate_and_convert_ticker_or_cik,
     validate_and_parse_date,
-    within_requested_date_range,
+    validate_and_parse_forms,
+    validate_and_parse_limit,
+    validate_and_parse_report_date_range,
+    validate_and_parse_values,
+    validate_compression,
+    validate_document_selection,
+    validate_layout,
+    validate_max_size,
+    validate_size_order,
+    validate_table_format,
 )
 
 
@@ -83,33 +97,171 @@ def test_validate_and_parse_date_given_invalid_type():
         validate_and_parse_date(2023_1_1)
 
 
-def test_within_requested_date_range_given_target_date_in_range(form_10k, apple_cik):
+@pytest.mark.parametrize(
+    "filing_from,filing_to,expected",
+    [
+        ("2021-06-01", "2022-06-01", True),
+        ("2022-06-01", "2022-07-01", True),
+        ("2021-01-01", "2024-01-01", True),
+        ("2022-12-31", "2023-01-01", True),
+        ("2020-01-01", "2021-12-31", False),
+        ("2023-01-02", "2024-01-01", False),
+        (None, None, True),
+        (None, "2021-12-31", False),
+    ],
+)
+def test_overlaps_requested_date_range(
+    form_10k, apple_cik, filing_from, filing_to, expected
+):
     download_metadata = DownloadMetadata(
         download_folder=Path("."),
         form=form_10k,
         cik=apple_cik,
-        limit=1,
-        after=DEFAULT_AFTER_DATE,
-        before=DEFAULT_BEFORE_DATE,
-        include_amends=True,
-        download_details=True,
+        after=date(2022, 1, 1),
+        before=date(2023, 1, 1),
     )
 
-    assert within_requested_date_range(download_metadata, "2022-1-1")
+    assert (
+        overlaps_requested_date_range(download_metadata, filing_from, filing_to)
+        is expected
+    )
 
 
-def test_within_requested_date_range_given_target_date_out_of_range(
-    form_10k, apple_cik
-):
+def test_validate_and_parse_limit():
+    assert validate_and_parse_limit(None) == sys.maxsize
+    assert validate_and_parse_limit("5") == 5
+
+    with pytest.raises(ValueError):
+        validate_and_parse_limit(0)
+
+
+def test_validate_compression():
+    validate_compression(None)
+    validate_compression("gzip")
+    validate_compression("zstd")
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_compression("bz2")
+    assert "Please enter one of: gzip, zstd" in str(exc_info.value)
+
+
+def test_validate_layout():
+    validate_layout("folders")
+    validate_layout("pack")
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_layout("zip")
+    assert "Please enter one of: folders, pack" in str(exc_info.value)
+
+
+def test_validate_and_parse_values():
+    assert validate_and_parse_values(None) == ()
+    assert validate_and_parse_values("EX-21") == ("EX-21",)
+    assert validate_and_parse_values(["EX-21", "EX-10*", "EX-21"]) == (
+        "EX-21",
+        "EX-10*",
+    )
+
+
+def test_validate_and_parse_report_date_range():
+    assert validate_and_parse_report_date_range(None, None) == (None, None)
+    assert validate_and_parse_report_date_range("2022-01-01", None) == (
+        date(2022, 1, 1),
+        None,
+    )
+    assert validate_and_parse_report_date_range(None, datetime(2022, 3, 31, 12)) == (
+        None,
+        date(2022, 3, 31),
+    )
+    assert validate_and_parse_report_date_range(date(2022, 1, 1), "2022-03-31") == (
+        date(2022, 1, 1),
+        date(2022, 3, 31),
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_and_parse_report_date_range("2022-03-31", "2022-01-01")
+    assert "Report after date cannot be greater" in str(exc_info.value)
+
+
+def test_validate_max_size():
+    validate_max_size(None, "document size")
+    validate_max_size(1, "document size")
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_max_size(0, "document size")
+    assert "Invalid maximum document size" in str(exc_info.value)
+
+
+def test_validate_size_order():
+    validate_size_order(None)
+    validate_size_order("smallest-first")
+    validate_size_order("largest-first")
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_size_order("newest-first")
+    assert "Please enter one of: smallest-first, largest-first" in str(exc_info.value)
+
+
+def test_validate_document_selection(tmp_path):
     download_metadata = DownloadMetadata(
-        download_folder=Path("."),
-        form=form_10k,
-        cik=apple_cik,
-        limit=1,
-        after=date(2022, 1, 1),
-        before=date(2023, 1, 1),
-        include_amends=True,
-        download_details=True,
+        tmp_path, "10-K", "0000320193", download_full_submission=False
+    )
+    validate_document_selection(replace(download_metadata, download_details=True))
+    validate_document_selection(replace(download_metadata, document_filename="*.xml"))
+    validate_document_selection(replace(download_metadata, max_document_size=1))
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_document_selection(download_metadata)
+    assert "Invalid document selection" in str(exc_info.value)
+
+
+def test_validate_table_format():
+    validate_table_format("dict")
+    validate_table_format("arrow")
+    validate_table_format("pandas")
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_table_format("csv")
+    assert "Please enter one of: dict, arrow, pandas" in str(exc_info.value)
+
+
+def test_is_form_wildcard():
+    assert is_form_wildcard("SC 13*")
+    assert is_form_wildcard("10-?")
+    assert is_form_wildcard("10-[KQ]")
+    assert not is_form_wildcard("10-K")
+
+
+def test_validate_and_parse_forms():
+    assert validate_and_parse_forms("10-K") == ("10-K",)
+    assert validate_and_parse_forms("SC 13*") == ("SC 13*",)
+    # Duplicates are dropped, but the requested order is kept
+    assert validate_and_parse_forms(["8-K", "10-K", "8-K", "SC 13*"]) == (
+        "8-K",
+        "10-K",
+        "SC 13*",
     )
 
-    assert not within_requested_date_range(download_metadata, "2020-1-1")
+    with pytest.raises(ValueError) as exc_info:
+        validate_and_parse_forms([])
+    assert "Invalid forms" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_and_parse_forms(["10-K", "10-INVALID"])
+    assert "'10-INVALID' forms are not supported" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_and_parse_forms("XYZ*")
+    assert "does not match any supported form" in str(exc_info.value)
+
+
+def test_summarize_num_downloaded():
+    assert summarize_num_downloaded("10-K", {"10-K": 3}) == 3
+    assert summarize_num_downloaded("SC 13*", {"SC 13G": 1}) == {"SC 13G": 1}
+    assert summarize_num_downloaded(["10-K"], {"10-K": 3}) == {"10-K": 3}
+
+
+def test_resolve_download_folder():
+    assert resolve_download_folder(None) == Path.cwd()
+    assert resolve_download_folder(Path("foo")) == Path("foo")
+    assert resolve_download_folder("~/foo") == Path.home() / "foo"